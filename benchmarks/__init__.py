@@ -0,0 +1,28 @@
+"""Benchmarks for the hikvision_axpro integration.
+
+Run from the repository root, e.g. ``python -m benchmarks.poll_fanout``.
+Integration modules are loaded by path so Home Assistant is not required.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+import sys
+from types import ModuleType
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def load_component(name: str) -> ModuleType:
+    """Import ``custom_components/hikvision_axpro/<name>.py`` standalone."""
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,209 @@
+"""Zone decode time: schema-compiled ``from_dict`` vs the former decoder.
+
+``legacy_zone_from_dict`` is the hand-written decoder the models used before
+the schema compiler: every optional field goes through ``from_union`` with a
+fresh converter list, and failed alternatives are rejected by ``assert``.
+The current ``Zone`` also leaves its cold list fields undecoded until they
+are read, which the entity platforms never do.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import logging
+import timeit
+
+from . import load_component
+
+model = load_component("model")
+from_bool = model.from_bool
+from_int = model.from_int
+from_list = model.from_list
+from_none = model.from_none
+from_str = model.from_str
+from_union = model.from_union
+AccessModuleType = model.AccessModuleType
+DetectorType = model.DetectorType
+InputList = model.InputList
+MagnetShockCurrentStatus = model.MagnetShockCurrentStatus
+Status = model.Status
+Zone = model.Zone
+ZoneAttrib = model.ZoneAttrib
+ZoneType = model.ZoneType
+
+_LOGGER = logging.getLogger(__name__)
+
+ZONE = {
+    "id": 0,
+    "name": "Front door",
+    "status": "online",
+    "sensorStatus": "normal",
+    "magnetOpenStatus": False,
+    "tamperEvident": False,
+    "shielded": False,
+    "bypassed": False,
+    "armed": False,
+    "isArming": False,
+    "alarm": False,
+    "charge": "normal",
+    "chargeValue": 100,
+    "signal": 121,
+    "realSignal": 135,
+    "signalType": "R3",
+    "temperature": 23,
+    "subSystemNo": 1,
+    "linkageSubSystem": [1],
+    "detectorType": "magneticContact",
+    "model": "0x00006",
+    "stayAway": False,
+    "zoneType": "Delay",
+    "InputList": [{"id": 1, "enabled": False, "mode": "normalClose"}],
+    "isViaRepeater": False,
+    "zoneAttrib": "wireless",
+    "version": "V1.0.0",
+    "deviceNo": 1,
+    "abnormalOrNot": False,
+    "isMasking": False,
+    "antiMaskingEnabled": True,
+    "healthStatus": "normal",
+    "associateRelayCfg": [],
+}
+
+
+def legacy_zone_from_dict(obj):
+    # Verbatim copy of the former Zone.from_dict.
+    assert isinstance(obj, dict)
+    id = from_int(obj.get("id"))
+    if obj.get("name") is None:
+        name = f"Zone ID {id}"
+    else:
+        name = from_str(obj.get("name"))
+    tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
+    shielded = from_union([from_bool, from_none], obj.get("shielded"))
+    bypassed = from_union([from_bool, from_none], obj.get("bypassed"))
+    armed = from_bool(obj.get("armed"))
+    is_arming = from_union([from_bool, from_none], obj.get("isArming"))
+    alarm = from_union([from_bool, from_none], obj.get("alarm"))
+    sub_system_no = from_union([from_int, from_none], obj.get("subSystemNo"))
+
+    try:
+        linkage_sub_system = from_union([lambda x: from_list(from_int, x), from_none], obj.get("linkageSubSystem"))
+    except Exception:
+        _LOGGER.warning("Invalid zone linkage_sub_system %s", obj.get("linkage_sub_system"))
+        _LOGGER.warning("Zone info: %s", obj)
+        linkage_sub_system = None
+
+    stay_away = from_union([from_bool, from_none], obj.get("stayAway"))
+    device_no = from_union([from_int, from_none], obj.get("deviceNo"))
+    abnormal_or_not = from_union([from_bool, from_none], obj.get("abnormalOrNot"))
+    charge = from_union([from_str, from_none], obj.get("charge"))
+    charge_value = from_union([from_int, from_none], obj.get("chargeValue"))
+    signal = from_union([from_int, from_none], obj.get("signal"))
+    temperature = from_union([from_int, from_none], obj.get("temperature"))
+    humidity = from_union([from_int, from_none], obj.get("humidity"))
+    model = from_union([from_str, from_none], obj.get("model"))
+    is_via_repeater = from_union([from_bool, from_none], obj.get("isViaRepeater"))
+    version = from_union([from_str, from_none], obj.get("version"))
+    magnet_open_status = from_union([from_bool, from_none], obj.get("magnetOpenStatus"))
+    input_list = from_union([lambda x: from_list(InputList.from_dict, x), from_none], obj.get("InputList"))
+    is_support_add_type = from_union([from_bool, from_none], obj.get("isSupportAddType"))
+    module_channel = from_union([from_int, from_none], obj.get("moduleChannel"))
+    sensor_status = from_union([from_str, from_none], obj.get("sensorStatus"))
+    real_signal = from_union([from_int, from_none], obj.get("realSignal"))
+    signal_type = from_union([from_str, from_none], obj.get("signalType"))
+    is_masking = from_union([from_bool, from_none], obj.get("isMasking"))
+    anti_masking_enabled = from_union([from_bool, from_none], obj.get("antiMaskingEnabled"))
+    mounting_type = from_union([from_str, from_none], obj.get("mountingType"))
+    module_type = from_union([from_str, from_none], obj.get("moduleType"))
+    related_access_module_id = from_union([from_int, from_none], obj.get("relatedAccessModuleID"))
+    water_detector_alarm = from_union([from_str, from_none], obj.get("waterDetectorAlarm"))
+    health_status = from_union([from_str, from_none], obj.get("healthStatus"))
+    work_mode = from_union([from_str, from_none], obj.get("workMode"))
+    polling_option_enable = from_union([from_bool, from_none], obj.get("pollingOptionEnable"))
+    associate_relay_cfg = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("associateRelayCfg"))
+
+    try:
+        status = Status(obj.get("status"))
+    except Exception:
+        _LOGGER.warning("Invalid status %s", obj.get("status"))
+        _LOGGER.warning("Detector info: %s", obj)
+        status = None
+    try:
+        detector_type = from_union([DetectorType, from_none], obj.get("detectorType"))
+    except Exception:
+        _LOGGER.warning("Invalid detector type %s", obj.get("detectorType"))
+        _LOGGER.warning("Detector info: %s", obj)
+        detector_type = None
+    try:
+        zone_type = from_union([ZoneType, from_none], obj.get("zoneType"))
+    except Exception:
+        _LOGGER.warning("Invalid zone type %s", obj.get("zoneType"))
+        _LOGGER.warning("Detector info: %s", obj)
+        zone_type = None
+    try:
+        zone_attrib = from_union([ZoneAttrib, from_none], obj.get("zoneAttrib"))
+    except Exception:
+        _LOGGER.warning("Invalid zone attrib %s", obj.get("zoneAttrib"))
+        _LOGGER.warning("Detector info: %s", obj)
+        zone_attrib = None
+    try:
+        access_module_type = from_union([AccessModuleType, from_none], obj.get("accessModuleType"))
+    except Exception:
+        _LOGGER.warning("Invalid accessModuleType %s", obj.get("accessModuleType"))
+        _LOGGER.warning("Detector info: %s", obj)
+        access_module_type = None
+    try:
+        magnet_shock_current_status = from_union([MagnetShockCurrentStatus.from_dict, from_none], obj.get("MagnetShockCurrentStatus"))
+    except Exception:
+        _LOGGER.warning("Invalid MagnetShockCurrentStatus %s", obj.get("MagnetShockCurrentStatus"))
+        _LOGGER.warning("Detector info: %s", obj)
+        magnet_shock_current_status = None
+
+    return Zone(id, name, status, tamper_evident, shielded, bypassed, armed, is_arming, alarm, sub_system_no,
+                linkage_sub_system, detector_type, stay_away, zone_type, zone_attrib, device_no, abnormal_or_not,
+                charge, charge_value, signal, temperature, humidity, model, is_via_repeater, version,
+                magnet_open_status, input_list, is_support_add_type, access_module_type, module_channel,
+                magnet_shock_current_status, sensor_status, real_signal, signal_type, is_masking,
+                anti_masking_enabled, mounting_type, module_type, related_access_module_id,
+                water_detector_alarm, health_status, work_mode, polling_option_enable, associate_relay_cfg)
+
+
+def _zones(count: int) -> list[dict]:
+    zones = []
+    for zone_id in range(count):
+        zone = copy.deepcopy(ZONE)
+        zone["id"] = zone_id
+        zones.append(zone)
+    return zones
+
+
+def main(count: int, repeat: int) -> None:
+    zones = _zones(count)
+    assert [legacy_zone_from_dict(z) for z in zones] == [
+        model.Zone.from_dict(z) for z in zones
+    ]
+    results = {}
+    for label, decode in (
+        ("legacy from_union", legacy_zone_from_dict),
+        ("schema-compiled", model.Zone.from_dict),
+    ):
+        best = min(
+            timeit.repeat(
+                lambda decode=decode: [decode(z) for z in zones],
+                number=repeat,
+                repeat=5,
+            )
+        )
+        results[label] = best / repeat
+        print(f"{label:<18} {results[label] * 1e3:.3f} ms per {count} zones")
+    speedup = results["legacy from_union"] / results["schema-compiled"]
+    print(f"speedup x{speedup:.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zones", type=int, default=64)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.zones, args.repeat)
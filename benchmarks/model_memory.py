@@ -0,0 +1,88 @@
+"""Memory of one decoded zone poll: plain, slotted and lazy zone models.
+
+A zone poll body is parsed and every zone decoded with three variants of
+``Zone`` built from the same schema: a plain dataclass with a per-instance
+``__dict__``, the same with ``slots=True``, and the integration's model, which
+is slotted and keeps the JSON of its cold list fields undecoded in their
+slots. tracemalloc reports what the decoded snapshot keeps alive
+(bytes per zone and memory blocks, i.e. objects the garbage collector has to
+track) and the peak while handling one poll.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import dataclasses
+import gc
+import json
+import tracemalloc
+
+from . import load_component
+from .model_decode import ZONE
+
+model = load_component("model")
+
+
+def _eager(cls: type, slots: bool) -> type:
+    """The same model and schema without lazy fields."""
+    plain = dataclasses.make_dataclass(
+        cls.__name__,
+        [
+            (f.name, f.type, dataclasses.field(default=f.default))
+            for f in dataclasses.fields(cls)
+            if f.init
+        ],
+        slots=slots,
+    )
+    specs = [dataclasses.replace(spec, lazy=False) for spec in cls.__schema__]
+    return model.schema(*specs)(plain)
+
+
+def _measure(decode, body: bytes) -> tuple[int, int, int]:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        decoded = [decode(zone) for zone in json.loads(body)["ZoneList"]]
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    stats = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "filename"
+    )
+    size = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    del decoded
+    return size, blocks, peak
+
+
+def main(counts: list[int]) -> None:
+    variants = (
+        ("dict", _eager(model.Zone, slots=False).from_dict),
+        ("slots", _eager(model.Zone, slots=True).from_dict),
+        ("lazy", model.Zone.from_dict),
+    )
+    print(f"{'zones':>5} {'model':<6} {'bytes/zone':>10} {'blocks':>7} {'peak':>9}")
+    for count in counts:
+        zones = []
+        for zone_id in range(count):
+            zone = copy.deepcopy(ZONE)
+            zone["id"] = zone_id
+            zones.append(zone)
+        body = json.dumps({"ZoneList": zones}).encode()
+        for label, decode in variants:
+            size, blocks, peak = _measure(decode, body)
+            print(
+                f"{count:>5} {label:<6} {size / count:>10.0f} {blocks:>7} "
+                f"{peak / 1024:>7.1f}kB"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--zones", type=int, nargs="+", default=[16, 64, 256])
+    main(parser.parse_args().zones)
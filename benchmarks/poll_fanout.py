@@ -0,0 +1,83 @@
+"""Poll-cycle wall clock: sequential requests vs concurrent fan-out.
+
+A local fake panel serves the six poll endpoints with injected per-endpoint
+latency. ``max_concurrency=1`` reproduces the old one-after-another chain; the
+other caps show the fan-out, whose latency approaches the slowest endpoint.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+import hikaxpro
+
+from tests.fake_panel import FakePanel
+
+from . import load_component
+
+isapi = load_component("isapi")
+poll = load_component("poll")
+
+LATENCY = {
+    poll.POLL_SUBSYSTEMS.path: 0.06,
+    poll.POLL_ZONES.path: 0.15,
+    poll.POLL_EX_DEV_STATUS.path: 0.25,
+    poll.POLL_HOST_STATUS.path: 0.08,
+    poll.POLL_AC_POWER.path: 0.05,
+    poll.POLL_BATTERIES.path: 0.05,
+}
+
+
+def _routes() -> dict:
+    return {
+        ("GET", request.path): {"ok": request.key} for request in poll.POLL_REQUESTS
+    }
+
+
+async def _measure(panel: FakePanel, max_concurrency: int, cycles: int) -> list[float]:
+    axpro = hikaxpro.HikAxPro(
+        panel.host, "admin", "secret", user_level=hikaxpro.USER_LEVEL_ADMIN_OPERATOR
+    )
+    client = isapi.IsapiClient(
+        aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar()),
+        axpro,
+        max_concurrency,
+    )
+    try:
+        await client.async_login()
+        samples = []
+        for _ in range(cycles):
+            start = time.perf_counter()
+            await poll.async_fetch_all(client)
+            samples.append(time.perf_counter() - start)
+        return samples
+    finally:
+        await client.async_close()
+
+
+async def main(cycles: int) -> None:
+    panel = await FakePanel(_routes(), LATENCY).start()
+    try:
+        print(
+            f"per-endpoint latency sum={sum(LATENCY.values()):.3f}s "
+            f"max={max(LATENCY.values()):.3f}s, {cycles} cycles"
+        )
+        for cap in (1, 2, 3, 6):
+            samples = await _measure(panel, cap, cycles)
+            label = "sequential" if cap == 1 else f"concurrent cap={cap}"
+            print(
+                f"{label:<20} mean={statistics.mean(samples):.3f}s "
+                f"p95={sorted(samples)[int(len(samples) * 0.95) - 1]:.3f}s"
+            )
+    finally:
+        await panel.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cycles", type=int, default=10)
+    asyncio.run(main(parser.parse_args().cycles))
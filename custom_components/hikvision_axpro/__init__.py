@@ -2,12 +2,15 @@
 
 import asyncio
 from asyncio import timeout
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 import contextlib
-from datetime import timedelta
+from datetime import datetime, timedelta
 import logging
+from typing import Any
 
+import aiohttp
 import hikaxpro
-import xmltodict
+import voluptuous as vol
 
 from homeassistant.components.alarm_control_panel import (
     SCAN_INTERVAL,
@@ -27,42 +30,128 @@ from homeassistant.const import (
     SERVICE_RELOAD,
     Platform,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
 from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+import homeassistant.helpers.config_validation as cv
 import homeassistant.helpers.device_registry as dr
 import homeassistant.helpers.entity_registry as er
 from homeassistant.helpers.service import async_register_admin_service
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+import homeassistant.util.dt as dt_util
 
 from .const import (
     ALLOW_SUBSYSTEMS,
     AUTO_BYPASS_ON_ARM,
+    CAPABILITIES_SAVE_DELAY,
+    CAPABILITIES_STORAGE_VERSION,
     DATA_COORDINATOR,
+    DEFAULT_DIAGNOSTICS_SCAN_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_PERIPHERAL_SCAN_INTERVAL,
+    DEFAULT_RECONCILE_SCAN_INTERVAL,
+    DEFAULT_STALE_AFTER,
+    DIAGNOSTICS_SCAN_INTERVAL,
     DOMAIN,
+    ENABLE_ALERT_STREAM,
     ENABLE_DEBUG_OUTPUT,
+    MAX_CONCURRENT_REQUESTS,
+    PERIPHERAL_SCAN_INTERVAL,
+    RECONCILE_SCAN_INTERVAL,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    STALE_AFTER,
     USE_CODE_ARMING,
 )
+from .alert_stream import (
+    ACTION_ALARM,
+    ACTION_ALARM_RESTORE,
+    ACTION_ARM_AWAY,
+    ACTION_ARM_HOME,
+    ACTION_BYPASS,
+    ACTION_BYPASS_RESTORE,
+    ACTION_DISARM,
+    AlertEvent,
+    AlertStreamListener,
+)
+from .capabilities import CapabilityRegistry, siren_control_key
+from .delta import (
+    KIND_EXTENSION,
+    KIND_KEYPAD,
+    KIND_RELAY,
+    KIND_REPEATER,
+    KIND_SIREN,
+    KIND_SUB_SYSTEM,
+    KIND_ZONE,
+    ChangeSet,
+    DeviceContext,
+    ListenerIndex,
+    diff_devices,
+    merge_changes,
+)
 from .entity_id import migrate_invalid_entity_ids
+from .isapi import PRIORITY_COMMAND, IsapiClient, json_loads
 from .model import (
     Arming,
-    ExDevStatusResponse,
+    DecodeError,
+    DeviceInfo,
     ExtensionModule,
+    InstanceCache,
     JSONResponseStatus,
     Keypad,
     OutputConfList,
     OutputStatusFull,
-    RelayStatusSearchResponse,
+    RelayStatus,
+    RelayStatusList,
     RelaySwitchConf,
     Repeater,
     Siren,
-    Status,
     SubSys,
     SubSystemResponse,
     Zone,
     ZoneConfig,
+    ZoneListWrap,
     ZonesConf,
     ZonesResponse,
+    list_items,
+    parse_diagnostics,
 )
+from .optimistic import CONFIRM_DELAY, Expectation, OptimisticLedger
+from .poll import (
+    POLL_AC_POWER,
+    POLL_BATTERIES,
+    POLL_EX_DEV_STATUS,
+    POLL_HOST_STATUS,
+    POLL_REQUESTS,
+    POLL_SUBSYSTEMS,
+    POLL_ZONES,
+    TIER_MEDIUM,
+    TIER_SLOW,
+    PollScheduler,
+    ResponseCache,
+    SingleFlight,
+    async_fetch_all,
+    async_fetch_partial,
+    requests_for_tiers,
+)
+from .snapshot import WarmSnapshot
+from .telemetry import TelemetryStore
+from .zone_flags import (
+    FLAG_ALARM,
+    FLAG_BYPASSED,
+    FLAG_OPEN,
+    FLAG_TRIGGERED,
+    ZoneFlags,
+)
+
 
 PLATFORMS: list[Platform] = [
     Platform.ALARM_CONTROL_PANEL,
@@ -73,6 +162,45 @@ PLATFORMS: list[Platform] = [
 _LOGGER = logging.getLogger(__name__)
 
 
+_DIAGNOSTICS_KEYS = {POLL_HOST_STATUS.key, POLL_AC_POWER.key, POLL_BATTERIES.key}
+_KIND_POLL_KEYS = {
+    KIND_SUB_SYSTEM: POLL_SUBSYSTEMS.key,
+    KIND_ZONE: POLL_ZONES.key,
+    KIND_RELAY: POLL_EX_DEV_STATUS.key,
+    KIND_SIREN: POLL_EX_DEV_STATUS.key,
+    KIND_KEYPAD: POLL_EX_DEV_STATUS.key,
+    KIND_REPEATER: POLL_EX_DEV_STATUS.key,
+    KIND_EXTENSION: POLL_EX_DEV_STATUS.key,
+}
+""" Poll section reporting each device kind """
+_NOT_READY_ERRORS = (
+    TimeoutError,
+    ConnectionError,
+    hikaxpro.errors.UnexpectedResponseCodeError,
+    hikaxpro.errors.IncorrectResponseContentError,
+)
+""" Panel errors that make the setup retry later """
+_UPDATE_ERRORS = (*_NOT_READY_ERRORS, ValueError)
+""" Errors failing a refresh; ``ValueError`` covers ``DecodeError`` and bad JSON """
+_BYPASS_ZONES_SCHEMA = vol.Schema(
+    {
+        vol.Required("zone_ids"): vol.All(cv.ensure_list_csv, [vol.Coerce(int)]),
+        vol.Optional("config_entry_id"): cv.string,
+    }
+)
+
+
+def _loads(content: bytes | None):
+    return None if content is None else json_loads(content)
+
+
+def _switch_expectation(kind: str, device_id: int, is_on: bool) -> Expectation:
+    """Relays and sirens report ``status`` "on" / "off" in exDevStatus."""
+    return Expectation(
+        kind, device_id, "status", "on" if is_on else "off", POLL_EX_DEV_STATUS.key
+    )
+
+
 def _filter_enabled(n: SubSys) -> bool:
     return n.enabled
 
@@ -154,6 +282,23 @@ async def async_setup(hass: HomeAssistant, config: ConfigEntry):
         coordinator = _coordinator_for_service(hass, call)
         await coordinator.async_recover_bypass_zone(zone_id)
 
+    def _service_bypass_zones(bypass: bool):
+        async def handler(call: ServiceCall) -> ServiceResponse:
+            coordinator = _coordinator_for_service(hass, call)
+            errors = await coordinator.async_bypass_zones(call.data["zone_ids"], bypass)
+            return {
+                "zones": [
+                    {
+                        "zone_id": zone_id,
+                        "success": error is None,
+                        "error": None if error is None else str(error),
+                    }
+                    for zone_id, error in errors.items()
+                ]
+            }
+
+        return handler
+
     async def _service_arm_away_with_bypass(call):
         coordinator = _coordinator_for_service(hass, call)
         sub_id = call.data.get("sub_id")
@@ -168,6 +313,20 @@ async def async_setup(hass: HomeAssistant, config: ConfigEntry):
     hass.services.async_register(
         DOMAIN, "recover_bypass_zone", _service_recover_bypass_zone
     )
+    hass.services.async_register(
+        DOMAIN,
+        "bypass_zones",
+        _service_bypass_zones(True),
+        schema=_BYPASS_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        "recover_bypass_zones",
+        _service_bypass_zones(False),
+        schema=_BYPASS_ZONES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     hass.services.async_register(
         DOMAIN, "arm_away_with_bypass", _service_arm_away_with_bypass
     )
@@ -222,16 +381,48 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if entry.data.get(ENABLE_DEBUG_OUTPUT):
         with contextlib.suppress(Exception):
             axpro.set_logging_level(logging.DEBUG)
+    # A reload logs every tolerated invalid value once again.
+    parse_diagnostics.reset()
+
+    isapi = IsapiClient(
+        async_create_clientsession(hass, cookie_jar=aiohttp.DummyCookieJar()),
+        axpro,
+        entry.data.get(MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS),
+    )
+
+    snapshot_store = _entry_store(hass, entry, "snapshot", SNAPSHOT_STORAGE_VERSION)
+    snapshot = WarmSnapshot.from_dict(await snapshot_store.async_load())
+    if snapshot is not None and snapshot.host != host:
+        # The host was changed in the options: it may be another panel.
+        _LOGGER.info("Ignoring warm-start snapshot of %s", snapshot.host)
+        snapshot = None
+    if snapshot is not None:
+        mac = snapshot.mac
+    else:
+        try:
+            async with timeout(10):
+                mac = await isapi.async_get_interface_mac_address(1)
+        except _NOT_READY_ERRORS as ex:
+            await isapi.async_close()
+            raise ConfigEntryNotReady from ex
+        except BaseException:
+            await isapi.async_close()
+            raise
 
-    try:
-        async with timeout(10):
-            mac = await hass.async_add_executor_job(axpro.get_interface_mac_address, 1)
-    except (TimeoutError, ConnectionError) as ex:
-        raise ConfigEntryNotReady from ex
+    capabilities_store = _entry_store(
+        hass, entry, "capabilities", CAPABILITIES_STORAGE_VERSION
+    )
+    capabilities = CapabilityRegistry.from_dict(
+        await capabilities_store.async_load()
+    )
+    capabilities.on_change = lambda: capabilities_store.async_delay_save(
+        capabilities.as_dict, CAPABILITIES_SAVE_DELAY
+    )
 
     coordinator = HikAxProDataUpdateCoordinator(
         hass,
         axpro,
+        isapi,
         mac,
         use_code,
         code_format,
@@ -240,12 +431,32 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         update_interval,
         use_sub_systems,
         auto_bypass_on_arm=auto_bypass_on_arm,
+        peripheral_update_interval=entry.data.get(
+            PERIPHERAL_SCAN_INTERVAL, DEFAULT_PERIPHERAL_SCAN_INTERVAL
+        ),
+        diagnostics_update_interval=entry.data.get(
+            DIAGNOSTICS_SCAN_INTERVAL, DEFAULT_DIAGNOSTICS_SCAN_INTERVAL
+        ),
+        reconcile_update_interval=entry.data.get(
+            RECONCILE_SCAN_INTERVAL, DEFAULT_RECONCILE_SCAN_INTERVAL
+        ),
+        stale_after=entry.data.get(STALE_AFTER, DEFAULT_STALE_AFTER),
+        capabilities=capabilities,
+        snapshot_store=snapshot_store,
     )
-    try:
-        async with timeout(10):
-            await hass.async_add_executor_job(coordinator.init_device)
-    except (TimeoutError, ConnectionError) as ex:
-        raise ConfigEntryNotReady from ex
+    if snapshot is not None:
+        # Entities come up from the stored snapshot; the panel is asked later.
+        coordinator.restore_snapshot(snapshot)
+    else:
+        try:
+            async with timeout(10):
+                await coordinator.async_init_device()
+        except _NOT_READY_ERRORS as ex:
+            await isapi.async_close()
+            raise ConfigEntryNotReady from ex
+        except BaseException:
+            await isapi.async_close()
+            raise
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = {DATA_COORDINATOR: coordinator}
 
@@ -253,17 +464,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    if snapshot is not None:
+        # Confirm the restored state at once; the inventory check may retry
+        # for minutes while the panel is unreachable.
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN} refresh {coordinator.host}"
+        )
+        entry.async_create_background_task(
+            hass,
+            coordinator.async_revalidate(entry),
+            f"{DOMAIN} revalidate {coordinator.host}",
+        )
+
+    if entry.data.get(ENABLE_ALERT_STREAM, False):
+        coordinator.async_start_alert_stream(entry)
+
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = data[DATA_COORDINATOR]
+        await coordinator.async_stop_alert_stream()
+        coordinator.refresh_flight.cancel()
+        coordinator.async_cancel_confirmation()
+        await coordinator.isapi.async_close()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop the stored capabilities and warm-start snapshot of a removed entry."""
+    await _entry_store(
+        hass, entry, "capabilities", CAPABILITIES_STORAGE_VERSION
+    ).async_remove()
+    await _entry_store(hass, entry, "snapshot", SNAPSHOT_STORAGE_VERSION).async_remove()
+
+
+def _entry_store(
+    hass: HomeAssistant, entry: ConfigEntry, name: str, version: int
+) -> Store:
+    return Store(hass, version, f"{DOMAIN}.{entry.entry_id}.{name}")
+
+
 async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry):
     """Update listener."""
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -273,9 +518,10 @@ class HikAxProDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching ax pro data."""
 
     axpro: hikaxpro.HikAxPro
+    isapi: IsapiClient
     zone_status: ZonesResponse | None
     zones: dict[int, Zone] | None = None
-    device_info: dict | None = None
+    device_info: DeviceInfo | None = None
     device_model: str | None = None
     device_name: str | None = None
     sub_systems: dict[int, SubSys] = {}
@@ -290,14 +536,44 @@ class HikAxProDataUpdateCoordinator(DataUpdateCoordinator):
     host_status: dict | None = None
     ac_power_status: dict | None = None
     hub_batteries: list[dict] = []
-    siren_control_supported: dict[int, bool] = {}
+    capabilities: CapabilityRegistry
+    """ Optional endpoints known to be unsupported are not requested """
+    optimistic: OptimisticLedger
+    """ Command results shown before the panel confirmed them """
+    instance_caches: dict[str, InstanceCache]
+    """ Unchanged zones and peripherals keep their instance across polls """
+    zone_flags: ZoneFlags
+    """ Boolean zone state as bitsets, for whole-panel queries """
+    telemetry: TelemetryStore
+    """ Temperature, humidity, signal and battery columns of all devices """
+    snapshot_store: Store | None
+    """ Warm-start snapshot, saved (delayed) whenever the inventory or state changes """
     use_sub_systems: bool
     auto_bypass_on_arm: bool
+    scheduler: PollScheduler
+    tier_updated: dict[str, datetime] = {}
+    """ Last successful update per poll tier """
+    section_updated: dict[str, datetime] = {}
+    """ When the last good body of each poll key arrived """
+    section_failing: dict[str, datetime] = {}
+    """ First failure per poll key since its last good body """
+    section_restored: set[str] = set()
+    """ Poll keys shown from the warm-start snapshot, not yet confirmed live """
+    stale_after: timedelta
+    """ How long a failing section's values are still shown as available """
+    alert_stream: AlertStreamListener | None = None
+    refresh_flight: SingleFlight[tuple]
+    """ Coalesces refreshes; ``coalesced`` counts fetches saved """
+    response_cache: ResponseCache
+    """ Bodies identical to the last applied one are not decoded again """
+    listener_index: ListenerIndex
+    """ Device listeners are only called when their fields changed """
 
     def __init__(
         self,
         hass: HomeAssistant,
         axpro: hikaxpro.HikAxPro,
+        isapi: IsapiClient,
         mac,
         use_code,
         code_format,
@@ -306,9 +582,16 @@ class HikAxProDataUpdateCoordinator(DataUpdateCoordinator):
         update_interval: float,
         use_sub_systems=False,
         auto_bypass_on_arm=False,
+        peripheral_update_interval: float = DEFAULT_PERIPHERAL_SCAN_INTERVAL,
+        diagnostics_update_interval: float = DEFAULT_DIAGNOSTICS_SCAN_INTERVAL,
+        reconcile_update_interval: float = DEFAULT_RECONCILE_SCAN_INTERVAL,
+        stale_after: float = DEFAULT_STALE_AFTER,
+        capabilities: CapabilityRegistry | None = None,
+        snapshot_store: Store | None = None,
     ) -> None:
         """Initialize global data updater and AXPro API."""
         self.axpro = axpro
+        self.isapi = isapi
         self.state = None
         self.zone_status = None
         self.host = axpro.host
@@ -326,157 +609,409 @@ class HikAxProDataUpdateCoordinator(DataUpdateCoordinator):
         self.host_status = None
         self.ac_power_status = None
         self.hub_batteries = []
-        self.siren_control_supported = {}
+        self.capabilities = capabilities or CapabilityRegistry()
+        self.snapshot_store = snapshot_store
+        self._zones_conf_json = None
+        self._relays_conf_json = None
+        self._last_payloads: dict[str, bytes | None] = {}
+        self.optimistic = OptimisticLedger()
+        self.instance_caches = {
+            KIND_ZONE: InstanceCache(Zone),
+            KIND_RELAY: InstanceCache(OutputStatusFull),
+            KIND_SIREN: InstanceCache(Siren),
+            KIND_KEYPAD: InstanceCache(Keypad),
+            KIND_REPEATER: InstanceCache(Repeater),
+            KIND_EXTENSION: InstanceCache(ExtensionModule),
+        }
+        self.zone_flags = ZoneFlags()
+        self.telemetry = TelemetryStore()
+        self._confirm_keys: set[str] = set()
+        self._confirm_task: asyncio.Task | None = None
+        self._alert_stream_task: asyncio.Task | None = None
+        self.scheduler = PollScheduler(
+            {
+                TIER_MEDIUM: peripheral_update_interval,
+                TIER_SLOW: diagnostics_update_interval,
+            }
+        )
+        self.tier_updated = {}
+        self.section_updated = {}
+        self.section_failing = {}
+        self.section_restored = set()
+        self.stale_after = timedelta(seconds=stale_after)
+        self._listeners_saw_sections: tuple[frozenset, frozenset] = (
+            frozenset(),
+            frozenset(),
+        )
+        self.alert_stream = None
+        self.refresh_flight = SingleFlight(self._async_poll)
+        self.response_cache = ResponseCache()
+        self.listener_index = ListenerIndex()
+        self._pending_changes: ChangeSet = {}
+        self._listeners_saw_success = True
+        self.scan_interval = timedelta(seconds=update_interval)
+        self.reconcile_interval = timedelta(seconds=reconcile_update_interval)
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval),
+            always_update=False,
         )
 
-    def _get_device_info(self):
-        endpoint = self.axpro.build_url(
-            f"http://{self.host}" + hikaxpro.consts.Endpoints.SystemDeviceInfo, False
+    async def _async_get_device_info(self) -> DeviceInfo:
+        return DeviceInfo.from_dict(await self.isapi.async_get_device_info())
+
+    async def async_init_device(self):
+        """Init device information."""
+        await self._async_load_inventory()
+        # Every tier is due on the first poll.
+        await self.refresh_flight()
+        # No entity exists yet; they render the snapshot when added.
+        self._pending_changes = {}
+        self._schedule_snapshot_save()
+
+    async def _async_load_inventory(self) -> None:
+        self._apply_device_info(await self._async_get_device_info())
+        await self.async_load_devices()
+        await self.async_load_relays()
+
+    def _apply_device_info(self, device_info: DeviceInfo) -> None:
+        self.device_info = device_info
+        self.device_name = device_info.device_name
+        self.device_model = device_info.model
+        _LOGGER.debug(device_info)
+
+    def restore_snapshot(self, snapshot: WarmSnapshot) -> None:
+        """Apply a warm-start snapshot as if it had just been polled.
+
+        The restored sections are not live: their entities are unavailable
+        (showing the snapshot time and age) until a poll confirms them.
+        """
+        _LOGGER.debug("Restoring snapshot saved at %s", snapshot.saved_at)
+        self._apply_device_info(
+            DeviceInfo.from_dict(snapshot.device_info["DeviceInfo"])
+        )
+        self._apply_zones_conf(snapshot.zones_conf)
+        self._apply_relays_conf(snapshot.relays_conf)
+        self._apply_payloads(snapshot.payloads)
+        saved_at = dt_util.utc_from_timestamp(snapshot.saved_at)
+        for key, payload in snapshot.payloads.items():
+            if payload is not None:
+                self.section_updated[key] = saved_at
+                self.section_failing[key] = saved_at
+                self.section_restored.add(key)
+        self._pending_changes = {}
+        # Every tier is still due, so the first live poll fetches everything.
+        self.data = self.response_cache.snapshot()
+
+    def _inventory(self) -> tuple:
+        """What entities are created from; a change needs an entry reload."""
+        return (
+            self.mac,
+            self.device_info,
+            self._zones_conf_json,
+            self._relays_conf_json,
+            frozenset(self.zones or {}),
+            frozenset(self.sub_systems),
+            frozenset(self.relays_status),
+            frozenset(self.sirens),
+            frozenset(self.keypads),
+            frozenset(self.repeaters),
+            frozenset(self.extensions),
         )
-        response = self.axpro.make_request(endpoint, "GET", None, True)
 
-        if response.status_code != 200:
-            raise hikaxpro.errors.UnexpectedResponseCodeError(
-                response.status_code, response.text
+    async def async_revalidate(self, entry: ConfigEntry) -> None:
+        """Refresh a restored snapshot from the panel, retrying until it answers.
+
+        Reloads the entry when the panel no longer matches the snapshot (other
+        device, zones or peripherals added or removed), so entities follow.
+        """
+        inventory = self._inventory()
+        delay = self.scan_interval.total_seconds()
+        while True:
+            try:
+                async with timeout(10):
+                    self.mac = (
+                        await self.isapi.async_get_interface_mac_address(1)
+                        or self.mac
+                    )
+                    await self._async_load_inventory()
+                break
+            except _NOT_READY_ERRORS as err:
+                _LOGGER.debug("Revalidation failed, retry in %ss: %s", delay, err)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 300)
+        await self.async_refresh()
+        if not self.last_update_success:
+            return
+        if self._inventory() != inventory:
+            _LOGGER.info("Panel inventory changed since last start, reloading")
+            if self.snapshot_store is not None:
+                await self.snapshot_store.async_save(self._snapshot_data())
+            await self.hass.config_entries.async_reload(entry.entry_id)
+            return
+        self._schedule_snapshot_save()
+
+    def _snapshot_data(self) -> dict:
+        return WarmSnapshot(
+            host=self.host,
+            mac=self.mac,
+            device_info={"DeviceInfo": self.device_info.to_dict()},
+            zones_conf=self._zones_conf_json,
+            relays_conf=self._relays_conf_json,
+            payloads=dict(self._last_payloads),
+        ).as_dict()
+
+    def _schedule_snapshot_save(self) -> None:
+        if self.snapshot_store is not None and self.device_info is not None:
+            self.snapshot_store.async_delay_save(
+                self._snapshot_data, SNAPSHOT_SAVE_DELAY
             )
-        _LOGGER.debug(response.text)
-        return xmltodict.parse(response.text)
 
-    def init_device(self):
-        """Init device information."""
-        self.device_info = self._get_device_info()
-        self.device_name = self.device_info["DeviceInfo"]["deviceName"]
-        self.device_model = self.device_info["DeviceInfo"]["model"]
-        _LOGGER.debug(self.device_info)
-        self.load_devices()
-        self.load_relays()
-        self._update_data()
-
-    def load_relays(self):
+    async def async_load_relays(self):
         """Load relays."""
-        devices = self._load_relays()
+        self._apply_relays_conf(
+            await self.isapi.async_request_json(
+                hikaxpro.consts.Endpoints.OutputConfig
+            )
+        )
+
+    def _apply_relays_conf(self, relays_conf_json) -> None:
+        _LOGGER.debug(relays_conf_json)
+        self._relays_conf_json = relays_conf_json
+        devices = OutputConfList.from_dict(relays_conf_json)
         if devices is not None:
             self.relays = {}
             for item in devices.list:
                 self.relays[item.output.id] = item.output
 
-    def _load_relays(self) -> OutputConfList:
-        endpoint = self.axpro.build_url(
-            f"http://{self.host}" + hikaxpro.consts.Endpoints.OutputConfig, True
-        )
-        response = self.axpro.make_request(endpoint, "GET", None, True)
-
-        if response.status_code != 200:
-            raise hikaxpro.errors.UnexpectedResponseCodeError(
-                response.status_code, response.text
-            )
-        _LOGGER.debug(response.text)
-        return OutputConfList.from_dict(response.json())
-
-    def load_ext_devices_status(self):
+    async def async_load_ext_devices_status(self):
         """Load status of external devices."""
-        statuses = self._load_ext_devices_status()
-        if statuses is not None:
-            self.relays_status = {}
-            self.sirens = {}
-            self.keypads = {}
-            self.repeaters = {}
-            self.extensions = {}
-            if statuses.ex_dev_status is not None:
-                if statuses.ex_dev_status.output_list is not None:
-                    for item in statuses.ex_dev_status.output_list:
-                        if item.output is not None and item.output.id is not None:
-                            self.relays_status[item.output.id] = item.output
-                if statuses.ex_dev_status.siren_list is not None:
-                    for item in statuses.ex_dev_status.siren_list:
-                        if item.siren is not None and item.siren.id is not None:
-                            self.sirens[item.siren.id] = item.siren
-                if statuses.ex_dev_status.keypad_list is not None:
-                    for item in statuses.ex_dev_status.keypad_list:
-                        if item.keypad is not None and item.keypad.id is not None:
-                            self.keypads[item.keypad.id] = item.keypad
-                if statuses.ex_dev_status.repeater_list is not None:
-                    for item in statuses.ex_dev_status.repeater_list:
-                        if item.repeater is not None and item.repeater.id is not None:
-                            self.repeaters[item.repeater.id] = item.repeater
-                if statuses.ex_dev_status.extension_list is not None:
-                    for item in statuses.ex_dev_status.extension_list:
-                        if (
-                            item.extension_module is not None
-                            and item.extension_module.id is not None
-                        ):
-                            self.extensions[item.extension_module.id] = (
-                                item.extension_module
-                            )
-
-    def _load_ext_devices_status(self) -> ExDevStatusResponse:
-        endpoint = self.axpro.build_url(
-            f"http://{self.host}" + "/ISAPI/SecurityCP/status/exDevStatus", True
-        )
-        response = self.axpro.make_request(endpoint, "GET", None, True)
-
-        if response.status_code != 200:
-            raise hikaxpro.errors.UnexpectedResponseCodeError(
-                response.status_code, response.text
-            )
-        _LOGGER.debug(response.text)
-        return ExDevStatusResponse.from_dict(response.json())
+        self._apply_ex_dev_status(
+            await self.isapi.async_request_json(POLL_EX_DEV_STATUS.path)
+        )
 
-    def load_devices(self):
+    async def async_load_devices(self):
         """Load devices from Zone Config."""
-        devices = self._load_devices()
+        self._apply_zones_conf(
+            await self.isapi.async_request_json(hikaxpro.consts.Endpoints.ZonesConfig)
+        )
+
+    def _apply_zones_conf(self, zones_conf_json) -> None:
+        _LOGGER.debug(zones_conf_json)
+        self._zones_conf_json = zones_conf_json
+        devices = ZonesConf.from_dict(zones_conf_json)
         if devices is not None:
             self.devices = {}
             for item in devices.list:
                 self.devices[item.zone.id] = item.zone
 
-    def _load_devices(self) -> ZonesConf:
-        endpoint = self.axpro.build_url(
-            f"http://{self.host}" + hikaxpro.consts.Endpoints.ZonesConfig, True
+    async def async_iter_relay_status(
+        self, relay_ids: Iterable[int] | None = None
+    ) -> AsyncIterator[RelayStatus]:
+        """Local wired outputs from the paged ``OutputStatus`` search.
+
+        With ``relay_ids`` only those are yielded and the search stops as soon
+        as all of them were seen.
+        """
+        wanted = None if relay_ids is None else set(relay_ids)
+        if wanted is not None and not wanted:
+            return
+        async with contextlib.aclosing(
+            self.isapi.async_search(
+                hikaxpro.consts.Endpoints.OutputStatus,
+                "OutputCond",
+                "OutputSearch",
+                "OutputList",
+                {"moduleType": "localWired"},
+            )
+        ) as entries:
+            async for entry in entries:
+                relay = RelayStatusList.from_dict(entry).output
+                if relay is None:
+                    continue
+                if wanted is None:
+                    yield relay
+                elif relay.id in wanted:
+                    yield relay
+                    wanted.discard(relay.id)
+                    if not wanted:
+                        return
+
+    async def _async_poll(
+        self, tiers: Iterable[str] | None = None
+    ) -> tuple[tuple[str, bytes | None], ...]:
+        """Fetch the due poll tiers concurrently, then apply them as one snapshot.
+
+        Each request has its own deadline; the snapshot is assembled from the
+        requests that completed, and sections whose request failed keep their
+        last good values (their entities go unavailable once they have been
+        failing for ``stale_after``). The poll only fails when a required
+        section has no values yet, or nothing answered and values went stale.
+
+        Bodies identical to the last applied ones are neither decoded nor
+        applied. Returns the response fingerprints as coordinator data, so
+        listeners are only notified when something changed.
+        """
+        tiers = self.scheduler.due_tiers() if tiers is None else frozenset(tiers)
+        requests = requests_for_tiers(tiers, POLL_REQUESTS)
+        # Bodies must be re-applied to judge (and undo) optimistic values.
+        self.response_cache.invalidate(*self.optimistic.poll_keys())
+        payloads, failures = await async_fetch_partial(
+            self.isapi, requests, self.capabilities
         )
-        response = self.axpro.make_request(endpoint, "GET", None, True)
+        now = dt_util.utcnow()
+        self._track_sections(payloads, failures, now)
+        answered = any(payload is not None for payload in payloads.values())
+        for request in requests:
+            error = failures.get(request.key)
+            if error is None:
+                continue
+            never_fetched = self._last_payloads.get(request.key) is None
+            if (never_fetched and not request.optional) or (
+                not answered and self.section_stale(request.key)
+            ):
+                raise error
+        changed = self._apply_payloads(payloads)
+        polled = {
+            tier
+            for tier in tiers
+            if not any(r.tier == tier and r.key in failures for r in requests)
+        }
+        # Tiers with a failed request stay due, so the next tick retries them.
+        self.scheduler.mark_polled(polled)
+        for tier in polled:
+            self.tier_updated[tier] = now
+        _LOGGER.debug("Polled tiers: %s, changed: %s", sorted(tiers), sorted(changed))
+        if changed:
+            self._schedule_snapshot_save()
+        if self._section_state() != self._listeners_saw_sections:
+            self.async_update_listeners()
+        return self.response_cache.snapshot()
+
+    def _track_sections(
+        self,
+        payloads: dict[str, bytes | None],
+        failures: dict[str, Exception],
+        now: datetime,
+    ) -> None:
+        for key, payload in payloads.items():
+            if payload is not None:
+                self.section_updated[key] = now
+            if key in self.section_restored:
+                self.section_restored.discard(key)
+                self.section_failing.pop(key, None)
+            elif self.section_failing.pop(key, None) is not None:
+                _LOGGER.info("Panel answers %s again", key)
+        for key, error in failures.items():
+            if key not in self.section_failing:
+                self.section_failing[key] = now
+                _LOGGER.warning(
+                    "Fetching %s failed, keeping its last values: %s", key, error
+                )
 
-        if response.status_code != 200:
-            raise hikaxpro.errors.UnexpectedResponseCodeError(
-                response.status_code, response.text
+    def section_of(self, context: Any) -> str | None:
+        """Poll key reporting the device of an entity's listener ``context``."""
+        if isinstance(context, DeviceContext):
+            return _KIND_POLL_KEYS.get(context.kind)
+        return None
+
+    def section_stale(self, key: str) -> bool:
+        """Whether the section ``key`` has been failing for ``stale_after``.
+
+        Sections restored from the snapshot are stale until confirmed.
+        """
+        if key in self.section_restored:
+            return True
+        since = self.section_failing.get(key)
+        return since is not None and dt_util.utcnow() - since > self.stale_after
+
+    def section_age(self, key: str) -> float | None:
+        """Seconds since the last good body of ``key``."""
+        updated = self.section_updated.get(key)
+        if updated is None:
+            return None
+        return (dt_util.utcnow() - updated).total_seconds()
+
+    def _section_state(self) -> tuple[frozenset, frozenset]:
+        """Failing and stale sections, as last shown to the entities."""
+        failing = frozenset(self.section_failing)
+        return failing, frozenset(key for key in failing if self.section_stale(key))
+
+    def _apply_payloads(
+        self, payloads: dict[str, bytes | None]
+    ) -> dict[str, bytes | None]:
+        """Decode and apply the bodies that changed; returns their fingerprints."""
+        changed = self.response_cache.changed(payloads)
+        if POLL_SUBSYSTEMS.key in changed:
+            self._apply_sub_systems(_loads(payloads[POLL_SUBSYSTEMS.key]))
+        if POLL_ZONES.key in changed:
+            self._apply_zones(_loads(payloads[POLL_ZONES.key]))
+        if POLL_EX_DEV_STATUS.key in changed:
+            self._apply_ex_dev_status(_loads(payloads[POLL_EX_DEV_STATUS.key]))
+        if changed.keys() & _DIAGNOSTICS_KEYS:
+            # A diagnostics request that failed this time keeps its last body.
+            bodies = {**self._last_payloads, **payloads}
+            self._apply_host_diagnostics(
+                _loads(bodies.get(POLL_HOST_STATUS.key)),
+                _loads(bodies.get(POLL_AC_POWER.key)),
+                _loads(bodies.get(POLL_BATTERIES.key)),
             )
-        _LOGGER.debug(response.text)
-        return ZonesConf.from_dict(response.json())
-
-    def _update_relays_status(self) -> RelayStatusSearchResponse:
-        endpoint = self.axpro.build_url(
-            f"http://{self.host}" + hikaxpro.consts.Endpoints.OutputStatus, True
-        )
-        response = self.axpro.make_request(
-            endpoint,
-            "POST",
-            {
-                "OutputCond": {
-                    "searchID": "homeassistant",
-                    "searchResultPosition": 1,
-                    "maxResults": 50,
-                    "moduleType": "localWired",
-                }
-            },
-            True,
+        self.response_cache.commit(changed)
+        self._last_payloads.update(payloads)
+        if self.optimistic.pending:
+            self._reconcile_optimistic(payloads.keys())
+        return changed
+
+    def _devices_of_kind(self, kind: str) -> dict[int, Any] | None:
+        return {
+            KIND_SUB_SYSTEM: self.sub_systems,
+            KIND_ZONE: self.zones,
+            KIND_RELAY: self.relays_status,
+            KIND_SIREN: self.sirens,
+        }.get(kind)
+
+    def _reconcile_optimistic(
+        self,
+        fetched: Iterable[str],
+        scope: Iterable[tuple[str, int]] | None = None,
+    ) -> None:
+        """Judge pending command results against freshly applied devices."""
+        confirmed, rolled_back = self.optimistic.reconcile(
+            self._devices_of_kind, fetched, scope
         )
-
-        if response.status_code != 200:
-            raise hikaxpro.errors.UnexpectedResponseCodeError(
-                response.status_code, response.text
+        for expectation in confirmed:
+            _LOGGER.debug("Panel confirmed %s", expectation)
+        for expectation in rolled_back:
+            _LOGGER.warning(
+                "Panel did not confirm %s %s %s=%s, showing its state instead",
+                expectation.kind,
+                expectation.device_id,
+                expectation.field,
+                expectation.value,
             )
-        _LOGGER.debug(response.text)
-        return RelayStatusSearchResponse.from_dict(response.json())
-
-    def _update_data(self) -> None:
-        """Fetch data from axpro via sync functions."""
+        # Values still waiting for the panel stay on top of the fresh data.
+        self._overlay_optimistic()
+        self.state = self._compute_state()
+
+    def _overlay_optimistic(self) -> None:
+        """Write pending command results into the cached devices."""
+        for kind, changes in self.optimistic.overlay(self._devices_of_kind).items():
+            self._patched(kind, changes)
+            merge_changes(self._pending_changes, kind, changes)
+
+    def _patched(self, kind: str, device_ids: Iterable[int]) -> None:
+        """Devices modified in place no longer match their last poll body."""
+        device_ids = tuple(device_ids)
+        if (cache := self.instance_caches.get(kind)) is not None:
+            for device_id in device_ids:
+                cache.invalidate(device_id)
+        if kind == KIND_ZONE:
+            self.zone_flags.refresh(self.zones or {}, device_ids)
+
+    def _apply_sub_systems(self, status_json) -> None:
         status = AlarmControlPanelState.DISARMED
-        status_json = self.axpro.subsystem_status()
         try:
             subsys_resp = SubSystemResponse.from_dict(status_json)
             subsys_arr: list[SubSys] = []
@@ -489,62 +1024,80 @@ class HikAxProDataUpdateCoordinator(DataUpdateCoordinator):
             self.sub_systems = {}
             for subsys in subsys_arr:
                 self.sub_systems[subsys.id] = subsys
-                if self.use_sub_systems and subsys.id != 1:
-                    continue
-                if subsys.alarm:
-                    status = AlarmControlPanelState.TRIGGERED
-                elif subsys.arming == Arming.AWAY:
-                    status = AlarmControlPanelState.ARMED_AWAY
-                elif subsys.arming == Arming.STAY:
-                    status = AlarmControlPanelState.ARMED_HOME
-                elif subsys.arming == Arming.VACATION:
-                    status = AlarmControlPanelState.ARMED_VACATION
+            status = self._compute_state()
             _LOGGER.debug("SubSystem status: %s", subsys_resp)
         except:
             _LOGGER.warning("Error getting status: %s", status_json)
         _LOGGER.debug("Axpro status: %s", status)
         self.state = status
 
-        zone_response = self.axpro.zone_status()
-        zone_status = ZonesResponse.from_dict(zone_response)
-        self.zone_status = zone_status
-        zones = {}
-        for zone in zone_status.zone_list:
-            zones[zone.zone.id] = zone.zone
+    def _compute_state(self) -> AlarmControlPanelState:
+        status = AlarmControlPanelState.DISARMED
+        for subsys in self.sub_systems.values():
+            if self.use_sub_systems and subsys.id != 1:
+                continue
+            if subsys.alarm:
+                status = AlarmControlPanelState.TRIGGERED
+            elif subsys.arming == Arming.AWAY:
+                status = AlarmControlPanelState.ARMED_AWAY
+            elif subsys.arming == Arming.STAY:
+                status = AlarmControlPanelState.ARMED_HOME
+            elif subsys.arming == Arming.VACATION:
+                status = AlarmControlPanelState.ARMED_VACATION
+        return status
+
+    def _apply_zones(self, zone_response) -> None:
+        items = list_items(zone_response, "ZoneList", "Zone", required=True)
+        if None in items:
+            raise DecodeError(f"ZoneList entry without Zone: {zone_response}")
+        decoded = self.instance_caches[KIND_ZONE].decode_all(items)
+        self.zone_status = ZonesResponse([ZoneListWrap(zone) for zone in decoded])
+        zones = {zone.id: zone for zone in decoded}
+        changes = diff_devices(self.zones, zones)
+        merge_changes(self._pending_changes, KIND_ZONE, changes)
         self.zones = zones
+        self.zone_flags.update(zones, changes)
+        self.telemetry.update(KIND_ZONE, zones, changes)
         _LOGGER.debug("Zones: %s", zone_response)
-        # peripherals from exDevStatus
-        devices_status = self._load_ext_devices_status()
+
+    def _apply_ex_dev_status(self, devices_status) -> None:
+        """Replace relay status and peripherals from an exDevStatus response."""
         relays_status: dict[int, OutputStatusFull] = {}
         sirens: dict[int, Siren] = {}
         keypads: dict[int, Keypad] = {}
         repeaters: dict[int, Repeater] = {}
         extensions: dict[int, ExtensionModule] = {}
-        if devices_status.ex_dev_status is not None:
-            ex = devices_status.ex_dev_status
-            if ex.output_list is not None:
-                for item in ex.output_list:
-                    if item.output is not None and item.output.id is not None:
-                        relays_status[item.output.id] = item.output
-            if ex.siren_list is not None:
-                for item in ex.siren_list:
-                    if item.siren is not None and item.siren.id is not None:
-                        sirens[item.siren.id] = item.siren
-            if ex.keypad_list is not None:
-                for item in ex.keypad_list:
-                    if item.keypad is not None and item.keypad.id is not None:
-                        keypads[item.keypad.id] = item.keypad
-            if ex.repeater_list is not None:
-                for item in ex.repeater_list:
-                    if item.repeater is not None and item.repeater.id is not None:
-                        repeaters[item.repeater.id] = item.repeater
-            if ex.extension_list is not None:
-                for item in ex.extension_list:
-                    if (
-                        item.extension_module is not None
-                        and item.extension_module.id is not None
-                    ):
-                        extensions[item.extension_module.id] = item.extension_module
+        peripherals = (
+            (KIND_RELAY, relays_status, "OutputList", "Output"),
+            (KIND_SIREN, sirens, "SirenList", "Siren"),
+            (KIND_KEYPAD, keypads, "KeypadList", "Keypad"),
+            (KIND_REPEATER, repeaters, "RepeaterList", "Repeater"),
+            (KIND_EXTENSION, extensions, "ExtensionList", "ExtensionModule"),
+        )
+        try:
+            ex = devices_status.get("ExDevStatus")
+            if ex is not None:
+                for kind, devices, list_key, item_key in peripherals:
+                    items = list_items(ex, list_key, item_key)
+                    for device in self.instance_caches[kind].decode_all(items):
+                        if device.id is not None:
+                            devices[device.id] = device
+        except (AttributeError, DecodeError) as err:
+            _LOGGER.warning("Invalid exDevStatus %s: %s", err, devices_status)
+            for kind, devices, _, _ in peripherals:
+                devices.clear()
+                self.instance_caches[kind].clear()
+        for kind, old, new in (
+            (KIND_RELAY, self.relays_status, relays_status),
+            (KIND_SIREN, self.sirens, sirens),
+            (KIND_KEYPAD, self.keypads, keypads),
+            (KIND_REPEATER, self.repeaters, repeaters),
+            (KIND_EXTENSION, self.extensions, extensions),
+        ):
+            changes = diff_devices(old, new)
+            merge_changes(self._pending_changes, kind, changes)
+            if kind in (KIND_SIREN, KIND_KEYPAD, KIND_REPEATER):
+                self.telemetry.update(kind, new, changes)
         self.relays_status = relays_status
         self.sirens = sirens
         self.keypads = keypads
@@ -558,208 +1111,504 @@ class HikAxProDataUpdateCoordinator(DataUpdateCoordinator):
             list(repeaters),
             list(extensions),
         )
-        self._update_host_diagnostics()
 
-    def _update_host_diagnostics(self) -> None:
-        """Best-effort poll of host / AC / hub battery status APIs."""
-        try:
-            self.host_status = self.axpro.host_status()
-        except Exception:  # noqa: BLE001 - panel firmware varies
-            _LOGGER.debug("host status unavailable", exc_info=True)
-            self.host_status = None
+    def _apply_host_diagnostics(self, host_status, ac_power_status, batteries) -> None:
+        """Best-effort host / AC / hub battery status; ``None`` when unavailable."""
+        self.host_status = host_status
+        self.ac_power_status = ac_power_status
+        hub_batteries: list[dict] = []
+        if isinstance(batteries, dict):
+            for item in batteries.get("BatteryList") or []:
+                battery = item.get("Battery") if isinstance(item, dict) else None
+                if isinstance(battery, dict):
+                    hub_batteries.append(battery)
+        self.hub_batteries = hub_batteries
+
+    def async_start_alert_stream(self, entry: ConfigEntry) -> None:
+        """Start the alertStream listener as a background task of ``entry``."""
+        self.alert_stream = AlertStreamListener(
+            self.isapi,
+            self._handle_alert_event,
+            self._handle_alert_stream_connection,
+        )
+        self._alert_stream_task = entry.async_create_background_task(
+            self.hass,
+            self.alert_stream.async_run(),
+            f"{DOMAIN} alertStream {self.host}",
+        )
 
-        try:
-            endpoint = self.axpro.build_url(
-                f"http://{self.host}/ISAPI/SecurityCP/status/acPowerStatus", True
+    async def async_stop_alert_stream(self) -> None:
+        """Stop the alertStream listener and wait until its task has ended."""
+        if self.alert_stream is not None:
+            self.alert_stream.stop()
+        task, self._alert_stream_task = self._alert_stream_task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    @callback
+    def _handle_alert_stream_connection(self, connected: bool) -> None:
+        """Poll slowly while events are pushed; fall back when the stream drops."""
+        self.update_interval = (
+            self.reconcile_interval if connected else self.scan_interval
+        )
+        _LOGGER.debug(
+            "alertStream %s, polling every %s",
+            "connected" if connected else "disconnected",
+            self.update_interval,
+        )
+        # Events may have been missed while the stream was (re)connecting.
+        self._async_schedule_reconcile()
+
+    @callback
+    def _async_schedule_reconcile(self) -> None:
+        """Refresh soon without reusing a fetch older than the change."""
+        self.refresh_flight.invalidate()
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _handle_alert_event(self, event: AlertEvent) -> None:
+        """Apply a pushed event to the cached state and notify entities."""
+        _LOGGER.debug("alertStream event: %s", event)
+        action = event.action
+        if action is None:
+            if event.cid_code is not None:
+                # Not modelled here (tamper, power, faults...): reconcile.
+                self._async_schedule_reconcile()
+            return
+        zone = (self.zones or {}).get(event.zone) if event.zone is not None else None
+        sub_id = event.sub_system
+        if sub_id is None and zone is not None:
+            sub_id = zone.sub_system_no
+        if action in (ACTION_ARM_AWAY, ACTION_ARM_HOME, ACTION_DISARM):
+            arming = {
+                ACTION_ARM_AWAY: Arming.AWAY,
+                ACTION_ARM_HOME: Arming.STAY,
+                ACTION_DISARM: Arming.DISARM,
+            }[action]
+            targets = (
+                [self.sub_systems[sub_id]]
+                if sub_id in self.sub_systems
+                else list(self.sub_systems.values())
             )
-            response = self.axpro.make_request(endpoint, "GET", None, True)
-            if response.status_code == 200:
-                self.ac_power_status = response.json()
-            else:
-                self.ac_power_status = None
-        except Exception:  # noqa: BLE001
-            _LOGGER.debug("AC power status unavailable", exc_info=True)
-            self.ac_power_status = None
+            for subsys in targets:
+                subsys.arming = arming
+                if action == ACTION_DISARM:
+                    subsys.alarm = False
+            # Zone armed flags depend on stay/away zone attributes: reconcile.
+            self._async_schedule_reconcile()
+        elif action in (ACTION_ALARM, ACTION_ALARM_RESTORE):
+            if zone is not None:
+                zone.alarm = action == ACTION_ALARM
+                self._patched(KIND_ZONE, [zone.id])
+                merge_changes(
+                    self._pending_changes, KIND_ZONE, {zone.id: frozenset({"alarm"})}
+                )
+            if action == ACTION_ALARM and sub_id in self.sub_systems:
+                self.sub_systems[sub_id].alarm = True
+        elif action in (ACTION_BYPASS, ACTION_BYPASS_RESTORE):
+            if zone is not None:
+                zone.bypassed = action == ACTION_BYPASS
+                self._patched(KIND_ZONE, [zone.id])
+                merge_changes(
+                    self._pending_changes,
+                    KIND_ZONE,
+                    {zone.id: frozenset({"bypassed"})},
+                )
+        self.state = self._compute_state()
+        # Cached objects now differ from the last bodies: re-apply the next ones.
+        self.response_cache.invalidate(POLL_SUBSYSTEMS.key, POLL_ZONES.key)
+        self.async_update_listeners()
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for updates; a ``DeviceContext`` limits them to one device."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        remove_indexed = self.listener_index.add(update_callback, context)
+
+        @callback
+        def remove() -> None:
+            remove_indexed()
+            remove_listener()
+
+        return remove
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call generic listeners and the device listeners whose fields changed.
+
+        Every listener is called when availability (update success, or the
+        failing or stale poll sections) changes.
+        """
+        changes, self._pending_changes = self._pending_changes, {}
+        sections = self._section_state()
+        full = (
+            self.last_update_success != self._listeners_saw_success
+            or sections != self._listeners_saw_sections
+        )
+        self._listeners_saw_success = self.last_update_success
+        self._listeners_saw_sections = sections
+        called = self.listener_index.notify(None if full else changes)
+        _LOGGER.debug("Notified %s listeners (full=%s)", called, full)
 
+    async def _async_update_data(self) -> tuple:
+        """Fetch data from Axpro, joining an in-flight or just-finished fetch."""
         try:
-            endpoint = self.axpro.build_url(
-                f"http://{self.host}" + hikaxpro.consts.Endpoints.BatteriesStatus,
-                True,
-            )
-            response = self.axpro.make_request(endpoint, "GET", None, True)
-            batteries: list[dict] = []
-            if response.status_code == 200:
-                payload = response.json()
-                for item in payload.get("BatteryList") or []:
-                    battery = item.get("Battery") if isinstance(item, dict) else None
-                    if isinstance(battery, dict):
-                        batteries.append(battery)
-            self.hub_batteries = batteries
-        except Exception:  # noqa: BLE001
-            _LOGGER.debug("hub batteries unavailable", exc_info=True)
-            self.hub_batteries = []
-
-    async def _async_update_data(self) -> None:
-        """Fetch data from Axpro."""
-        try:
-            async with timeout(10):
-                await self.hass.async_add_executor_job(self._update_data)
-        except ConnectionError as error:
+            data = await self.refresh_flight()
+        except _UPDATE_ERRORS as error:
             raise UpdateFailed(error) from error
+        _LOGGER.debug(
+            "Refresh fetches=%s coalesced=%s",
+            self.refresh_flight.fetches,
+            self.refresh_flight.coalesced,
+        )
+        return data
+
+    async def _async_command(
+        self,
+        send: Awaitable[Any],
+        expectations: Iterable[Expectation] = (),
+        refresh_keys: Iterable[str] = (),
+    ) -> bool:
+        """Send a command and show its expected result as soon as it succeeded.
+
+        Affected entities are updated at once; a narrow confirmation fetch of
+        the ``expectations``' endpoints (plus ``refresh_keys``) follows, and
+        values the panel does not confirm within the hold are rolled back.
+        """
+        if not await send:
+            return False
+        self._expect(expectations, refresh_keys)
+        return True
+
+    def _expect(
+        self, expectations: Iterable[Expectation], refresh_keys: Iterable[str] = ()
+    ) -> None:
+        """Show accepted commands' results and schedule their confirmation."""
+        for expectation in expectations:
+            self.optimistic.expect(expectation)
+        self._confirm_keys.update(refresh_keys)
+        self._overlay_optimistic()
+        self.state = self._compute_state()
+        self.async_update_listeners()
+        if self._confirm_task is None or self._confirm_task.done():
+            self._confirm_task = self.hass.async_create_background_task(
+                self._async_confirm_commands(), f"{DOMAIN} confirm {self.host}"
+            )
+
+    @callback
+    def async_cancel_confirmation(self) -> None:
+        """Stop confirming pending commands, e.g. before the session closes."""
+        if self._confirm_task is not None:
+            self._confirm_task.cancel()
+            self._confirm_task = None
+
+    async def _async_confirm_commands(self) -> None:
+        """Fetch only the endpoints of pending commands until all are judged."""
+        delay = CONFIRM_DELAY
+        while self.optimistic.pending or self._confirm_keys:
+            await asyncio.sleep(delay)
+            delay *= 2
+            keys = self.optimistic.poll_keys() | self._confirm_keys
+            self._confirm_keys = set()
+            try:
+                async with timeout(10):
+                    await self._async_refresh_narrow(keys)
+            except _UPDATE_ERRORS as err:
+                _LOGGER.debug("Command confirmation failed: %s", err)
+                # Bodies were invalidated, so the next poll undoes these values.
+                self.optimistic.drop_expired()
+                continue
+            self._narrow_refreshed()
+
+    async def refresh_subsystems(self) -> None:
+        """Fetch and apply only the subsystem status."""
+        await self._async_refresh_keys({POLL_SUBSYSTEMS.key})
+        self._narrow_refreshed()
+
+    async def refresh_zone(self, zone_id: int) -> None:
+        """Fetch and apply the zone status.
+
+        The panel reports zones only as one list; unchanged zones keep their
+        instance, so only ``zone_id`` (and zones that really changed) update.
+        """
+        await self._async_refresh_keys({POLL_ZONES.key})
+        self._narrow_refreshed()
+
+    async def refresh_relay(self, relay_id: int) -> None:
+        """Fetch one relay's state, via the output search when it is wired."""
+        if not await self._async_refresh_relays({relay_id}):
+            await self._async_refresh_keys({POLL_EX_DEV_STATUS.key})
+        self._narrow_refreshed()
+
+    async def refresh_siren(self, siren_id: int) -> None:
+        """Fetch the peripheral status, the only endpoint reporting sirens."""
+        await self._async_refresh_keys({POLL_EX_DEV_STATUS.key})
+        self._narrow_refreshed()
+
+    async def _async_refresh_narrow(self, keys: set[str]) -> None:
+        """Refresh ``keys``, confirming pending relay switches by search."""
+        if POLL_EX_DEV_STATUS.key in keys:
+            waiting = self.optimistic.waiting_on(POLL_EX_DEV_STATUS.key)
+            if (
+                waiting
+                and all(exp.kind == KIND_RELAY for exp in waiting)
+                and await self._async_refresh_relays(
+                    {exp.device_id for exp in waiting}
+                )
+            ):
+                keys = keys - {POLL_EX_DEV_STATUS.key}
+        if keys:
+            await self._async_refresh_keys(keys)
+
+    async def _async_refresh_keys(self, keys: set[str]) -> None:
+        self.response_cache.invalidate(*keys)
+        payloads = await async_fetch_all(
+            self.isapi, [r for r in POLL_REQUESTS if r.key in keys], self.capabilities
+        )
+        self._apply_payloads(payloads)
+
+    async def _async_refresh_relays(self, relay_ids: set[int]) -> bool:
+        """Merge the searched status of ``relay_ids``; False if one is missing.
+
+        The output search only covers local wired outputs, so wireless and
+        expansion relays make the caller fall back to ``exDevStatus``.
+        """
+        if not relay_ids <= self.relays_status.keys():
+            return False
+        found: dict[int, RelayStatus] = {}
+        async for relay in self.async_iter_relay_status(relay_ids):
+            found[relay.id] = relay
+        if found.keys() != relay_ids:
+            return False
+        changed: list[int] = []
+        for relay_id, relay in found.items():
+            status = None if relay.status is None else relay.status.value
+            device = self.relays_status[relay_id]
+            if device.status != status:
+                device.status = status
+                changed.append(relay_id)
+        if changed:
+            self._patched(KIND_RELAY, changed)
+            merge_changes(
+                self._pending_changes,
+                KIND_RELAY,
+                dict.fromkeys(changed, frozenset({"status"})),
+            )
+            # The next exDevStatus body must be applied even if unchanged.
+            self.response_cache.invalidate(POLL_EX_DEV_STATUS.key)
+        if self.optimistic.pending:
+            self._reconcile_optimistic(
+                {POLL_EX_DEV_STATUS.key},
+                [(KIND_RELAY, relay_id) for relay_id in found],
+            )
+        return True
+
+    def _narrow_refreshed(self) -> None:
+        self.refresh_flight.invalidate()
+        self.async_set_updated_data(self.response_cache.snapshot())
+
+    def _arming_expectations(
+        self, sub_id: int | None, arming: Arming
+    ) -> list[Expectation]:
+        ids = [sub_id] if sub_id in self.sub_systems else list(self.sub_systems)
+        return [
+            Expectation(KIND_SUB_SYSTEM, i, "arming", arming, POLL_SUBSYSTEMS.key)
+            for i in ids
+        ]
 
     async def async_arm_home(self, sub_id: int | None = None, with_bypass: bool = False):
         """Arm alarm panel in home state."""
         if with_bypass or self.auto_bypass_on_arm:
             await self.async_bypass_blocking_zones()
-        is_success = await self.hass.async_add_executor_job(self.axpro.arm_home, sub_id)
-
-        if is_success:
-            await self._async_update_data()
-            await self.async_request_refresh()
+        # Zone armed flags follow from stay / away zone attributes: refetch.
+        await self._async_command(
+            self.isapi.async_arm_home(sub_id),
+            self._arming_expectations(sub_id, Arming.STAY),
+            [POLL_ZONES.key],
+        )
 
     async def async_arm_away(self, sub_id: int | None = None, with_bypass: bool = False):
         """Arm alarm panel in away state."""
         if with_bypass or self.auto_bypass_on_arm:
             await self.async_bypass_blocking_zones()
-        is_success = await self.hass.async_add_executor_job(self.axpro.arm_away, sub_id)
-
-        if is_success:
-            await self._async_update_data()
-            await self.async_request_refresh()
+        await self._async_command(
+            self.isapi.async_arm_away(sub_id),
+            self._arming_expectations(sub_id, Arming.AWAY),
+            [POLL_ZONES.key],
+        )
 
     async def async_disarm(self, sub_id: int | None = None):
         """Disarm alarm control panel."""
-        is_success = await self.hass.async_add_executor_job(self.axpro.disarm, sub_id)
-
-        if is_success:
-            await self._async_update_data()
-            await self.async_request_refresh()
+        await self._async_command(
+            self.isapi.async_disarm(sub_id),
+            self._arming_expectations(sub_id, Arming.DISARM),
+            [POLL_ZONES.key],
+        )
 
     def _zones_blocking_arm(self) -> list[int]:
         """Return zone IDs that typically prevent arming when left open/triggered."""
-        if not self.zones:
-            return []
-        blocking: list[int] = []
-        for zone_id, zone in self.zones.items():
-            if zone.bypassed:
-                continue
-            open_magnet = zone.magnet_open_status is True
-            triggered = zone.status is Status.TRIGGER
-            alarming = zone.alarm is True
-            if open_magnet or triggered or alarming:
-                blocking.append(zone_id)
-        return blocking
-
-    async def async_bypass_blocking_zones(self) -> None:
+        flags = self.zone_flags
+        active = flags.mask(FLAG_OPEN) | flags.mask(FLAG_TRIGGERED)
+        active |= flags.mask(FLAG_ALARM)
+        return flags.zone_ids(active & ~flags.mask(FLAG_BYPASSED))
+
+    async def async_bypass_blocking_zones(self) -> dict[int, Exception | None]:
         """Bypass zones that look open/triggered before arming."""
-        for zone_id in self._zones_blocking_arm():
-            await self.async_bypass_zone(zone_id)
+        return await self.async_bypass_zones(self._zones_blocking_arm())
+
+    async def async_bypass_zones(
+        self, zone_ids: Iterable[int], bypass: bool = True
+    ) -> dict[int, Exception | None]:
+        """Bypass (or recover) zones as one batch; the error per zone.
+
+        Commands go out a few at a time; the zones the panel accepted are
+        updated at once and confirmed by a single zone status fetch. Zones
+        the panel did not report are not sent and fail with ``ValueError``.
+        """
+        zones = self.zones or {}
+        zone_ids = list(dict.fromkeys(zone_ids))
+        sent = await self.isapi.async_bypass_zones(
+            [zone_id for zone_id in zone_ids if zone_id in zones], bypass
+        )
+        errors: dict[int, Exception | None] = {
+            zone_id: (
+                sent[zone_id]
+                if zone_id in sent
+                else ValueError(f"Unknown zone {zone_id}")
+            )
+            for zone_id in zone_ids
+        }
+        for zone_id, error in errors.items():
+            if error is not None:
+                _LOGGER.warning(
+                    "Zone %s %s failed: %s",
+                    zone_id,
+                    "bypass" if bypass else "bypass recovery",
+                    error,
+                )
+        accepted = [
+            Expectation(KIND_ZONE, zone_id, "bypassed", bypass, POLL_ZONES.key)
+            for zone_id, error in errors.items()
+            if error is None
+        ]
+        if accepted:
+            self._expect(accepted)
+        return errors
 
     async def async_bypass_zone(self, zone_id: int) -> bool:
         """Bypass a single zone."""
-        is_success = await self.hass.async_add_executor_job(
-            self.axpro.bypass_zone, zone_id
+        return await self._async_command(
+            self.isapi.async_bypass_zone(zone_id),
+            [Expectation(KIND_ZONE, zone_id, "bypassed", True, POLL_ZONES.key)],
         )
-        if is_success:
-            await self._async_update_data()
-            await self.async_request_refresh()
-        return is_success
 
     async def async_recover_bypass_zone(self, zone_id: int) -> bool:
         """Clear bypass on a single zone."""
-        is_success = await self.hass.async_add_executor_job(
-            self.axpro.recover_bypass_zone, zone_id
-        )
-        if is_success:
-            await self._async_update_data()
-            await self.async_request_refresh()
-        return is_success
-
-    def _relay_call(self, relay_id: int, is_enabled: bool) -> JSONResponseStatus:
-        endpoint = self.axpro.build_url(
-            f"http://{self.host}"
-            + hikaxpro.consts.Endpoints.OutputControl.replace("{}", str(relay_id)),
+        return await self._async_command(
+            self.isapi.async_recover_bypass_zone(zone_id),
+            [Expectation(KIND_ZONE, zone_id, "bypassed", False, POLL_ZONES.key)],
+        )
+
+    async def _async_relay_call(
+        self, relay_id: int, is_enabled: bool
+    ) -> JSONResponseStatus:
+        endpoint = self.isapi.build_url(
+            hikaxpro.consts.Endpoints.OutputControl.replace("{}", str(relay_id)),
             True,
         )
-        response = self.axpro.make_request(
+        response = await self.isapi.async_request(
             endpoint,
             "PUT",
             {"OutputsCtrl": {"switch": "open" if is_enabled else "close"}},
             True,
+            PRIORITY_COMMAND,
         )
         if response.status_code != 200:
             raise hikaxpro.errors.UnexpectedResponseCodeError(
                 response.status_code, response.text
             )
-        _LOGGER.debug(response.text)
+        _LOGGER.debug("%s", response)
         return JSONResponseStatus.from_dict(response.json())
 
+    async def _async_relay_switch(self, relay_id: int, is_enabled: bool) -> bool:
+        response = await self._async_relay_call(relay_id, is_enabled)
+        return response.status_code == 1
+
     async def relay_on(self, relay_id: int):
         """Turn on relay by ID."""
-        response: JSONResponseStatus = await self.hass.async_add_executor_job(
-            self._relay_call, relay_id, True
+        return await self._async_command(
+            self._async_relay_switch(relay_id, True),
+            [_switch_expectation(KIND_RELAY, relay_id, True)],
         )
-        return response.status_code == 1
 
     async def relay_off(self, relay_id: int):
         """Turn off relay by ID."""
-        response: JSONResponseStatus = await self.hass.async_add_executor_job(
-            self._relay_call, relay_id, False
+        return await self._async_command(
+            self._async_relay_switch(relay_id, False),
+            [_switch_expectation(KIND_RELAY, relay_id, False)],
         )
-        return response.status_code == 1
 
-    def _siren_call(self, siren_id: int, is_enabled: bool) -> JSONResponseStatus:
-        endpoint = self.axpro.build_url(
-            f"http://{self.host}/ISAPI/SecurityCP/control/siren/{siren_id}",
+    async def _async_siren_call(
+        self, siren_id: int, is_enabled: bool
+    ) -> JSONResponseStatus:
+        endpoint = self.isapi.build_url(
+            f"/ISAPI/SecurityCP/control/siren/{siren_id}",
             True,
         )
-        response = self.axpro.make_request(
+        response = await self.isapi.async_request(
             endpoint,
             "PUT",
             {"SirenCtrl": {"switch": "open" if is_enabled else "close"}},
             True,
+            PRIORITY_COMMAND,
         )
         if response.status_code != 200:
             raise hikaxpro.errors.UnexpectedResponseCodeError(
                 response.status_code, response.text
             )
-        _LOGGER.debug(response.text)
+        _LOGGER.debug("%s", response)
         return JSONResponseStatus.from_dict(response.json())
 
-    async def siren_on(self, siren_id: int) -> bool:
-        """Turn on / open a siren by ID."""
+    def siren_control_available(self, siren_id: int) -> bool:
+        """False while the panel rejects control of ``siren_id`` (circuit open)."""
+        return self.capabilities.allowed(siren_control_key(siren_id))
+
+    async def _async_siren_control(self, siren_id: int, is_enabled: bool) -> bool:
+        key = siren_control_key(siren_id)
+        if not self.capabilities.allowed(key):
+            _LOGGER.debug("Siren %s control not supported, not sent", siren_id)
+            return False
         try:
-            response: JSONResponseStatus = await self.hass.async_add_executor_job(
-                self._siren_call, siren_id, True
-            )
-            ok = response.status_code == 1
-            if ok:
-                self.siren_control_supported[siren_id] = True
-            return ok
+            response = await self._async_siren_call(siren_id, is_enabled)
         except hikaxpro.errors.UnexpectedResponseCodeError as err:
             if "notSupport" in str(err):
-                self.siren_control_supported[siren_id] = False
-                _LOGGER.warning(
-                    "Siren %s control not supported by this panel/device", siren_id
-                )
+                if self.capabilities.supported(key) is not False:
+                    _LOGGER.warning(
+                        "Siren %s control not supported by this panel/device",
+                        siren_id,
+                    )
+                self.capabilities.record_failure(key)
                 return False
             raise
+        ok = response.status_code == 1
+        if ok:
+            self.capabilities.record_success(key)
+        return ok
+
+    async def siren_on(self, siren_id: int) -> bool:
+        """Turn on / open a siren by ID."""
+        return await self._async_command(
+            self._async_siren_control(siren_id, True),
+            [_switch_expectation(KIND_SIREN, siren_id, True)],
+        )
 
     async def siren_off(self, siren_id: int) -> bool:
         """Turn off / close a siren by ID."""
-        try:
-            response: JSONResponseStatus = await self.hass.async_add_executor_job(
-                self._siren_call, siren_id, False
-            )
-            ok = response.status_code == 1
-            if ok:
-                self.siren_control_supported[siren_id] = True
-            return ok
-        except hikaxpro.errors.UnexpectedResponseCodeError as err:
-            if "notSupport" in str(err):
-                self.siren_control_supported[siren_id] = False
-                _LOGGER.warning(
-                    "Siren %s control not supported by this panel/device", siren_id
-                )
-                return False
-            raise
+        return await self._async_command(
+            self._async_siren_control(siren_id, False),
+            [_switch_expectation(KIND_SIREN, siren_id, False)],
+        )
@@ -15,10 +15,11 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import Arming, HikAxProDataUpdateCoordinator, SubSys
 from .const import ALLOW_SUBSYSTEMS, DATA_COORDINATOR, DOMAIN
+from .entity import HikCoordinatorEntity
+from .poll import POLL_SUBSYSTEMS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -50,9 +51,10 @@ async def async_setup_entry(
     async_add_entities(panels, False)
 
 
-class HikAxProPanel(CoordinatorEntity, AlarmControlPanelEntity):
+class HikAxProPanel(HikCoordinatorEntity, AlarmControlPanelEntity):
     """Representation of Hikvision Ax Pro alarm panel."""
 
+    poll_key = POLL_SUBSYSTEMS.key
     _attr_code_arm_required = False
 
     @callback
@@ -137,9 +139,10 @@ class HikAxProPanel(CoordinatorEntity, AlarmControlPanelEntity):
         return code == self.coordinator.code
 
 
-class HikAxProSubPanel(CoordinatorEntity, AlarmControlPanelEntity):
+class HikAxProSubPanel(HikCoordinatorEntity, AlarmControlPanelEntity):
     """Representation of Hikvision Ax Pro alarm panel."""
 
+    poll_key = POLL_SUBSYSTEMS.key
     _attr_code_arm_required = False
 
     sys: SubSys
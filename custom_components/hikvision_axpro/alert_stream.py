@@ -0,0 +1,301 @@
+"""AlertStream push listener for AX Pro panels.
+
+Keeps ``/ISAPI/Event/notification/alertStream`` open, splits the multipart
+body incrementally and hands decoded events to a callback. Polling stays the
+source of truth: the coordinator only applies the events it understands and
+reconciles everything else on its (slower) poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+import json
+import logging
+import re
+from typing import TYPE_CHECKING, Any
+from xml.etree import ElementTree
+
+import hikaxpro
+
+if TYPE_CHECKING:
+    from .isapi import IsapiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+ALERT_STREAM_PATH = hikaxpro.consts.Endpoints.AlertStream
+
+CID_ZONE_OFFSET = 1
+""" CID reports zones 1-based, ISAPI zone ids are 0-based """
+
+ACTION_ARM_AWAY = "arm_away"
+ACTION_ARM_HOME = "arm_home"
+ACTION_DISARM = "disarm"
+ACTION_ALARM = "alarm"
+ACTION_ALARM_RESTORE = "alarm_restore"
+ACTION_BYPASS = "bypass"
+ACTION_BYPASS_RESTORE = "bypass_restore"
+
+_CID_ACTIONS: dict[int, str] = {
+    # Opening / closing reported by user, keyswitch, remote or auto arm.
+    1400: ACTION_DISARM,
+    1401: ACTION_DISARM,
+    1403: ACTION_DISARM,
+    1407: ACTION_DISARM,
+    1409: ACTION_DISARM,
+    3400: ACTION_ARM_AWAY,
+    3401: ACTION_ARM_AWAY,
+    3403: ACTION_ARM_AWAY,
+    3407: ACTION_ARM_AWAY,
+    3408: ACTION_ARM_AWAY,
+    3409: ACTION_ARM_AWAY,
+    3441: ACTION_ARM_HOME,
+    3442: ACTION_ARM_HOME,
+    1570: ACTION_BYPASS,
+    3570: ACTION_BYPASS_RESTORE,
+}
+
+
+def classify_cid(code: int | None) -> str | None:
+    """Map a Contact ID event code to the action the coordinator applies."""
+    if code is None:
+        return None
+    if code in _CID_ACTIONS:
+        return _CID_ACTIONS[code]
+    # 1xx: fire, panic, burglary and other zone alarms; 3xx is their restore.
+    if 1100 <= code < 1200:
+        return ACTION_ALARM
+    if 3100 <= code < 3200:
+        return ACTION_ALARM_RESTORE
+    return None
+
+
+@dataclass
+class AlertEvent:
+    """Decoded ``EventNotificationAlert``."""
+
+    event_type: str | None
+    event_state: str | None = None
+    cid_code: int | None = None
+    sub_system: int | None = None
+    zone: int | None = None
+    """ ISAPI zone id (already shifted by ``CID_ZONE_OFFSET``) """
+    raw: Any = field(default=None, repr=False)
+
+    @property
+    def action(self) -> str | None:
+        return classify_cid(self.cid_code)
+
+    @property
+    def is_heartbeat(self) -> bool:
+        # Hikvision keeps idle streams alive with inactive videoloss events.
+        return self.event_type == "videoloss" and self.event_state == "inactive"
+
+
+def _to_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _zone_id(value: Any) -> int | None:
+    zone = _to_int(value)
+    return None if zone is None else zone - CID_ZONE_OFFSET
+
+
+def _event_from_json(payload: Any) -> AlertEvent | None:
+    if not isinstance(payload, dict):
+        return None
+    payload = payload.get("EventNotificationAlert", payload)
+    cid = payload.get("CIDEvent") or {}
+    return AlertEvent(
+        event_type=payload.get("eventType"),
+        event_state=payload.get("eventState"),
+        cid_code=_to_int(cid.get("code", cid.get("standardCIDcode"))),
+        sub_system=_to_int(cid.get("subSystemNo")),
+        zone=_zone_id(cid.get("zone")),
+        raw=payload,
+    )
+
+
+def _event_from_xml(body: bytes) -> AlertEvent | None:
+    root = ElementTree.fromstring(body)
+
+    def text(path: str) -> str | None:
+        # Match on local names so namespaced and bare documents both work.
+        node = root
+        for part in path.split("/"):
+            node = next(
+                (c for c in node if c.tag.rpartition("}")[2] == part), None
+            )
+            if node is None:
+                return None
+        return node.text
+
+    return AlertEvent(
+        event_type=text("eventType"),
+        event_state=text("eventState"),
+        cid_code=_to_int(text("CIDEvent/code")),
+        sub_system=_to_int(text("CIDEvent/subSystemNo")),
+        zone=_zone_id(text("CIDEvent/zone")),
+        raw=body,
+    )
+
+
+def parse_event(headers: dict[str, str], body: bytes) -> AlertEvent | None:
+    """Decode one multipart body; ``None`` for parts that are not events."""
+    body = body.strip()
+    if not body:
+        return None
+    content_type = headers.get("content-type", "")
+    try:
+        if "json" in content_type or body[:1] == b"{":
+            return _event_from_json(json.loads(body))
+        if "xml" in content_type or body[:1] == b"<":
+            return _event_from_xml(body)
+    except (ValueError, ElementTree.ParseError):
+        _LOGGER.debug("Unparsable alertStream part: %r", body[:200])
+    return None
+
+
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?', re.IGNORECASE)
+
+
+def boundary_from_content_type(content_type: str | None) -> bytes:
+    """Return the multipart boundary, falling back to Hikvision's default."""
+    match = _BOUNDARY_RE.search(content_type or "")
+    return (match.group(1) if match else "boundary").encode()
+
+
+class MultipartParser:
+    """Incremental ``multipart/mixed`` splitter for a never-ending body.
+
+    Parts are framed by ``Content-Length`` when present, otherwise by the next
+    boundary delimiter. Chunks may split anywhere.
+    """
+
+    def __init__(self, boundary: bytes) -> None:
+        self._delimiter = b"--" + boundary
+        self._buffer = bytearray()
+
+    def feed(self, chunk: bytes) -> list[tuple[dict[str, str], bytes]]:
+        """Add ``chunk`` and return every part it completed."""
+        self._buffer += chunk
+        parts = []
+        while (part := self._next_part()) is not None:
+            parts.append(part)
+        return parts
+
+    def _next_part(self) -> tuple[dict[str, str], bytes] | None:
+        buffer = self._buffer
+        start = buffer.find(self._delimiter)
+        if start < 0:
+            # Keep a tail that could be the start of a split delimiter.
+            del buffer[: max(0, len(buffer) - len(self._delimiter))]
+            return None
+        header_start = start + len(self._delimiter)
+        header_end = buffer.find(b"\r\n\r\n", header_start)
+        if header_end < 0:
+            del buffer[:start]
+            return None
+        headers: dict[str, str] = {}
+        for line in bytes(buffer[header_start:header_end]).split(b"\r\n"):
+            name, sep, value = line.decode("latin-1").partition(":")
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        body_start = header_end + 4
+        length = _to_int(headers.get("content-length"))
+        if length is not None:
+            body_end = body_start + length
+            if len(buffer) < body_end:
+                return None
+            next_start = body_end
+        else:
+            body_end = buffer.find(self._delimiter, body_start)
+            if body_end < 0:
+                return None
+            next_start = body_end
+        body = bytes(buffer[body_start:body_end])
+        del buffer[:next_start]
+        return headers, body
+
+
+class AlertStreamListener:
+    """Keep the alert stream open and reconnect with exponential backoff."""
+
+    def __init__(
+        self,
+        client: IsapiClient,
+        on_event: Callable[[AlertEvent], None],
+        on_connection_change: Callable[[bool], None],
+        min_backoff: float = 1.0,
+        max_backoff: float = 300.0,
+        read_timeout: float = 120.0,
+        sleep: Callable[[float], Awaitable[Any]] = asyncio.sleep,
+    ) -> None:
+        self._client = client
+        self._on_event = on_event
+        self._on_connection_change = on_connection_change
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.read_timeout = read_timeout
+        self._sleep = sleep
+        self.connected = False
+        self.reconnects = 0
+        self._stopped = False
+
+    def stop(self) -> None:
+        """Stop after the current read; cancel the task for an immediate stop."""
+        self._stopped = True
+
+    def _set_connected(self, connected: bool, notify: bool = True) -> None:
+        # Once stopped, the owner is shutting down and must not be called.
+        if connected != self.connected:
+            self.connected = connected
+            if notify and not self._stopped:
+                self._on_connection_change(connected)
+
+    async def async_run(self) -> None:
+        """Listen until stopped or cancelled."""
+        delay = self.min_backoff
+        while not self._stopped:
+            try:
+                async with self._client.async_stream(
+                    ALERT_STREAM_PATH, self.read_timeout
+                ) as response:
+                    parser = MultipartParser(
+                        boundary_from_content_type(
+                            response.headers.get("Content-Type")
+                        )
+                    )
+                    self._set_connected(True)
+                    delay = self.min_backoff
+                    async for chunk in response.content.iter_any():
+                        for headers, body in parser.feed(chunk):
+                            self._dispatch(headers, body)
+                        if self._stopped:
+                            break
+                _LOGGER.debug("alertStream closed by panel")
+            except asyncio.CancelledError:
+                self._set_connected(False, notify=False)
+                raise
+            except Exception as err:  # noqa: BLE001 - reconnect on anything
+                _LOGGER.debug("alertStream failed: %s", err)
+            self._set_connected(False)
+            if self._stopped:
+                break
+            self.reconnects += 1
+            _LOGGER.debug("alertStream reconnect in %.1fs", delay)
+            await self._sleep(delay)
+            delay = min(delay * 2, self.max_backoff)
+
+    def _dispatch(self, headers: dict[str, str], body: bytes) -> None:
+        event = parse_event(headers, body)
+        if event is None or event.is_heartbeat:
+            return
+        try:
+            self._on_event(event)
+        except Exception:  # noqa: BLE001 - never let a handler kill the stream
+            _LOGGER.exception("Error handling alertStream event %s", event)
@@ -17,13 +17,22 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import HikAxProDataUpdateCoordinator
 from .const import DATA_COORDINATOR, DOMAIN
+from .delta import zone_context
+from .entity import HikCoordinatorEntity
 from .hik_device import HikDevice
 from .entity_id import build_entity_id
-from .model import DetectorType, Zone, zone_device_model
+from .model import (
+    CAP_EXTERNAL_MAGNET,
+    CAP_MAGNET_CONTACT,
+    CAP_MAGNET_SHOCK,
+    DetectorType,
+    Zone,
+    device_capabilities,
+    zone_device_model,
+)
 from .host_entities import build_host_binary_sensors
 from .peripheral_entities import (
     build_peripheral_binary_sensors,
@@ -46,7 +55,6 @@ async def async_setup_entry(
         DATA_COORDINATOR
     ]
     devices = []
-    await coordinator.async_request_refresh()
     device_registry = dr.async_get(hass)
     register_siren_devices(device_registry, coordinator, entry.entry_id)
     register_peripheral_devices(device_registry, coordinator, entry.entry_id)
@@ -97,33 +105,24 @@ async def async_setup_entry(
                     sw_version=zone.zone.version,
                 )
 
-            _LOGGER.debug(
-                "Compare %s is %s == %s",
-                detector_type,
-                detector_type is DetectorType.MAGNET_SHOCK_DETECTOR,
-                detector_type == DetectorType.MAGNET_SHOCK_DETECTOR,
-            )
+            capabilities = device_capabilities(zone.zone.model, detector_type)
             # Specific entity
             if (
-                detector_type == DetectorType.WIRELESS_EXTERNAL_MAGNET_DETECTOR
+                CAP_EXTERNAL_MAGNET in capabilities
                 and zone.zone.magnet_open_status is not None
             ):
                 devices.append(
                     HikWirelessExtMagnetDetector(coordinator, zone.zone, entry.entry_id)
                 )
             if (
-                detector_type
-                in (
-                    DetectorType.DOOR_MAGNETIC_CONTACT_DETECTOR,
-                    DetectorType.SLIM_MAGNETIC_CONTACT,
-                )
+                CAP_MAGNET_CONTACT in capabilities
                 and zone.zone.magnet_open_status is not None
             ):
                 devices.append(
                     HikMagneticContactDetector(coordinator, zone.zone, entry.entry_id)
                 )
             if (
-                detector_type is DetectorType.MAGNET_SHOCK_DETECTOR
+                CAP_MAGNET_SHOCK in capabilities
                 and zone.zone.magnet_shock_current_status is not None
             ):
                 if zone.zone.magnet_shock_current_status.magnet_tilt_status is not None:
@@ -167,7 +166,7 @@ async def async_setup_entry(
     async_add_entities(devices, False)
 
 
-class HikWirelessExtMagnetDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikWirelessExtMagnetDetector(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision external magnet detector."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -176,7 +175,7 @@ class HikWirelessExtMagnetDetector(CoordinatorEntity, HikDevice, BinarySensorEnt
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "magnet_open_status"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-magnet-{zone.id}"
@@ -226,7 +225,7 @@ class HikWirelessExtMagnetDetector(CoordinatorEntity, HikDevice, BinarySensorEnt
         return None
 
 
-class HikMagneticContactDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikMagneticContactDetector(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision external magnet detector."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -235,7 +234,7 @@ class HikMagneticContactDetector(CoordinatorEntity, HikDevice, BinarySensorEntit
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "magnet_open_status"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-magnet-{zone.id}"
@@ -284,7 +283,7 @@ class HikMagneticContactDetector(CoordinatorEntity, HikDevice, BinarySensorEntit
         return None
 
 
-class HikMagnetShockDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikMagnetShockDetector(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision external magnet detector."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -293,7 +292,9 @@ class HikMagnetShockDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, zone_context(zone.id, "magnet_shock_current_status")
+        )
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-magnet-shock-{zone.id}"
@@ -351,7 +352,7 @@ class HikMagnetShockDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return None
 
 
-class HikMagnetOpenDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikMagnetOpenDetector(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision external magnet detector."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -360,7 +361,9 @@ class HikMagnetOpenDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, zone_context(zone.id, "magnet_shock_current_status")
+        )
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-magnet-open-{zone.id}"
@@ -418,7 +421,7 @@ class HikMagnetOpenDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return None
 
 
-class HikMagnetTiltDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikMagnetTiltDetector(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision external magnet detector."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -427,7 +430,9 @@ class HikMagnetTiltDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(
+            coordinator, zone_context(zone.id, "magnet_shock_current_status")
+        )
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-magnet-tilt-{zone.id}"
@@ -485,7 +490,7 @@ class HikMagnetTiltDetector(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return None
 
 
-class HikTamperDetection(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikTamperDetection(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision tamper detection."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -494,7 +499,7 @@ class HikTamperDetection(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "tamper_evident"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-tamper-{zone.id}"
@@ -531,7 +536,7 @@ class HikTamperDetection(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return False
 
 
-class HikBypassDetection(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikBypassDetection(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision bypass detection."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -540,7 +545,7 @@ class HikBypassDetection(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "bypassed"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-bypass-{zone.id}"
@@ -577,7 +582,7 @@ class HikBypassDetection(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return False
 
 
-class HikArmedInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikArmedInfo(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision armed status."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -586,7 +591,7 @@ class HikArmedInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "armed"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-armed-{zone.id}"
@@ -623,7 +628,7 @@ class HikArmedInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return False
 
 
-class HikAlarmInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikAlarmInfo(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision alarm status."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -632,7 +637,7 @@ class HikAlarmInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "alarm"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-alarm-{zone.id}"
@@ -669,7 +674,7 @@ class HikAlarmInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return False
 
 
-class HikStayAwayInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikStayAwayInfo(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision Stay away status."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -678,7 +683,7 @@ class HikStayAwayInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "stay_away"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-stayaway-{zone.id}"
@@ -715,7 +720,7 @@ class HikStayAwayInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return False
 
 
-class HikIsViaRepeaterInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikIsViaRepeaterInfo(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision is via repeater status."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -724,7 +729,7 @@ class HikIsViaRepeaterInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "is_via_repeater"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-isviarepeater-{zone.id}"
@@ -761,7 +766,7 @@ class HikIsViaRepeaterInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
             return False
 
 
-class HikBinaryBatteryInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
+class HikBinaryBatteryInfo(HikCoordinatorEntity, HikDevice, BinarySensorEntity):
     """Representation of Hikvision binary battery info."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -770,7 +775,7 @@ class HikBinaryBatteryInfo(CoordinatorEntity, HikDevice, BinarySensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "charge"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-battery-low-{zone.id}"
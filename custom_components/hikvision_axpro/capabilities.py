@@ -0,0 +1,163 @@
+"""Per-panel registry of which optional ISAPI endpoints the firmware supports.
+
+Each endpoint starts out unknown and is probed by simply using it. A success
+marks it supported; a rejection by the panel opens a circuit breaker so the
+endpoint is skipped until a re-probe is due. Re-probe intervals double on
+every further rejection, so firmware that never supports an endpoint costs
+one request a day instead of one per poll. Transport failures (panel offline,
+timeouts) say nothing about support and are not recorded.
+
+The registry serializes to a plain dict so the coordinator can persist it in
+Home Assistant storage and skip known-unsupported endpoints after a restart.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+import hikaxpro
+
+_LOGGER = logging.getLogger(__name__)
+
+MIN_REPROBE_INTERVAL = 300.0
+""" Seconds before an endpoint rejected once is tried again """
+MAX_REPROBE_INTERVAL = 86400.0
+""" Upper bound of the re-probe interval (one day) """
+
+
+def siren_control_key(siren_id: int) -> str:
+    """Capability key of the local siren control endpoint of one siren."""
+    return f"siren_control/{siren_id}"
+
+
+def is_unsupported_error(err: BaseException) -> bool:
+    """Whether ``err`` is the panel rejecting a request rather than a failure.
+
+    HTTP error statuses (``notSupport``, 403, 404, ...) say the endpoint is not
+    available on this firmware. An expired session (401) is not.
+    """
+    if not isinstance(err, hikaxpro.errors.UnexpectedResponseCodeError):
+        return False
+    return "status code 401 " not in str(err)
+
+
+@dataclass
+class EndpointState:
+    """What is known about one endpoint."""
+
+    supported: bool | None = None
+    """ ``None`` until the endpoint was probed """
+    failures: int = 0
+    """ Consecutive rejections """
+    retry_at: float | None = None
+    """ Wall clock time of the next re-probe while the circuit is open """
+
+
+class CapabilityRegistry:
+    """Supported / unsupported state and re-probe schedule per endpoint key."""
+
+    def __init__(
+        self,
+        min_interval: float = MIN_REPROBE_INTERVAL,
+        max_interval: float = MAX_REPROBE_INTERVAL,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._clock = clock
+        self._endpoints: dict[str, EndpointState] = {}
+        self.on_change: Callable[[], None] | None = None
+        """ Called whenever the persisted state changed """
+
+    def supported(self, key: str) -> bool | None:
+        """``True``/``False`` once probed, ``None`` while unknown."""
+        state = self._endpoints.get(key)
+        return None if state is None else state.supported
+
+    def allowed(self, key: str) -> bool:
+        """Whether a request to ``key`` should be made now.
+
+        Unknown and supported endpoints are always allowed; unsupported ones
+        only once their re-probe is due (half-open circuit).
+        """
+        state = self._endpoints.get(key)
+        if state is None or state.supported is not False:
+            return True
+        return state.retry_at is None or self._clock() >= state.retry_at
+
+    def record_success(self, key: str) -> None:
+        state = self._endpoints.get(key)
+        if state is not None and state.supported is True:
+            return
+        if state is not None and state.supported is False:
+            _LOGGER.info("Endpoint %s is supported again", key)
+        self._endpoints[key] = EndpointState(supported=True)
+        self._changed()
+
+    def record_failure(self, key: str) -> None:
+        """Open (or keep open) the circuit of ``key`` after a rejection."""
+        state = self._endpoints.setdefault(key, EndpointState())
+        state.supported = False
+        state.failures += 1
+        interval = min(
+            self.min_interval * 2 ** (state.failures - 1), self.max_interval
+        )
+        state.retry_at = self._clock() + interval
+        if state.failures == 1:
+            _LOGGER.info(
+                "Endpoint %s not supported by the panel, re-probing with backoff",
+                key,
+            )
+        else:
+            _LOGGER.debug(
+                "Endpoint %s still not supported, next probe in %ss", key, interval
+            )
+        self._changed()
+
+    def record(self, key: str, result: Any) -> bool:
+        """Record a request outcome; ``result`` is the body or the exception.
+
+        Returns whether ``result`` was a rejection (and is logged here).
+        """
+        if not isinstance(result, BaseException):
+            self.record_success(key)
+            return False
+        if is_unsupported_error(result):
+            self.record_failure(key)
+            return True
+        return False
+
+    def _changed(self) -> None:
+        if self.on_change is not None:
+            self.on_change()
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        return {
+            key: {
+                "supported": state.supported,
+                "failures": state.failures,
+                "retry_at": state.retry_at,
+            }
+            for key, state in self._endpoints.items()
+        }
+
+    @classmethod
+    def from_dict(
+        cls, data: Mapping[str, Mapping[str, Any]] | None, **kwargs: Any
+    ) -> CapabilityRegistry:
+        """Restore a registry saved with ``as_dict``; tolerates junk entries."""
+        registry = cls(**kwargs)
+        for key, item in (data or {}).items():
+            if not isinstance(item, Mapping):
+                continue
+            supported = item.get("supported")
+            registry._endpoints[key] = EndpointState(
+                supported=supported if isinstance(supported, bool) else None,
+                failures=int(item.get("failures") or 0),
+                retry_at=item.get("retry_at"),
+            )
+        return registry
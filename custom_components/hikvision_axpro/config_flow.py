@@ -21,7 +21,24 @@ from homeassistant.const import (
 )
 from homeassistant.components.alarm_control_panel import SCAN_INTERVAL
 
-from .const import DOMAIN, USE_CODE_ARMING, ALLOW_SUBSYSTEMS, ENABLE_DEBUG_OUTPUT, AUTO_BYPASS_ON_ARM
+from .const import (
+    DOMAIN,
+    USE_CODE_ARMING,
+    ALLOW_SUBSYSTEMS,
+    ENABLE_DEBUG_OUTPUT,
+    AUTO_BYPASS_ON_ARM,
+    MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    PERIPHERAL_SCAN_INTERVAL,
+    DEFAULT_PERIPHERAL_SCAN_INTERVAL,
+    DIAGNOSTICS_SCAN_INTERVAL,
+    DEFAULT_DIAGNOSTICS_SCAN_INTERVAL,
+    ENABLE_ALERT_STREAM,
+    RECONCILE_SCAN_INTERVAL,
+    DEFAULT_RECONCILE_SCAN_INTERVAL,
+    STALE_AFTER,
+    DEFAULT_STALE_AFTER,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -51,9 +68,25 @@ CONFIGURE_SCHEMA = vol.Schema(
         vol.Optional(CONF_CODE, default=""): str,
         vol.Optional(USE_CODE_ARMING, default=False): bool,
         vol.Required(CONF_SCAN_INTERVAL, default=SCAN_INTERVAL.total_seconds()): int,
+        vol.Optional(
+            PERIPHERAL_SCAN_INTERVAL, default=DEFAULT_PERIPHERAL_SCAN_INTERVAL
+        ): vol.All(int, vol.Range(min=1)),
+        vol.Optional(
+            DIAGNOSTICS_SCAN_INTERVAL, default=DEFAULT_DIAGNOSTICS_SCAN_INTERVAL
+        ): vol.All(int, vol.Range(min=1)),
+        vol.Optional(ENABLE_ALERT_STREAM, default=False): bool,
+        vol.Optional(
+            RECONCILE_SCAN_INTERVAL, default=DEFAULT_RECONCILE_SCAN_INTERVAL
+        ): vol.All(int, vol.Range(min=1)),
+        vol.Optional(STALE_AFTER, default=DEFAULT_STALE_AFTER): vol.All(
+            int, vol.Range(min=0)
+        ),
         vol.Optional(ALLOW_SUBSYSTEMS, default=False): bool,
         vol.Optional(AUTO_BYPASS_ON_ARM, default=False): bool,
         vol.Optional(ENABLE_DEBUG_OUTPUT, default=False): bool,
+        vol.Optional(
+            MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS
+        ): vol.All(int, vol.Range(min=1, max=6)),
     }
 )
 
@@ -14,6 +14,38 @@ ENABLE_DEBUG_OUTPUT: Final[str] = "debug"
 
 AUTO_BYPASS_ON_ARM: Final[str] = "auto_bypass_on_arm"
 
+MAX_CONCURRENT_REQUESTS: Final[str] = "max_concurrent_requests"
+
+DEFAULT_MAX_CONCURRENT_REQUESTS: Final[int] = 3
+
+PERIPHERAL_SCAN_INTERVAL: Final[str] = "peripheral_scan_interval"
+
+DEFAULT_PERIPHERAL_SCAN_INTERVAL: Final[int] = 60
+
+DIAGNOSTICS_SCAN_INTERVAL: Final[str] = "diagnostics_scan_interval"
+
+DEFAULT_DIAGNOSTICS_SCAN_INTERVAL: Final[int] = 300
+
+ENABLE_ALERT_STREAM: Final[str] = "alert_stream"
+
+RECONCILE_SCAN_INTERVAL: Final[str] = "reconcile_scan_interval"
+
+DEFAULT_RECONCILE_SCAN_INTERVAL: Final[int] = 300
+
+STALE_AFTER: Final[str] = "stale_after"
+
+DEFAULT_STALE_AFTER: Final[int] = 120
+""" Seconds a poll section may keep failing before its entities go unavailable """
+
+CAPABILITIES_STORAGE_VERSION: Final[int] = 1
+
+CAPABILITIES_SAVE_DELAY: Final[int] = 10
+
+SNAPSHOT_STORAGE_VERSION: Final[int] = 1
+
+SNAPSHOT_SAVE_DELAY: Final[int] = 300
+""" Seconds; the pending snapshot is also written when Home Assistant stops """
+
 
 # Sensor entity description constants
 ENTITY_DESC_KEY_BATTERY: Final[str] = "battery"
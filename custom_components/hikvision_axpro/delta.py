@@ -0,0 +1,166 @@
+"""Per-device change sets and targeted listener dispatch.
+
+The coordinator diffs consecutive snapshots of zones and peripherals field by
+field. Entities subscribe with a ``DeviceContext`` naming the device and the
+fields they render, and are only called back when one of those changed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, fields
+from typing import Any
+
+KIND_SUB_SYSTEM = "sub_system"
+KIND_ZONE = "zone"
+KIND_RELAY = "relay"
+KIND_SIREN = "siren"
+KIND_KEYPAD = "keypad"
+KIND_REPEATER = "repeater"
+KIND_EXTENSION = "extension"
+
+DeviceChanges = dict[int, frozenset[str] | None]
+""" Changed fields per device id; ``None`` when the device was added or removed """
+
+ChangeSet = dict[str, DeviceChanges]
+""" ``DeviceChanges`` per device kind """
+
+
+@dataclass(frozen=True)
+class DeviceContext:
+    """Coordinator context of an entity bound to one device."""
+
+    kind: str
+    device_id: int
+    fields: frozenset[str] | None = None
+    """ Fields the entity renders; ``None`` for any field """
+
+    def matches(self, changed: frozenset[str] | None) -> bool:
+        if changed is None or self.fields is None:
+            return True
+        return not self.fields.isdisjoint(changed)
+
+
+def zone_context(zone_id: int, *field_names: str) -> DeviceContext:
+    """Context for an entity showing ``field_names`` of a zone."""
+    return DeviceContext(KIND_ZONE, zone_id, frozenset(field_names) or None)
+
+
+def changed_fields(old: Any, new: Any) -> frozenset[str]:
+    """Names of the compared dataclass fields whose values differ.
+
+    A change mask (``_changed``) set by the model's instance cache is trusted.
+    Lazy model fields (``__lazy__``) are compared on their raw JSON while
+    neither side was decoded, so diffing does not force decoding them.
+    """
+    if old is new:
+        return frozenset()
+    changed = getattr(new, "_changed", None)
+    if changed is not None:
+        return changed
+    names = [f.name for f in fields(new) if f.compare]
+    if type(old) is not type(new):
+        return frozenset(names)
+    lazy = getattr(new, "__lazy__", None) or {}
+    return frozenset(
+        name
+        for name in names
+        if (
+            not lazy[name].unchanged(old, new)
+            if name in lazy
+            else getattr(old, name) != getattr(new, name)
+        )
+    )
+
+
+def diff_devices(
+    old: Mapping[int, Any] | None, new: Mapping[int, Any]
+) -> DeviceChanges:
+    """Per-device change set between two ``id -> model`` snapshots."""
+    old = old or {}
+    changes: DeviceChanges = {}
+    for device_id, device in new.items():
+        previous = old.get(device_id)
+        if previous is None:
+            changes[device_id] = None
+        elif changed := changed_fields(previous, device):
+            changes[device_id] = changed
+    for device_id in old.keys() - new.keys():
+        changes[device_id] = None
+    return changes
+
+
+def merge_changes(target: ChangeSet, kind: str, changes: DeviceChanges) -> None:
+    """Fold ``changes`` for ``kind`` into ``target`` (union of fields)."""
+    if not changes:
+        return
+    current = target.setdefault(kind, {})
+    for device_id, changed in changes.items():
+        if device_id in current:
+            previous = current[device_id]
+            if previous is None or changed is None:
+                changed = None
+            else:
+                changed = previous | changed
+        current[device_id] = changed
+
+
+class ListenerIndex:
+    """Listeners keyed by device, plus generic ones called on every update."""
+
+    def __init__(self) -> None:
+        self._generic: dict[object, Callable[[], None]] = {}
+        self._devices: dict[
+            tuple[str, int], dict[object, tuple[Callable[[], None], DeviceContext]]
+        ] = {}
+
+    def add(
+        self, update_callback: Callable[[], None], context: Any = None
+    ) -> Callable[[], None]:
+        """Register a listener; returns the function removing it again."""
+        token = object()
+        if isinstance(context, DeviceContext):
+            key = (context.kind, context.device_id)
+            self._devices.setdefault(key, {})[token] = (update_callback, context)
+
+            def remove() -> None:
+                listeners = self._devices.get(key, {})
+                listeners.pop(token, None)
+                if not listeners:
+                    self._devices.pop(key, None)
+
+        else:
+            self._generic[token] = update_callback
+
+            def remove() -> None:
+                self._generic.pop(token, None)
+
+        return remove
+
+    def _device_callbacks(self) -> Iterable[Callable[[], None]]:
+        for listeners in list(self._devices.values()):
+            for update_callback, _ in list(listeners.values()):
+                yield update_callback
+
+    def notify(self, changes: ChangeSet | None) -> int:
+        """Call generic listeners and the device listeners hit by ``changes``.
+
+        ``changes=None`` calls every listener. Returns the number of callbacks.
+        """
+        callbacks = list(self._generic.values())
+        if changes is None:
+            callbacks.extend(self._device_callbacks())
+        else:
+            for kind, devices in changes.items():
+                for device_id, changed in devices.items():
+                    listeners = self._devices.get((kind, device_id))
+                    if not listeners:
+                        continue
+                    callbacks.extend(
+                        update_callback
+                        for update_callback, context in list(listeners.values())
+                        if context.matches(changed)
+                    )
+        for update_callback in callbacks:
+            update_callback()
+        return len(callbacks)
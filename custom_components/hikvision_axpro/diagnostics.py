@@ -0,0 +1,63 @@
+"""Diagnostics support for hikvision_axpro."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_CODE, CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from . import HikAxProDataUpdateCoordinator
+from .const import DATA_COORDINATOR, DOMAIN
+from .model import parse_diagnostics
+
+TO_REDACT = {
+    CONF_CODE,
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    "macAddress",
+    "serialNumber",
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: HikAxProDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
+        DATA_COORDINATOR
+    ]
+    device_info = coordinator.device_info
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "device_info": (
+            None
+            if device_info is None
+            else async_redact_data(device_info.to_dict(), TO_REDACT)
+        ),
+        "inventory": {
+            "zones": len(coordinator.zones or {}),
+            "sub_systems": len(coordinator.sub_systems),
+            "relays": len(coordinator.relays_status),
+            "sirens": len(coordinator.sirens),
+            "keypads": len(coordinator.keypads),
+            "repeaters": len(coordinator.repeaters),
+            "extensions": len(coordinator.extensions),
+        },
+        "capabilities": coordinator.capabilities.as_dict(),
+        "sections": {
+            key: {
+                "updated": updated.isoformat(),
+                "failing_since": (
+                    failing.isoformat()
+                    if (failing := coordinator.section_failing.get(key))
+                    else None
+                ),
+            }
+            for key, updated in coordinator.section_updated.items()
+        },
+        "parse_anomalies": parse_diagnostics.as_list(),
+    }
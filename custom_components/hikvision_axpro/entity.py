@@ -0,0 +1,59 @@
+"""Shared coordinator entity base for hikvision_axpro."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+import homeassistant.util.dt as dt_util
+
+ATTR_LAST_UPDATED = "last_updated"
+ATTR_AGE = "age"
+
+
+class HikCoordinatorEntity(CoordinatorEntity):
+    """Coordinator entity that renders the current snapshot when added.
+
+    The coordinator only calls listeners for changes, and entities bound to a
+    device (``context`` is a ``DeviceContext``) only for changes to their
+    fields, so an entity must not wait for the next change to show a value.
+
+    While the poll section the entity shows is failing, the entity keeps its
+    last value with the time and age of that value as attributes, and goes
+    unavailable once the section is stale.
+    """
+
+    poll_key: str | None = None
+    """ Poll section shown; by default the one reporting the context's device """
+
+    @property
+    def _section(self) -> str | None:
+        if self.poll_key is not None:
+            return self.poll_key
+        return self.coordinator.section_of(self.coordinator_context)
+
+    @property
+    def available(self) -> bool:
+        section = self._section
+        return super().available and (
+            section is None or not self.coordinator.section_stale(section)
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        attributes = super().extra_state_attributes
+        section = self._section
+        if section is None or section not in self.coordinator.section_failing:
+            return attributes
+        updated = self.coordinator.section_updated.get(section)
+        if updated is None:
+            return attributes
+        return {
+            **(attributes or {}),
+            ATTR_LAST_UPDATED: updated.isoformat(),
+            ATTR_AGE: round((dt_util.utcnow() - updated).total_seconds()),
+        }
+
+    async def async_added_to_hass(self) -> None:
+        await super().async_added_to_hass()
+        self._handle_coordinator_update()
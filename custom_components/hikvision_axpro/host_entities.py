@@ -15,14 +15,49 @@ from homeassistant.components.sensor import (
     SensorEntity,
     SensorStateClass,
 )
-from homeassistant.const import PERCENTAGE, UnitOfElectricPotential
+from homeassistant.const import (
+    PERCENTAGE,
+    SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    UnitOfElectricPotential,
+)
 from homeassistant.core import callback
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import HikAxProDataUpdateCoordinator
 from .const import DOMAIN
+from .entity import HikCoordinatorEntity
 from .entity_id import build_entity_id
+from .poll import POLL_AC_POWER, POLL_BATTERIES, POLL_HOST_STATUS, POLL_ZONES
+from .telemetry import METRIC_CHARGE, METRIC_SIGNAL
+from .zone_flags import FLAG_ALARM, FLAG_BYPASSED, FLAG_OPEN, FLAG_TAMPER
+
+ZONE_COUNT_SENSORS: tuple[tuple[str, str, str], ...] = (
+    (FLAG_OPEN, "open_zones", "Open zones"),
+    (FLAG_BYPASSED, "bypassed_zones", "Bypassed zones"),
+    (FLAG_ALARM, "alarm_zones", "Zones in alarm"),
+    (FLAG_TAMPER, "tampered_zones", "Tampered zones"),
+)
+""" Zone flag, key and name of the panel-wide zone count sensors """
+
+TELEMETRY_MIN_SENSORS: tuple[
+    tuple[str, str, str, SensorDeviceClass, str], ...
+] = (
+    (
+        METRIC_CHARGE,
+        "lowest_battery",
+        "Lowest battery",
+        SensorDeviceClass.BATTERY,
+        PERCENTAGE,
+    ),
+    (
+        METRIC_SIGNAL,
+        "weakest_signal",
+        "Weakest signal",
+        SensorDeviceClass.SIGNAL_STRENGTH,
+        SIGNAL_STRENGTH_DECIBELS_MILLIWATT,
+    ),
+)
+""" Metric, key, name, device class and unit of the fleet minimum sensors """
 
 
 def build_host_binary_sensors(
@@ -56,10 +91,20 @@ def build_host_sensors(
             )
     if coordinator.host_status is not None:
         entities.append(HikHostStatusSensor(coordinator, entry_id))
+    if coordinator.zones:
+        for flag, key, name in ZONE_COUNT_SENSORS:
+            entities.append(HikZoneCountSensor(coordinator, entry_id, flag, key, name))
+    for metric, key, name, device_class, unit in TELEMETRY_MIN_SENSORS:
+        if coordinator.telemetry.stats(metric) is not None:
+            entities.append(
+                HikTelemetryMinSensor(
+                    coordinator, entry_id, metric, key, name, device_class, unit
+                )
+            )
     return entities
 
 
-class HikPanelEntity(CoordinatorEntity):
+class HikPanelEntity(HikCoordinatorEntity):
     """Entities attached to the main panel device."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -84,6 +129,8 @@ class HikPanelEntity(CoordinatorEntity):
 class HikAcPowerBinary(HikPanelEntity, BinarySensorEntity):
     """AC mains presence from acPowerStatus."""
 
+    poll_key = POLL_AC_POWER.key
+
     def __init__(
         self, coordinator: HikAxProDataUpdateCoordinator, entry_id: str
     ) -> None:
@@ -123,6 +170,8 @@ class HikAcPowerBinary(HikPanelEntity, BinarySensorEntity):
 class HikHostStatusSensor(HikPanelEntity, SensorEntity):
     """Compact host status summary (best-effort from host JSON)."""
 
+    poll_key = POLL_HOST_STATUS.key
+
     def __init__(
         self, coordinator: HikAxProDataUpdateCoordinator, entry_id: str
     ) -> None:
@@ -173,6 +222,8 @@ def _battery_node(
 class HikHubBatteryPercent(HikPanelEntity, SensorEntity):
     """Hub battery percentage from /status/batteries."""
 
+    poll_key = POLL_BATTERIES.key
+
     def __init__(
         self,
         coordinator: HikAxProDataUpdateCoordinator,
@@ -211,6 +262,8 @@ class HikHubBatteryPercent(HikPanelEntity, SensorEntity):
 class HikHubBatteryStatus(HikPanelEntity, SensorEntity):
     """Hub battery categorical status."""
 
+    poll_key = POLL_BATTERIES.key
+
     def __init__(
         self,
         coordinator: HikAxProDataUpdateCoordinator,
@@ -246,6 +299,8 @@ class HikHubBatteryStatus(HikPanelEntity, SensorEntity):
 class HikHubBatteryVoltage(HikPanelEntity, SensorEntity):
     """Hub battery voltage."""
 
+    poll_key = POLL_BATTERIES.key
+
     def __init__(
         self,
         coordinator: HikAxProDataUpdateCoordinator,
@@ -283,3 +338,78 @@ class HikHubBatteryVoltage(HikPanelEntity, SensorEntity):
             self._attr_native_value = cast(float, voltage)
             self._attr_available = True
         self.async_write_ha_state()
+
+
+class HikZoneCountSensor(HikPanelEntity, SensorEntity):
+    """Number of zones with a flag set, e.g. open or bypassed zones."""
+
+    _attr_entity_registry_enabled_default = False
+    poll_key = POLL_ZONES.key
+
+    def __init__(
+        self,
+        coordinator: HikAxProDataUpdateCoordinator,
+        entry_id: str,
+        flag: str,
+        key: str,
+        name: str,
+    ) -> None:
+        super().__init__(coordinator, entry_id)
+        self._flag = flag
+        self._attr_unique_id = f"{coordinator.device_name}-{key.replace('_', '-')}"
+        self._attr_name = name
+        self._attr_has_entity_name = True
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self.entity_id = build_entity_id(SENSOR_DOMAIN, coordinator.device_name, key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        flags = self.coordinator.zone_flags
+        mask = flags.mask(self._flag)
+        self._attr_native_value = mask.bit_count()
+        self._attr_extra_state_attributes = {"zones": flags.zone_ids(mask)}
+        self._attr_available = len(flags) > 0
+        self.async_write_ha_state()
+
+
+class HikTelemetryMinSensor(HikPanelEntity, SensorEntity):
+    """Lowest value of a metric over all zones and peripherals."""
+
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        coordinator: HikAxProDataUpdateCoordinator,
+        entry_id: str,
+        metric: str,
+        key: str,
+        name: str,
+        device_class: SensorDeviceClass,
+        unit: str,
+    ) -> None:
+        super().__init__(coordinator, entry_id)
+        self._metric = metric
+        self._attr_unique_id = f"{coordinator.device_name}-{key.replace('_', '-')}"
+        self._attr_name = name
+        self._attr_has_entity_name = True
+        self._attr_device_class = device_class
+        self._attr_native_unit_of_measurement = unit
+        self._attr_state_class = SensorStateClass.MEASUREMENT
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self.entity_id = build_entity_id(SENSOR_DOMAIN, coordinator.device_name, key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        stats = self.coordinator.telemetry.stats(self._metric)
+        if stats is None:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = {}
+        else:
+            self._attr_native_value = stats.min
+            self._attr_extra_state_attributes = {
+                "max": stats.max,
+                "mean": round(stats.mean, 1),
+                "devices": stats.count,
+            }
+        self._attr_available = stats is not None
+        self.async_write_ha_state()
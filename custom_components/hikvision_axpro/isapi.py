@@ -0,0 +1,697 @@
+"""Async ISAPI transport for AX Pro panels.
+
+Mirrors the request semantics of ``hikaxpro.HikAxPro`` (session login, cookie
+handling, ``build_url`` and re-login on 401) but runs on the event loop over a
+pooled keep-alive ``aiohttp`` session instead of blocking ``requests`` calls.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable, Iterable
+import contextlib
+from dataclasses import dataclass, field
+from datetime import datetime
+import heapq
+import itertools
+import json
+import logging
+from typing import Any
+import urllib.parse
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+import aiohttp
+import hikaxpro
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - Home Assistant ships orjson
+    orjson = None
+
+_LOGGER = logging.getLogger(__name__)
+
+JsonLoads = Callable[[bytes], Any]
+""" Decodes a JSON body from bytes; raises ``ValueError`` on invalid JSON """
+
+json_loads: JsonLoads = json.loads if orjson is None else orjson.loads
+""" Fastest available decoder: ``orjson`` when installed, else stdlib ``json`` """
+
+XML_NAMESPACES = {"xmlns": hikaxpro.consts.XML_SCHEMA}
+
+DEFAULT_MAX_CONCURRENCY = 3
+
+PRIORITY_COMMAND = 0
+""" Arm / disarm, bypass, relay and siren control, and session login """
+PRIORITY_POLL = 1
+""" Alarm state polls; priorities above it are background requests """
+
+BYPASS_CONCURRENCY = 2
+""" Bypass / recover commands of one batch in flight at a time """
+
+SEARCH_ID = "homeassistant"
+SEARCH_PAGE_SIZE = 50
+SEARCH_MORE = "MORE"
+""" ``responseStatusStrg`` of a search page that is not the last one """
+
+
+def build_url(endpoint: str, is_json: bool = False) -> str:
+    """Append ``format=json`` the same way ``HikAxPro.build_url`` does."""
+    param_prefix = "&" if "?" in endpoint else "?"
+    return f"{endpoint}{param_prefix}format=json" if is_json else endpoint
+
+
+def _local_name(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _element_value(element: ElementTree.Element) -> Any:
+    """Text of a leaf, else a dict of the children (repeated tags as lists)."""
+    if len(element) == 0:
+        return (element.text or "").strip()
+    value: dict[str, Any] = {}
+    for child in element:
+        tag = _local_name(child.tag)
+        item = _element_value(child)
+        if tag not in value:
+            value[tag] = item
+        elif isinstance(previous := value[tag], list):
+            previous.append(item)
+        else:
+            value[tag] = [previous, item]
+    return value
+
+
+class XmlElementDecoder:
+    """Incremental XML decoder for the elements at one path.
+
+    ``path`` names the elements without namespaces, from the document root
+    (``"DeviceInfo"``, ``"NetworkInterfaceList/NetworkInterface"``). Body
+    chunks are fed as they arrive and every completed element at ``path`` is
+    returned as a dict of its children; everything else is discarded as soon
+    as it ends, so large documents are never held as a whole.
+    """
+
+    def __init__(self, path: str) -> None:
+        self._path = path.split("/")
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._stack: list[str] = []
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Decode ``chunk``; returns the elements completed by it."""
+        self._parser.feed(chunk)
+        return self._read()
+
+    def close(self) -> list[dict[str, Any]]:
+        """End of body; raises ``ElementTree.ParseError`` if it is incomplete."""
+        self._parser.close()
+        return self._read()
+
+    def _read(self) -> list[dict[str, Any]]:
+        found: list[dict[str, Any]] = []
+        depth = len(self._path)
+        for event, element in self._parser.read_events():
+            if event == "start":
+                self._stack.append(_local_name(element.tag))
+                continue
+            stack = self._stack
+            if stack == self._path:
+                value = _element_value(element)
+                found.append(value if isinstance(value, dict) else {})
+                element.clear()
+            elif len(stack) <= depth or stack[:depth] != self._path:
+                # Not inside a wanted element: drop its subtree now.
+                element.clear()
+            stack.pop()
+        return found
+
+
+@dataclass
+class IsapiResponse:
+    """Buffered ISAPI response with a ``requests.Response``-like surface."""
+
+    status_code: int
+    content: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+
+    loads: JsonLoads = field(default=json_loads, repr=False)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+    def __str__(self) -> str:
+        # Lets ``_LOGGER.debug("%s", response)`` decode the body only when the
+        # record is emitted.
+        return self.text
+
+    def json(self) -> Any:
+        return self.loads(self.content)
+
+
+class RequestScheduler:
+    """Hand out a panel's request slots by priority (lower first).
+
+    Waiting requests start in priority order, FIFO within a priority, so a
+    command queued behind polls goes first. Background requests (priority
+    above ``PRIORITY_POLL``) never hold more than ``limit - reserved`` slots,
+    keeping a slot for commands and alarm state while a slow peripheral or
+    diagnostics request hangs.
+    """
+
+    def __init__(self, limit: int, reserved: int = 1) -> None:
+        self.limit = max(1, limit)
+        self.reserved = max(0, min(reserved, self.limit - 1))
+        self.in_flight = 0
+        self.background = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+
+    def _can_start(self, priority: int) -> bool:
+        if self.in_flight >= self.limit:
+            return False
+        return (
+            priority <= PRIORITY_POLL
+            or self.background < self.limit - self.reserved
+        )
+
+    def _start(self, priority: int) -> None:
+        self.in_flight += 1
+        if priority > PRIORITY_POLL:
+            self.background += 1
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_POLL) -> AsyncIterator[None]:
+        """Hold a request slot for the duration of the block."""
+        await self._acquire(priority)
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    async def _acquire(self, priority: int) -> None:
+        waiters = self._waiters
+        if (not waiters or waiters[0][0] > priority) and self._can_start(priority):
+            self._start(priority)
+            return
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(waiters, (priority, next(self._order), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just before the cancellation arrived.
+                self._release(priority)
+            raise
+
+    def _release(self, priority: int) -> None:
+        self.in_flight -= 1
+        if priority > PRIORITY_POLL:
+            self.background -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        waiters = self._waiters
+        while waiters:
+            priority, _, future = waiters[0]
+            if future.done():
+                heapq.heappop(waiters)
+                continue
+            # Anything queued behind the first waiter has the same or a
+            # lower priority, so it cannot start either.
+            if not self._can_start(priority):
+                return
+            heapq.heappop(waiters)
+            self._start(priority)
+            future.set_result(None)
+
+
+class IsapiClient:
+    """Event-loop ISAPI client for a single panel."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        axpro: hikaxpro.HikAxPro,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        loads: JsonLoads = json_loads,
+    ) -> None:
+        """Use ``axpro`` for credentials and password encoding only.
+
+        ``max_concurrency`` caps in-flight requests to this panel (handed out
+        by priority, see ``RequestScheduler``); ``loads`` decodes JSON bodies.
+        """
+        self._session = session
+        self.loads = loads
+        self._axpro = axpro
+        self.host = axpro.host
+        self._cookie: str | None = None
+        self._login_lock = asyncio.Lock()
+        self.scheduler = RequestScheduler(max_concurrency)
+
+    def build_url(self, path: str, is_json: bool = False) -> str:
+        """Return the absolute URL for an ISAPI path."""
+        return build_url(f"http://{self.host}{path}", is_json)
+
+    def is_logged_in(self) -> bool:
+        return self._cookie is not None
+
+    async def async_close(self) -> None:
+        """Close the pooled session owned by this client."""
+        self._cookie = None
+        await self._session.close()
+
+    def _headers(self) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if self._cookie is not None:
+            headers["Cookie"] = self._cookie
+        if self._axpro.user_level is not None:
+            headers["X-Userlevel"] = str(self._axpro.user_level)
+        return headers
+
+    async def _send(
+        self,
+        endpoint: str,
+        method: str,
+        data: Any = None,
+        is_json: bool = False,
+        priority: int = PRIORITY_POLL,
+    ) -> IsapiResponse:
+        kwargs: dict[str, Any] = {"headers": self._headers()}
+        if method in (hikaxpro.consts.Method.POST, hikaxpro.consts.Method.PUT):
+            if is_json:
+                kwargs["json"] = data
+            else:
+                kwargs["data"] = data
+        try:
+            async with self.scheduler.slot(priority), self._session.request(
+                method, endpoint, **kwargs
+            ) as response:
+                content = await response.read()
+                return IsapiResponse(
+                    response.status, content, dict(response.headers), self.loads
+                )
+        except aiohttp.ClientError as err:
+            raise ConnectionError(f"ISAPI request to {endpoint} failed: {err}") from err
+
+    async def async_login(self) -> bool:
+        """Open a web session; mirrors ``HikAxPro.connect``."""
+        async with self._login_lock:
+            return await self._async_login()
+
+    async def _async_login(self) -> bool:
+        self._cookie = None
+        q_user = urllib.parse.quote(self._axpro.username)
+        response = await self._send(
+            self.build_url(
+                hikaxpro.consts.Endpoints.Session_Capabilities + q_user
+            ),
+            hikaxpro.consts.Method.GET,
+            priority=PRIORITY_COMMAND,
+        )
+        if response.status_code != 200:
+            _LOGGER.debug("Session capabilities returned %s", response.status_code)
+            return False
+        try:
+            session_cap = hikaxpro.HikAxPro.parse_session_response(response.text)
+        except ElementTree.ParseError as err:
+            raise hikaxpro.errors.IncorrectResponseContentError() from err
+
+        encoded_password = self._axpro.encode_password(session_cap)
+        xml = (
+            "<SessionLogin>"
+            f"<sessionID>{escape(str(session_cap.session_id))}</sessionID>"
+            f"<userName>{escape(self._axpro.username)}</userName>"
+            f"<password>{encoded_password}</password>"
+            f"<sessionIDVersion>{escape(str(session_cap.session_id_version))}</sessionIDVersion>"
+            "</SessionLogin>"
+        )
+        timestamp = int(datetime.timestamp(datetime.now()))
+        response = await self._send(
+            self.build_url(
+                f"{hikaxpro.consts.Endpoints.Session_Login}?timeStamp={timestamp}"
+            ),
+            hikaxpro.consts.Method.POST,
+            xml,
+            priority=PRIORITY_COMMAND,
+        )
+        if response.status_code != 200:
+            _LOGGER.debug("Session login returned %s", response.status_code)
+            return False
+
+        cookie = response.headers.get("Set-Cookie")
+        if cookie is not None:
+            cookie = cookie.split(";")[0]
+        else:
+            try:
+                root = ElementTree.fromstring(response.content)
+            except ElementTree.ParseError:
+                root = None
+            session_id = (
+                hikaxpro.HikAxPro._root_get_value(  # noqa: SLF001
+                    root, XML_NAMESPACES, "xmlns:sessionID"
+                )
+                if root is not None
+                else None
+            )
+            if session_id is not None:
+                cookie = "WebSession=" + session_id
+        if cookie is None:
+            _LOGGER.error("Session login response did not provide a cookie")
+            return False
+        self._cookie = cookie
+        return True
+
+    async def async_request(
+        self,
+        endpoint: str,
+        method: str,
+        data: Any = None,
+        is_json: bool = False,
+        priority: int = PRIORITY_POLL,
+    ) -> IsapiResponse:
+        """Send a request, logging in again once on 401 like ``make_request``.
+
+        Commands pass ``PRIORITY_COMMAND`` to go ahead of queued polls.
+        """
+        if self._cookie is None:
+            async with self._login_lock:
+                if self._cookie is None:
+                    await self._async_login()
+        cookie = self._cookie
+        response = await self._send(endpoint, method, data, is_json, priority)
+        if response.status_code == 401:
+            async with self._login_lock:
+                # Another request may already have refreshed the session.
+                if self._cookie == cookie:
+                    await self._async_login()
+            response = await self._send(endpoint, method, data, is_json, priority)
+        return response
+
+    @contextlib.asynccontextmanager
+    async def async_stream(
+        self, path: str, read_timeout: float | None = None
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Open a long-lived GET for streaming endpoints.
+
+        Streams bypass the request cap so they never hold a slot that polls
+        need; ``read_timeout`` bounds silence between chunks.
+        """
+        if self._cookie is None:
+            async with self._login_lock:
+                if self._cookie is None:
+                    await self._async_login()
+        timeout = aiohttp.ClientTimeout(total=None, sock_read=read_timeout)
+        endpoint = self.build_url(path)
+        for attempt in range(2):
+            cookie = self._cookie
+            try:
+                async with self._session.get(
+                    endpoint, headers=self._headers(), timeout=timeout
+                ) as response:
+                    if response.status == 401 and attempt == 0:
+                        async with self._login_lock:
+                            if self._cookie == cookie:
+                                await self._async_login()
+                        continue
+                    if response.status != 200:
+                        raise hikaxpro.errors.UnexpectedResponseCodeError(
+                            response.status, await response.text()
+                        )
+                    yield response
+                    return
+            except aiohttp.ClientError as err:
+                raise ConnectionError(
+                    f"ISAPI stream {endpoint} failed: {err}"
+                ) from err
+            except asyncio.TimeoutError as err:
+                raise ConnectionError(f"ISAPI stream {endpoint} timed out") from err
+
+    async def async_request_raw(
+        self,
+        path: str,
+        method: str = hikaxpro.consts.Method.GET,
+        data: Any = None,
+        priority: int = PRIORITY_POLL,
+    ) -> bytes:
+        """JSON-format request returning the undecoded body; raises on non-200."""
+        response = await self.async_request(
+            self.build_url(path, True), method, data, True, priority
+        )
+        if response.status_code != 200:
+            raise hikaxpro.errors.UnexpectedResponseCodeError(
+                response.status_code, response.text
+            )
+        return response.content
+
+    async def async_request_json(
+        self,
+        path: str,
+        method: str = hikaxpro.consts.Method.GET,
+        data: Any = None,
+        priority: int = PRIORITY_POLL,
+    ) -> Any:
+        """JSON request that raises on non-200; mirrors ``_base_json_request``."""
+        return self.loads(await self.async_request_raw(path, method, data, priority))
+
+    async def async_request_xml(
+        self, path: str, element: str, limit: int | None = None
+    ) -> list[dict[str, Any]]:
+        """GET an XML endpoint, decoding the ``element`` path while it streams.
+
+        Stops reading once ``limit`` elements were found. Raises on non-200 and
+        ``ElementTree.ParseError`` on malformed XML.
+        """
+        if self._cookie is None:
+            async with self._login_lock:
+                if self._cookie is None:
+                    await self._async_login()
+        endpoint = self.build_url(path)
+        cookie = self._cookie
+        found = await self._stream_xml(endpoint, element, limit)
+        if found is None:
+            async with self._login_lock:
+                if self._cookie == cookie:
+                    await self._async_login()
+            found = await self._stream_xml(endpoint, element, limit)
+            if found is None:
+                raise hikaxpro.errors.UnexpectedResponseCodeError(401, "")
+        return found
+
+    async def _stream_xml(
+        self, endpoint: str, element: str, limit: int | None
+    ) -> list[dict[str, Any]] | None:
+        """Decoded elements, or ``None`` when the session was rejected."""
+        decoder = XmlElementDecoder(element)
+        found: list[dict[str, Any]] = []
+        try:
+            async with self.scheduler.slot(), self._session.get(
+                endpoint, headers=self._headers()
+            ) as response:
+                if response.status == 401:
+                    return None
+                if response.status != 200:
+                    raise hikaxpro.errors.UnexpectedResponseCodeError(
+                        response.status, await response.text()
+                    )
+                async for chunk in response.content.iter_any():
+                    found += decoder.feed(chunk)
+                    if limit is not None and len(found) >= limit:
+                        return found[:limit]
+        except aiohttp.ClientError as err:
+            raise ConnectionError(f"ISAPI request to {endpoint} failed: {err}") from err
+        return found + decoder.close()
+
+    async def async_get_device_info(self) -> dict[str, Any]:
+        """Fields of ``DeviceInfo`` as strings."""
+        found = await self.async_request_xml(
+            hikaxpro.consts.Endpoints.SystemDeviceInfo, "DeviceInfo", limit=1
+        )
+        if not found:
+            raise ElementTree.ParseError("deviceInfo without DeviceInfo element")
+        return found[0]
+
+    async def async_search(
+        self,
+        path: str,
+        condition: str,
+        result: str,
+        items: str,
+        criteria: dict[str, Any],
+        page_size: int = SEARCH_PAGE_SIZE,
+        max_concurrency: int = 2,
+    ) -> AsyncIterator[Any]:
+        """Entries of an ISAPI search, page by page as they arrive.
+
+        Posts ``{condition: {searchID, searchResultPosition, maxResults,
+        **criteria}}`` and yields the ``items`` list entries of the ``result``
+        object. Once the first page reports ``totalMatches`` the remaining pages
+        are requested at most ``max_concurrency`` at a time (in completion
+        order), each as long as the first one (panels may cap ``maxResults``);
+        otherwise pages are followed while the panel answers ``MORE``.
+        Closing the iterator early cancels the pages still in flight.
+        """
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def page(position: int) -> dict[str, Any]:
+            async with slots:
+                body = await self.async_request_json(
+                    path,
+                    hikaxpro.consts.Method.POST,
+                    {
+                        condition: {
+                            "searchID": SEARCH_ID,
+                            "searchResultPosition": position,
+                            "maxResults": page_size,
+                            **criteria,
+                        }
+                    },
+                )
+            found = body.get(result) if isinstance(body, dict) else None
+            if not isinstance(found, dict):
+                raise ValueError(f"Search response without {result}: {body}")
+            return found
+
+        position = 1
+        first = await page(position)
+        for entry in first.get(items) or ():
+            yield entry
+        matches = first.get("numOfMatches") or 0
+        total = first.get("totalMatches")
+        if first.get("responseStatusStrg") != SEARCH_MORE or not matches:
+            return
+        position += matches
+        if not isinstance(total, int):
+            while True:
+                current = await page(position)
+                for entry in current.get(items) or ():
+                    yield entry
+                matches = current.get("numOfMatches") or 0
+                if current.get("responseStatusStrg") != SEARCH_MORE or not matches:
+                    return
+                position += matches
+        tasks = [
+            asyncio.ensure_future(page(start))
+            for start in range(position, total + 1, matches)
+        ]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                for entry in (await next_page).get(items) or ():
+                    yield entry
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def async_get_interface_mac_address(self, interface_id: int) -> str:
+        """Return the MAC address of a network interface or ``''``."""
+        try:
+            interfaces = await self.async_request_xml(
+                hikaxpro.consts.Endpoints.InterfaceInfo,
+                "NetworkInterfaceList/NetworkInterface",
+            )
+        except (hikaxpro.errors.UnexpectedResponseCodeError, ElementTree.ParseError):
+            _LOGGER.debug("Interface info unavailable", exc_info=True)
+            return ""
+        for interface in interfaces:
+            if interface.get("id") == str(interface_id):
+                link = interface.get("Link")
+                return link.get("MACAddress", "") if isinstance(link, dict) else ""
+        return ""
+
+    async def async_subsystem_status(self) -> Any:
+        return await self.async_request_json(
+            hikaxpro.consts.Endpoints.SubSystemStatus
+        )
+
+    async def async_zone_status(self) -> Any:
+        return await self.async_request_json(hikaxpro.consts.Endpoints.ZoneStatus)
+
+    async def async_host_status(self) -> Any:
+        return await self.async_request_json(hikaxpro.consts.Endpoints.HostStatus)
+
+    @staticmethod
+    def _sub_id(sub_id: int | None) -> str:
+        return "0xffffffff" if sub_id is None else str(sub_id)
+
+    async def async_arm_home(self, sub_id: int | None = None) -> Any:
+        return await self.async_request_json(
+            hikaxpro.consts.Endpoints.Alarm_ArmHome.replace("{}", self._sub_id(sub_id)),
+            hikaxpro.consts.Method.PUT,
+            priority=PRIORITY_COMMAND,
+        )
+
+    async def async_arm_away(self, sub_id: int | None = None) -> Any:
+        return await self.async_request_json(
+            hikaxpro.consts.Endpoints.Alarm_ArmAway.replace("{}", self._sub_id(sub_id)),
+            hikaxpro.consts.Method.PUT,
+            priority=PRIORITY_COMMAND,
+        )
+
+    async def async_disarm(self, sub_id: int | None = None) -> Any:
+        return await self.async_request_json(
+            hikaxpro.consts.Endpoints.Alarm_Disarm.replace("{}", self._sub_id(sub_id)),
+            hikaxpro.consts.Method.PUT,
+            priority=PRIORITY_COMMAND,
+        )
+
+    async def _async_zone_control(self, endpoint: str, zone_id: int) -> bool:
+        response = await self.async_request(
+            self.build_url(f"{endpoint}{zone_id}", True),
+            hikaxpro.consts.Method.PUT,
+            priority=PRIORITY_COMMAND,
+        )
+        if response.status_code != 200:
+            raise hikaxpro.errors.UnexpectedResponseCodeError(
+                response.status_code, response.text
+            )
+        return True
+
+    async def async_bypass_zone(self, zone_id: int) -> bool:
+        return await self._async_zone_control(
+            hikaxpro.consts.Endpoints.BypassZone, zone_id
+        )
+
+    async def async_recover_bypass_zone(self, zone_id: int) -> bool:
+        response = await self.async_request(
+            self.build_url(
+                f"{hikaxpro.consts.Endpoints.RecoverBypassZone}{zone_id}", True
+            ),
+            hikaxpro.consts.Method.PUT,
+            priority=PRIORITY_COMMAND,
+        )
+        return response.status_code == 200
+
+    async def async_bypass_zones(
+        self,
+        zone_ids: Iterable[int],
+        bypass: bool = True,
+        max_concurrency: int = BYPASS_CONCURRENCY,
+    ) -> dict[int, Exception | None]:
+        """Bypass (or recover) several zones; the error per zone, ``None`` if ok.
+
+        At most ``max_concurrency`` commands are in flight, leaving the other
+        request slots to polls. A failed zone does not stop the others.
+        """
+        endpoint = (
+            hikaxpro.consts.Endpoints.BypassZone
+            if bypass
+            else hikaxpro.consts.Endpoints.RecoverBypassZone
+        )
+        slots = asyncio.Semaphore(max_concurrency)
+
+        async def control(zone_id: int) -> Exception | None:
+            async with slots:
+                try:
+                    await self._async_zone_control(endpoint, zone_id)
+                except (
+                    ConnectionError,
+                    TimeoutError,
+                    hikaxpro.errors.UnexpectedResponseCodeError,
+                ) as err:
+                    return err
+            return None
+
+        zone_ids = list(dict.fromkeys(zone_ids))
+        errors = await asyncio.gather(*(control(zone_id) for zone_id in zone_ids))
+        return dict(zip(zone_ids, errors))
@@ -1,7 +1,7 @@
 import logging
 from enum import Enum
-from dataclasses import dataclass
-from typing import Any, List, Optional, TypeVar, Callable, Type, Union, cast
+from dataclasses import dataclass, field, fields as dataclass_fields, replace
+from typing import Any, Generic, List, Optional, TypeVar, Callable, Type, Union, cast
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +63,411 @@ def to_float(x: Any) -> float:
     return x
 
 
+INT = "int"
+BOOL = "bool"
+STR = "str"
+FLOAT = "float"
+ANY = "any"
+""" Scalar field kinds; enums and model classes are given by their class """
+
+
+class DecodeError(ValueError):
+    """Payload does not match the schema of a model class."""
+
+
+@dataclass(frozen=True, slots=True)
+class Field:
+    """How one dataclass attribute is read from the panel JSON."""
+
+    attr: str
+    key: str
+    kind: Any
+    required: bool = False
+    """ ``None`` is invalid instead of meaning "not reported" """
+    many: bool = False
+    """ JSON list of ``kind`` """
+    tolerant: bool = False
+    """ Invalid values decode as ``default`` instead of failing the object """
+    warn: bool = True
+    """ Log tolerated invalid values """
+    default: Any = None
+    missing: Optional[Callable[[dict], Any]] = None
+    """ Value computed from the whole object when the key is absent """
+    convert: Optional[Callable[[Any], Any]] = None
+    """ Custom check and conversion replacing the ``kind`` based one """
+    lazy: bool = False
+    """ Decode on first access (then always tolerant); needs an ``_undecoded``
+    field. Meant for heavy list / struct fields: the slot keeps the JSON until
+    read """
+
+
+def _invalid(cls_name: str, key: str, value: Any) -> DecodeError:
+    return DecodeError(f"Invalid {cls_name}.{key}: {value!r}")
+
+
+class ParseDiagnostics:
+    """Invalid values tolerated while decoding, counted per anomaly.
+
+    An anomaly is a ``(class, key, value)`` triple. Its first occurrence is
+    logged with the object it came from; later ones are only counted, so an
+    unknown enum value reported on every poll does not flood the log.
+    """
+
+    def __init__(self) -> None:
+        self._counts: dict[tuple[str, str, str], int] = {}
+
+    def record(self, cls_name: str, key: str, value: Any, obj: dict) -> None:
+        anomaly = (cls_name, key, repr(value)[:200])
+        count = self._counts.get(anomaly)
+        if count is None:
+            _LOGGER.warning(
+                "Invalid %s.%s %r (further occurrences are counted in the "
+                "integration diagnostics): %s",
+                cls_name,
+                key,
+                value,
+                obj,
+            )
+            count = 0
+        self._counts[anomaly] = count + 1
+
+    def as_list(self) -> list[dict[str, Any]]:
+        return [
+            {"model": cls_name, "key": key, "value": value, "count": count}
+            for (cls_name, key, value), count in self._counts.items()
+        ]
+
+    def reset(self) -> None:
+        self._counts.clear()
+
+
+parse_diagnostics = ParseDiagnostics()
+""" Shared by all decoders; reset when the integration is set up """
+
+
+def _warn_invalid(cls_name: str, key: str, value: Any, obj: dict) -> None:
+    parse_diagnostics.record(cls_name, key, value, obj)
+
+
+def int_or_int_list(x: Any) -> Union[int, List[int]]:
+    if type(x) is int or (type(x) is list and all(type(y) is int for y in x)):
+        return x
+    raise DecodeError(f"Expected int or list of int: {x!r}")
+
+
+_TYPE_CHECKS = {INT: "int", BOOL: "bool", STR: "str"}
+
+
+def _compile_field(i: int, spec: Field, cls_name: str, ns: dict) -> list[str]:
+    """Source lines decoding ``spec`` into the local ``v{i}``."""
+    v = f"v{i}"
+    ns[f"D{i}"] = spec.default
+    if spec.tolerant:
+        bad = [f"{v} = D{i}"]
+        if spec.warn:
+            bad.insert(0, f"_warn_invalid({cls_name!r}, {spec.key!r}, {v}, obj)")
+    else:
+        bad = [f"raise _invalid({cls_name!r}, {spec.key!r}, {v})"]
+
+    kind = spec.kind
+    check: list[str] = []
+    if spec.convert is not None:
+        ns[f"C{i}"] = spec.convert
+        convert = [f"{v} = C{i}({v})"]
+        check = _guarded(convert, bad) if spec.tolerant else convert
+    elif isinstance(kind, type) and issubclass(kind, Enum):
+        if spec.many:
+            raise TypeError(f"{cls_name}.{spec.attr}: lists of enums")
+        ns[f"E{i}"] = kind._value2member_map_.get
+        check = [
+            f"e = E{i}({v}) if type({v}) is str else None",
+            "if e is None:",
+            *_indent(bad),
+            "else:",
+            f"    {v} = e",
+        ]
+    elif isinstance(kind, type):
+        ns[f"K{i}"] = kind
+        if spec.many:
+            convert = [
+                f"if type({v}) is not list:",
+                *_indent(bad),
+                "else:",
+                f"    {v} = [K{i}.from_dict(x) for x in {v}]",
+            ]
+        else:
+            convert = [f"{v} = K{i}.from_dict({v})"]
+        check = _guarded(convert, bad) if spec.tolerant else convert
+    elif kind == FLOAT:
+        if spec.many:
+            raise TypeError(f"{cls_name}.{spec.attr}: lists of floats")
+        check = [
+            f"if type({v}) is float or type({v}) is int:",
+            f"    {v} = float({v})",
+            "else:",
+            *_indent(bad),
+        ]
+    elif kind in _TYPE_CHECKS:
+        name = _TYPE_CHECKS[kind]
+        if spec.many:
+            cond = (
+                f"type({v}) is not list"
+                f" or not all(type(x) is {name} for x in {v})"
+            )
+        else:
+            cond = f"type({v}) is not {name}"
+        check = [f"if {cond}:", *_indent(bad)]
+    elif kind == ANY:
+        if spec.many:
+            check = [f"if type({v}) is not list:", *_indent(bad)]
+    else:
+        raise TypeError(f"{cls_name}.{spec.attr}: unknown kind {kind!r}")
+
+    lines = [f"{v} = get({spec.key!r})"]
+    if spec.missing is not None:
+        ns[f"M{i}"] = spec.missing
+        none = [f"{v} = M{i}(obj)"]
+    elif spec.required:
+        none = bad
+    elif spec.default is not None:
+        none = [f"{v} = D{i}"]
+    else:
+        none = []
+    if none and check:
+        lines += [f"if {v} is None:", *_indent(none), "else:", *_indent(check)]
+    elif none:
+        lines += [f"if {v} is None:", *_indent(none)]
+    elif check:
+        lines += [f"if {v} is not None:", *_indent(check)]
+    return lines
+
+
+def _guarded(convert: list[str], bad: list[str]) -> list[str]:
+    return ["try:", *_indent(convert), "except Exception:", *_indent(bad)]
+
+
+def _indent(lines: list[str]) -> list[str]:
+    return ["    " + line for line in lines]
+
+
+class LazyAttribute:
+    """Slot of a lazy field, decoded from the raw value it holds on first read.
+
+    ``from_dict`` stores the JSON value itself in the slot and sets the field's
+    ``bit`` in the object's ``_undecoded`` mask; reading decodes the value in
+    place and clears the bit. No container is kept besides the value.
+    """
+
+    __slots__ = ("slot", "key", "bit", "decode")
+
+    def __init__(
+        self, slot: Any, key: str, bit: int, decode: Callable[[dict], Any]
+    ) -> None:
+        self.slot = slot
+        self.key = key
+        self.bit = bit
+        self.decode = decode
+
+    def __get__(self, obj: Any, owner: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if obj._undecoded & self.bit:
+            value = self.decode({self.key: value})
+            self.__set__(obj, value)
+        return value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        self.slot.__set__(obj, value)
+        # ``__init__`` sets the slots before ``_undecoded``.
+        undecoded = getattr(obj, "_undecoded", 0)
+        if undecoded & self.bit:
+            obj._undecoded = undecoded & ~self.bit
+
+    def decoded(self, obj: Any) -> bool:
+        return not obj._undecoded & self.bit
+
+    def unchanged(self, old: Any, new: Any) -> bool:
+        """Compare without decoding while neither side was read yet."""
+        if not self.decoded(old) and not self.decoded(new):
+            return self.slot.__get__(old) == self.slot.__get__(new)
+        return self.__get__(old) == self.__get__(new)
+
+
+def _build(name: str, cls_name: str, body: list[str], ns: dict) -> Callable:
+    source = f"def {name}(obj):\n" + "\n".join(_indent(body))
+    exec(compile(source, f"<schema {cls_name}>", "exec"), ns)
+    return ns[name]
+
+
+def schema(*fields: Field) -> Callable[[Type[T]], Type[T]]:
+    """Compile the ``from_dict`` decoder of a dataclass from its field specs.
+
+    The generated function reads every key once, checks types with plain
+    ``type() is`` comparisons and calls the constructor positionally, so the
+    happy path neither raises nor allocates per field. Lazy fields keep their
+    JSON value undecoded in their slot (flagged in ``_undecoded``) and decode
+    themselves on first access.
+    """
+
+    def decorate(cls: Type[T]) -> Type[T]:
+        name = cls.__name__
+        attrs = [spec.attr for spec in fields]
+        expected = [f.name for f in dataclass_fields(cls) if f.init]
+        if attrs != expected:
+            raise TypeError(f"{name} schema fields {attrs} != {expected}")
+        lazy = [i for i, spec in enumerate(fields) if spec.lazy]
+        if lazy and "_undecoded" not in cls.__dataclass_fields__:
+            raise TypeError(f"{name} has lazy fields but no _undecoded field")
+        ns: dict[str, Any] = {
+            "cls": cls,
+            "DecodeError": DecodeError,
+            "_invalid": _invalid,
+            "_warn_invalid": _warn_invalid,
+        }
+        body = [
+            "if type(obj) is not dict:",
+            f"    raise DecodeError('{name} expects a JSON object')",
+            "get = obj.get",
+        ]
+        for i, spec in enumerate(fields):
+            if not spec.lazy:
+                body += _compile_field(i, spec, name, ns)
+        if lazy:
+            # Skip __init__ so the slots are stored directly instead of
+            # through the lazy descriptors.
+            body.append("o = new(cls)")
+            body += [
+                f"o.{spec.attr} = v{i}"
+                for i, spec in enumerate(fields)
+                if not spec.lazy
+            ]
+            for f in dataclass_fields(cls):
+                if not f.init and f.name != "_undecoded":
+                    ns[f"I_{f.name}"] = f.default
+                    body.append(f"o.{f.name} = I_{f.name}")
+            body.append("undecoded = 0")
+            for bit, i in enumerate(lazy):
+                spec = fields[i]
+                body += [
+                    f"r = get({spec.key!r})",
+                    f"o.{spec.attr} = r",
+                    "if r is not None:",
+                    f"    undecoded |= {1 << bit}",
+                ]
+            body += ["o._undecoded = undecoded", "return o"]
+            ns["new"] = object.__new__
+        else:
+            args = ", ".join(f"v{i}" for i in range(len(fields)))
+            body.append(f"return cls({args})")
+        decoder = _build("from_dict", name, body, ns)
+        decoder.__qualname__ = f"{name}.from_dict"
+        decoder.__doc__ = f"Decode a {name} from panel JSON."
+        cls.__schema__ = fields
+        cls.from_dict = staticmethod(decoder)
+
+        cls.__lazy__ = {}
+        for bit, i in enumerate(lazy):
+            spec = replace(fields[i], tolerant=True)
+            field_ns = dict(ns)
+            lines = _compile_field(i, spec, name, field_ns)
+            body = ["get = obj.get", *lines, f"return v{i}"]
+            decode = _build("decode", name, body, field_ns)
+            attribute = LazyAttribute(
+                cls.__dict__[spec.attr], spec.key, 1 << bit, decode
+            )
+            setattr(cls, spec.attr, attribute)
+            cls.__lazy__[spec.attr] = attribute
+        return cls
+
+    return decorate
+
+
+def list_items(
+    obj: Any, list_key: str, item_key: str, required: bool = False
+) -> List[Any]:
+    """Raw ``item_key`` objects of the ``list_key`` list of a JSON object.
+
+    A missing list is empty unless ``required``; ``None`` marks list entries
+    without the item.
+    """
+    if type(obj) is not dict:
+        raise DecodeError(f"{list_key} container is not a JSON object")
+    items = obj.get(list_key)
+    if items is None and not required:
+        return []
+    if type(items) is not list:
+        raise DecodeError(f"{list_key} is not a list: {items!r}")
+    result = []
+    for item in items:
+        if type(item) is not dict:
+            raise DecodeError(f"Invalid {list_key} entry: {item!r}")
+        result.append(item.get(item_key))
+    return result
+
+
+_NO_CHANGES: frozenset = frozenset()
+
+
+class InstanceCache(Generic[T]):
+    """Decodes device objects by ``id``, reusing the instances of unchanged ones.
+
+    An object equal to the one the previous instance was decoded from yields
+    that same instance, so ``is`` tells whether a device changed. Otherwise a
+    new instance is decoded. Its ``_changed`` holds the fields whose JSON
+    differs from the previous one, or ``None`` when there is nothing to
+    compare against. Instances patched in place must be ``invalidate``d.
+    """
+
+    def __init__(self, cls: Type[T]) -> None:
+        self._cls = cls
+        self._keys = [(spec.key, spec.attr) for spec in cls.__schema__]
+        self._entries: dict[Any, tuple[Optional[dict], T]] = {}
+
+    def decode_all(self, objs: List[Any]) -> List[T]:
+        """Decode ``objs`` (``None`` entries skipped) as the new device set.
+
+        The cache only moves on when every object decoded, so a failure leaves
+        it matching the instances of the last successful call.
+        """
+        entries: dict[Any, tuple[Optional[dict], T]] = {}
+        decoded = []
+        for obj in objs:
+            if obj is None:
+                continue
+            entry = (
+                self._entries.get(obj.get("id")) if type(obj) is dict else None
+            )
+            if entry is not None and entry[0] == obj:
+                instance = entry[1]
+                cast(Any, instance)._changed = _NO_CHANGES
+            else:
+                instance = self._cls.from_dict(obj)
+                previous = entry[0] if entry is not None else None
+                cast(Any, instance)._changed = (
+                    None
+                    if previous is None
+                    else frozenset(
+                        attr
+                        for key, attr in self._keys
+                        if previous.get(key) != obj.get(key)
+                    )
+                )
+            entries[obj.get("id")] = (obj, instance)
+            decoded.append(instance)
+        self._entries = entries
+        return decoded
+
+    def invalidate(self, device_id: Any) -> None:
+        """Decode the device again next time; its instance was modified."""
+        entry = self._entries.get(device_id)
+        if entry is not None:
+            self._entries[device_id] = (None, entry[1])
+
+    def clear(self) -> None:
+        self._entries = {}
+
+
 class AccessModuleType(Enum):
     LOCAL_TRANSMITTER = "localTransmitter"
     MULTI_TRANSMITTER = "multiTransmitter"
@@ -120,6 +525,69 @@ class DetectorType(Enum):
     OTHER = "other"
 
 
+CAP_MAGNET_CONTACT = "magnet_contact"
+CAP_EXTERNAL_MAGNET = "external_magnet"
+CAP_MAGNET_SHOCK = "magnet_shock"
+CAP_HUMIDITY = "humidity"
+""" Detector-specific entity sets a catalog entry enables """
+
+
+@dataclass(frozen=True, slots=True)
+class DeviceModel:
+    """Catalog entry of a known detector model."""
+
+    name: str
+    capabilities: frozenset[str] = frozenset()
+
+
+_MAGNET_CONTACT = frozenset({CAP_MAGNET_CONTACT})
+
+DEVICE_CATALOG: dict[str, DeviceModel] = {
+    "0x00001": DeviceModel("Passive Infrared Detector"),
+    "0x00002": DeviceModel("Wireless Dual-Tech Detector"),
+    "0x00005": DeviceModel("Slim Magnetic Contact", _MAGNET_CONTACT),
+    "0x00006": DeviceModel("Magnetic Contact", _MAGNET_CONTACT),
+    "0x00012": DeviceModel("Wireless PIR CAM Detector"),
+    "0x00015": DeviceModel("Wireless Smoke Detector"),
+    "0x00017": DeviceModel(
+        "Wireless Magnet Shock Detector", frozenset({CAP_MAGNET_SHOCK})
+    ),
+    "0x00018": DeviceModel("Glass Break Detector"),
+    "0x00026": DeviceModel(
+        "Wireless Temperature Humidity Detector", frozenset({CAP_HUMIDITY})
+    ),
+    "0x00027": DeviceModel("Wireless PIR Ceiling Detector"),
+    "0x00028": DeviceModel(
+        "Wireless External Magnet Detector", frozenset({CAP_EXTERNAL_MAGNET})
+    ),
+    "0x00030": DeviceModel("Wireless heat Detector"),
+    "0x00031": DeviceModel("Wireless CO Detector"),
+    "0x00032": DeviceModel("Wireless PIR AM Curtain Detector"),
+    "0x00040": DeviceModel("Wireless Double PIR Detector"),
+}
+""" Known ``model`` IDs reported by zones and peripherals """
+
+DETECTOR_CAPABILITIES: dict[DetectorType, frozenset[str]] = {
+    DetectorType.DOOR_MAGNETIC_CONTACT_DETECTOR: _MAGNET_CONTACT,
+    DetectorType.SLIM_MAGNETIC_CONTACT: _MAGNET_CONTACT,
+    DetectorType.WIRELESS_EXTERNAL_MAGNET_DETECTOR: frozenset({CAP_EXTERNAL_MAGNET}),
+    DetectorType.MAGNET_SHOCK_DETECTOR: frozenset({CAP_MAGNET_SHOCK}),
+    DetectorType.WIRELESS_TEMPERATURE_HUMIDITY_DETECTOR: frozenset({CAP_HUMIDITY}),
+}
+""" Capabilities implied by the configured detector type """
+
+
+def device_capabilities(
+    model_id: Optional[str], detector_type: Optional[DetectorType]
+) -> frozenset[str]:
+    """Detector-specific entity sets of a zone, from its model and type."""
+    entry = DEVICE_CATALOG.get(model_id) if model_id is not None else None
+    by_type = DETECTOR_CAPABILITIES.get(detector_type) if detector_type else None
+    if entry is None:
+        return by_type or frozenset()
+    return entry.capabilities | by_type if by_type else entry.capabilities
+
+
 def zone_device_model(
     model: Optional[str], detector_type: Optional[DetectorType]
 ) -> str:
@@ -132,42 +600,21 @@ def zone_device_model(
 
 
 def detector_model_to_name(model_id: Optional[str]) -> str:
-    if model_id == "0x00001":
-        return "Passive Infrared Detector"
-    if model_id == "0x00002":
-        return "Wireless Dual-Tech Detector"
-    if model_id == "0x00005":
-        return "Slim Magnetic Contact"
-    if model_id == "0x00006":
-        return "Magnetic Contact"
-    if model_id == "0x00012":
-        return "Wireless PIR CAM Detector"
-    if model_id == "0x00015":
-        return "Wireless Smoke Detector"
-    if model_id == "0x00017":
-        return "Wireless Magnet Shock Detector"
-    if model_id == "0x00018":
-        return "Glass Break Detector"
-    if model_id == "0x00026":
-        return "Wireless Temperature Humidity Detector"
-    if model_id == "0x00027":
-        return "Wireless PIR Ceiling Detector"
-    if model_id == "0x00028":
-        return "Wireless External Magnet Detector"
-    if model_id == "0x00030":
-        return "Wireless heat Detector"
-    if model_id == "0x00031":
-        return "Wireless CO Detector"
-    if model_id == "0x00032":
-        return "Wireless PIR AM Curtain Detector"
-    if model_id == "0x00040":
-        return "Wireless Double PIR Detector"
-    if model_id is not None:
-        return str(model_id)
-    return "Unknown"
-
-
-@dataclass
+    if model_id is None:
+        return "Unknown"
+    entry = DEVICE_CATALOG.get(model_id)
+    return str(model_id) if entry is None else entry.name
+
+
+@schema(
+    Field("id", "id", INT, required=True),
+    Field("enabled", "enabled", BOOL, required=True),
+    Field("mode", "mode", STR, required=True),
+    Field("input_zone_id", "inputZoneID", INT),
+    Field("pulse_num", "pulseNum", INT),
+    Field("timeout", "timeout", INT),
+)
+@dataclass(slots=True)
 class InputList:
     id: int
     enabled: bool
@@ -176,17 +623,6 @@ class InputList:
     pulse_num: Optional[int] = None
     timeout: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'InputList':
-        assert isinstance(obj, dict)
-        id = from_int(obj.get("id"))
-        enabled = from_bool(obj.get("enabled"))
-        mode = from_str(obj.get("mode"))
-        input_zone_id = from_union([from_int, from_none], obj.get("inputZoneID"))
-        pulse_num = from_union([from_int, from_none], obj.get("pulseNum"))
-        timeout = from_union([from_int, from_none], obj.get("timeout"))
-        return InputList(id, enabled, mode, input_zone_id, pulse_num, timeout)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["id"] = from_int(self.id)
@@ -244,20 +680,17 @@ class ZoneType(Enum):
     INSTANT = "Instant"
 
 
-@dataclass
+@schema(
+    Field("magnet_open_status", "magnetOpenStatus", BOOL),
+    Field("magnet_shock_status", "magnetShockStatus", BOOL),
+    Field("magnet_tilt_status", "magnetTiltStatus", BOOL),
+)
+@dataclass(slots=True)
 class MagnetShockCurrentStatus:
     magnet_open_status: Optional[bool] = None
     magnet_shock_status: Optional[bool] = None
     magnet_tilt_status: Optional[bool] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'MagnetShockCurrentStatus':
-        assert isinstance(obj, dict)
-        magnet_open_status = from_union([from_bool, from_none], obj.get("magnetOpenStatus"))
-        magnet_shock_status = from_union([from_bool, from_none], obj.get("magnetShockStatus"))
-        magnet_tilt_status = from_union([from_bool, from_none], obj.get("magnetTiltStatus"))
-        return MagnetShockCurrentStatus(magnet_open_status, magnet_shock_status, magnet_tilt_status)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.magnet_open_status is not None:
@@ -269,8 +702,73 @@ class MagnetShockCurrentStatus:
         return result
 
 
-
-@dataclass
+@schema(
+    Field("id", "id", INT, required=True),
+    Field(
+        "name",
+        "name",
+        STR,
+        required=True,
+        missing=lambda obj: f"Zone ID {obj.get('id')}",
+    ),
+    Field("status", "status", Status, required=True, tolerant=True),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("shielded", "shielded", BOOL),
+    Field("bypassed", "bypassed", BOOL),
+    Field("armed", "armed", BOOL, required=True),
+    Field("is_arming", "isArming", BOOL),
+    Field("alarm", "alarm", BOOL),
+    Field("sub_system_no", "subSystemNo", INT),
+    Field(
+        "linkage_sub_system",
+        "linkageSubSystem",
+        INT,
+        many=True,
+        tolerant=True,
+        lazy=True,
+    ),
+    Field("detector_type", "detectorType", DetectorType, tolerant=True),
+    Field("stay_away", "stayAway", BOOL),
+    Field("zone_type", "zoneType", ZoneType, tolerant=True),
+    Field("zone_attrib", "zoneAttrib", ZoneAttrib, tolerant=True),
+    Field("device_no", "deviceNo", INT),
+    Field("abnormal_or_not", "abnormalOrNot", BOOL),
+    Field("charge", "charge", STR),
+    Field("charge_value", "chargeValue", INT),
+    Field("signal", "signal", INT),
+    Field("temperature", "temperature", INT),
+    Field("humidity", "humidity", INT),
+    Field("model", "model", STR),
+    Field("is_via_repeater", "isViaRepeater", BOOL),
+    Field("version", "version", STR),
+    Field("magnet_open_status", "magnetOpenStatus", BOOL),
+    Field("input_list", "InputList", InputList, many=True),
+    Field("is_support_add_type", "isSupportAddType", BOOL),
+    Field(
+        "access_module_type", "accessModuleType", AccessModuleType, tolerant=True
+    ),
+    Field("module_channel", "moduleChannel", INT),
+    Field(
+        "magnet_shock_current_status",
+        "MagnetShockCurrentStatus",
+        MagnetShockCurrentStatus,
+        tolerant=True,
+    ),
+    Field("sensor_status", "sensorStatus", STR),
+    Field("real_signal", "realSignal", INT),
+    Field("signal_type", "signalType", STR),
+    Field("is_masking", "isMasking", BOOL),
+    Field("anti_masking_enabled", "antiMaskingEnabled", BOOL),
+    Field("mounting_type", "mountingType", STR),
+    Field("module_type", "moduleType", STR),
+    Field("related_access_module_id", "relatedAccessModuleID", INT),
+    Field("water_detector_alarm", "waterDetectorAlarm", STR),
+    Field("health_status", "healthStatus", STR),
+    Field("work_mode", "workMode", STR),
+    Field("polling_option_enable", "pollingOptionEnable", BOOL),
+    Field("associate_relay_cfg", "associateRelayCfg", ANY, many=True, lazy=True),
+)
+@dataclass(slots=True)
 class Zone:
     id: int
     name: str
@@ -317,102 +815,13 @@ class Zone:
     polling_option_enable: Optional[bool] = None
     associate_relay_cfg: Optional[List[Any]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'Zone':
-        assert isinstance(obj, dict)
-        id = from_int(obj.get("id"))
-        if obj.get("name") is None:
-            name = f"Zone ID {id}"
-        else:
-            name = from_str(obj.get("name"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        shielded = from_union([from_bool, from_none], obj.get("shielded"))
-        bypassed = from_union([from_bool, from_none], obj.get("bypassed"))
-        armed = from_bool(obj.get("armed"))
-        is_arming = from_union([from_bool, from_none], obj.get("isArming"))
-        alarm = from_union([from_bool, from_none], obj.get("alarm"))
-        sub_system_no = from_union([from_int, from_none], obj.get("subSystemNo"))
-
-        try:
-            linkage_sub_system = from_union([lambda x: from_list(from_int, x), from_none], obj.get("linkageSubSystem"))
-        except:
-            _LOGGER.warning("Invalid zone linkage_sub_system %s", obj.get("linkage_sub_system"))
-            _LOGGER.warning("Zone info: %s", obj)
-            linkage_sub_system = None
-
-        stay_away = from_union([from_bool, from_none], obj.get("stayAway"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        abnormal_or_not = from_union([from_bool, from_none], obj.get("abnormalOrNot"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        charge_value = from_union([from_int, from_none], obj.get("chargeValue"))
-        signal = from_union([from_int, from_none], obj.get("signal"))
-        temperature = from_union([from_int, from_none], obj.get("temperature"))
-        humidity = from_union([from_int, from_none], obj.get("humidity"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        is_via_repeater = from_union([from_bool, from_none], obj.get("isViaRepeater"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        magnet_open_status = from_union([from_bool, from_none], obj.get("magnetOpenStatus"))
-        input_list = from_union([lambda x: from_list(InputList.from_dict, x), from_none], obj.get("InputList"))
-        is_support_add_type = from_union([from_bool, from_none], obj.get("isSupportAddType"))
-        module_channel = from_union([from_int, from_none], obj.get("moduleChannel"))
-        sensor_status = from_union([from_str, from_none], obj.get("sensorStatus"))
-        real_signal = from_union([from_int, from_none], obj.get("realSignal"))
-        signal_type = from_union([from_str, from_none], obj.get("signalType"))
-        is_masking = from_union([from_bool, from_none], obj.get("isMasking"))
-        anti_masking_enabled = from_union([from_bool, from_none], obj.get("antiMaskingEnabled"))
-        mounting_type = from_union([from_str, from_none], obj.get("mountingType"))
-        module_type = from_union([from_str, from_none], obj.get("moduleType"))
-        related_access_module_id = from_union([from_int, from_none], obj.get("relatedAccessModuleID"))
-        water_detector_alarm = from_union([from_str, from_none], obj.get("waterDetectorAlarm"))
-        health_status = from_union([from_str, from_none], obj.get("healthStatus"))
-        work_mode = from_union([from_str, from_none], obj.get("workMode"))
-        polling_option_enable = from_union([from_bool, from_none], obj.get("pollingOptionEnable"))
-        associate_relay_cfg = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("associateRelayCfg"))
+    _undecoded: int = field(default=0, init=False, repr=False, compare=False)
+    """ Bits of the lazy fields whose slot still holds raw JSON """
 
-        try:
-            status = Status(obj.get("status"))
-        except:
-            _LOGGER.warning("Invalid status %s", obj.get("status"))
-            _LOGGER.warning("Detector info: %s", obj)
-            status = None
-        try:
-            detector_type = from_union([DetectorType, from_none], obj.get("detectorType"))
-        except:
-            _LOGGER.warning("Invalid detector type %s", obj.get("detectorType"))
-            _LOGGER.warning("Detector info: %s", obj)
-            detector_type = None
-        try:
-            zone_type = from_union([ZoneType, from_none], obj.get("zoneType"))
-        except:
-            _LOGGER.warning("Invalid zone type %s", obj.get("zoneType"))
-            _LOGGER.warning("Detector info: %s", obj)
-            zone_type = None
-        try:
-            zone_attrib = from_union([ZoneAttrib, from_none], obj.get("zoneAttrib"))
-        except:
-            _LOGGER.warning("Invalid zone attrib %s", obj.get("zoneAttrib"))
-            _LOGGER.warning("Detector info: %s", obj)
-            zone_attrib = None
-        try:
-            access_module_type = from_union([AccessModuleType, from_none], obj.get("accessModuleType"))
-        except:
-            _LOGGER.warning("Invalid accessModuleType %s", obj.get("accessModuleType"))
-            _LOGGER.warning("Detector info: %s", obj)
-            access_module_type = None
-        try:
-            magnet_shock_current_status = from_union([MagnetShockCurrentStatus.from_dict, from_none], obj.get("MagnetShockCurrentStatus"))
-        except:
-            _LOGGER.warning("Invalid MagnetShockCurrentStatus %s", obj.get("MagnetShockCurrentStatus"))
-            _LOGGER.warning("Detector info: %s", obj)
-            magnet_shock_current_status = None
-
-        return Zone(id, name, status, tamper_evident, shielded, bypassed, armed, is_arming, alarm, sub_system_no,
-                    linkage_sub_system, detector_type, stay_away, zone_type, zone_attrib, device_no, abnormal_or_not,
-                    charge, charge_value, signal, temperature, humidity, model, is_via_repeater, version,
-                    magnet_open_status, input_list, is_support_add_type, access_module_type, module_channel,
-                    magnet_shock_current_status, sensor_status, real_signal, signal_type, is_masking,
-                    anti_masking_enabled, mounting_type, module_type, related_access_module_id,
-                    water_detector_alarm, health_status, work_mode, polling_option_enable, associate_relay_cfg)
+    _changed: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """ Fields changed since the previous poll; set by ``InstanceCache`` """
 
     def to_dict(self) -> dict:
         result: dict = {}
@@ -480,32 +889,26 @@ class Zone:
         return result
 
 
-@dataclass
+@schema(
+    Field("zone", "Zone", Zone, required=True),
+)
+@dataclass(slots=True)
 class ZoneListWrap:
     zone: Zone
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ZoneListWrap':
-        assert isinstance(obj, dict)
-        zone = Zone.from_dict(obj.get("Zone"))
-        return ZoneListWrap(zone)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["Zone"] = to_class(Zone, self.zone)
         return result
 
 
-@dataclass
+@schema(
+    Field("zone_list", "ZoneList", ZoneListWrap, required=True, many=True),
+)
+@dataclass(slots=True)
 class ZonesResponse:
     zone_list: List[ZoneListWrap]
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ZonesResponse':
-        assert isinstance(obj, dict)
-        zone_list = from_list(ZoneListWrap.from_dict, obj.get("ZoneList"))
-        return ZonesResponse(zone_list)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["ZoneList"] = from_list(lambda x: to_class(ZoneListWrap, x), self.zone_list)
@@ -520,7 +923,15 @@ class Arming(Enum):
     ARMING = "arming"
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT, required=True),
+    Field("arming", "arming", Arming, required=True, tolerant=True),
+    Field("alarm", "alarm", BOOL, required=True),
+    Field("enabled", "enabled", BOOL, default=True),
+    Field("name", "name", STR),
+    Field("delay_time", "delayTime", INT),
+)
+@dataclass(slots=True)
 class SubSys:
     id: int
     arming: Arming
@@ -529,24 +940,6 @@ class SubSys:
     name: str
     delay_time: int
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'SubSys':
-        assert isinstance(obj, dict)
-        id = from_int(obj.get("id"))
-        try:
-            arming = Arming(obj.get("arming"))
-        except:
-            _LOGGER.warning("Invalid subsys attr arming %s", obj.get("arming"))
-            _LOGGER.warning("Subsys: %s", obj)
-            arming = None
-        alarm = from_bool(obj.get("alarm"))
-        enabled = from_union([from_bool, from_none], obj.get("enabled"))
-        if enabled is None:
-            enabled = True
-        name = from_union([from_str, from_none], obj.get("name"))
-        delay_time = from_union([from_int, from_none], obj.get("delayTime"))
-        return SubSys(id, arming, alarm, enabled, name, delay_time)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["id"] = from_int(self.id)
@@ -558,32 +951,26 @@ class SubSys:
         return result
 
 
-@dataclass
+@schema(
+    Field("sub_sys", "SubSys", SubSys, required=True),
+)
+@dataclass(slots=True)
 class SubSysList:
     sub_sys: SubSys
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'SubSysList':
-        assert isinstance(obj, dict)
-        sub_sys = SubSys.from_dict(obj.get("SubSys"))
-        return SubSysList(sub_sys)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["SubSys"] = to_class(SubSys, self.sub_sys)
         return result
 
 
-@dataclass
+@schema(
+    Field("sub_sys_list", "SubSysList", SubSysList, required=True, many=True),
+)
+@dataclass(slots=True)
 class SubSystemResponse:
     sub_sys_list: List[SubSysList]
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'SubSystemResponse':
-        assert isinstance(obj, dict)
-        sub_sys_list = from_list(SubSysList.from_dict, obj.get("SubSysList"))
-        return SubSystemResponse(sub_sys_list)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["SubSysList"] = from_list(lambda x: to_class(SubSysList, x), self.sub_sys_list)
@@ -610,7 +997,39 @@ class ChimeWarningType(Enum):
     CONTINUOUS = "continuous"
 
 
-@dataclass
+@schema(
+    Field("is_associated", "isAssociated", BOOL, required=True),
+    Field(
+        "support_associated_zone",
+        "supportAssociatedZone",
+        INT,
+        required=True,
+        many=True,
+    ),
+    Field(
+        "already_associated_zone",
+        "alreadyAssociatedZone",
+        ANY,
+        required=True,
+        many=True,
+    ),
+    Field(
+        "support_linkage_channel_id",
+        "supportLinkageChannelID",
+        ANY,
+        required=True,
+        many=True,
+    ),
+    Field(
+        "already_linkage_channel_id",
+        "alreadyLinkageChannelID",
+        ANY,
+        required=True,
+        many=True,
+    ),
+    Field("associate_time", "associateTime", INT, required=True),
+)
+@dataclass(frozen=True, slots=True)
 class CrossZoneCFG:
     is_associated: bool
     support_associated_zone: List[int]
@@ -619,18 +1038,6 @@ class CrossZoneCFG:
     already_linkage_channel_id: List[Any]
     associate_time: int
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'CrossZoneCFG':
-        assert isinstance(obj, dict)
-        is_associated = from_bool(obj.get("isAssociated"))
-        support_associated_zone = from_list(from_int, obj.get("supportAssociatedZone"))
-        already_associated_zone = from_list(lambda x: x, obj.get("alreadyAssociatedZone"))
-        support_linkage_channel_id = from_list(lambda x: x, obj.get("supportLinkageChannelID"))
-        already_linkage_channel_id = from_list(lambda x: x, obj.get("alreadyLinkageChannelID"))
-        associate_time = from_int(obj.get("associateTime"))
-        return CrossZoneCFG(is_associated, support_associated_zone, already_associated_zone, support_linkage_channel_id,
-                            already_linkage_channel_id, associate_time)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["isAssociated"] = from_bool(self.is_associated)
@@ -662,27 +1069,19 @@ class Relator(Enum):
     HOST = "host"
 
 
-@dataclass
+@schema(
+    Field("camera_seq", "cameraSeq", STR, required=True),
+    Field("related_chan", "relatedChan", INT, required=True),
+    Field("linkage_camera_name", "linkageCameraName", STR),
+    Field("relator", "relator", Relator, tolerant=True),
+)
+@dataclass(frozen=True, slots=True)
 class RelatedChan:
     camera_seq: str
     related_chan: int
     linkage_camera_name: Optional[str] = None
     relator: Optional[Relator] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelatedChan':
-        assert isinstance(obj, dict)
-        camera_seq = from_str(obj.get("cameraSeq"))
-        related_chan = from_int(obj.get("relatedChan"))
-        linkage_camera_name = from_union([from_str, from_none], obj.get("linkageCameraName"))
-        try:
-            relator = from_union([Relator, from_none], obj.get("relator"))
-        except:
-            _LOGGER.warning("Invalid relator type %s", obj.get("relator"))
-            _LOGGER.warning("relator info: %s", obj)
-            relator = None
-        return RelatedChan(camera_seq, related_chan, linkage_camera_name, relator)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["cameraSeq"] = from_str(self.camera_seq)
@@ -694,36 +1093,32 @@ class RelatedChan:
         return result
 
 
-@dataclass
+@schema(
+    Field("related_chan", "RelatedChan", RelatedChan, required=True),
+)
+@dataclass(frozen=True, slots=True)
 class RelatedChanList:
     related_chan: RelatedChan
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelatedChanList':
-        assert isinstance(obj, dict)
-        related_chan = RelatedChan.from_dict(obj.get("RelatedChan"))
-        return RelatedChanList(related_chan)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["RelatedChan"] = to_class(RelatedChan, self.related_chan)
         return result
 
 
-@dataclass
+@schema(
+    Field(
+        "support_linkage_zones", "supportLinkageZones", ANY, required=True, many=True
+    ),
+    Field("linkage_zone", "linkageZone", ANY, required=True, many=True),
+    Field("linkage_pircam_name", "linkagePIRCAMName", STR, required=True),
+)
+@dataclass(frozen=True, slots=True)
 class RelatedPIRCAM:
     support_linkage_zones: List[Any]
     linkage_zone: List[Any]
     linkage_pircam_name: str
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelatedPIRCAM':
-        assert isinstance(obj, dict)
-        support_linkage_zones = from_list(lambda x: x, obj.get("supportLinkageZones"))
-        linkage_zone = from_list(lambda x: x, obj.get("linkageZone"))
-        linkage_pircam_name = from_str(obj.get("linkagePIRCAMName"))
-        return RelatedPIRCAM(support_linkage_zones, linkage_zone, linkage_pircam_name)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["supportLinkageZones"] = from_list(lambda x: x, self.support_linkage_zones)
@@ -732,18 +1127,15 @@ class RelatedPIRCAM:
         return result
 
 
-@dataclass
+@schema(
+    Field("support_linkage_zones", "supportLinkageZones", ANY, many=True),
+    Field("linkage_zones", "linkageZones", ANY, many=True),
+)
+@dataclass(frozen=True, slots=True)
 class AlarmSoundInterlink:
     support_linkage_zones: Optional[List[Any]] = None
     linkage_zones: Optional[List[Any]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'AlarmSoundInterlink':
-        assert isinstance(obj, dict)
-        support_linkage_zones = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("supportLinkageZones"))
-        linkage_zones = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("linkageZones"))
-        return AlarmSoundInterlink(support_linkage_zones, linkage_zones)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.support_linkage_zones is not None:
@@ -763,7 +1155,90 @@ class ZoneStatusCFG(Enum):
     TRIGGER_DISARM = "triggerDisArm"
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT, required=True),
+    Field("zone_name", "zoneName", STR, required=True),
+    Field(
+        "detector_type",
+        "detectorType",
+        DetectorType,
+        required=True,
+        tolerant=True,
+        default=DetectorType.OTHER,
+    ),
+    Field("stay_away_enabled", "stayAwayEnabled", BOOL),
+    Field("chime_enabled", "chimeEnabled", BOOL),
+    Field("silent_enabled", "silentEnabled", BOOL),
+    Field("timeout", "timeout", INT),
+    Field("timeout_type", "timeoutType", TimeoutType, tolerant=True),
+    Field("related_chan_list", "RelatedChanList", RelatedChanList, many=True),
+    Field(
+        "new_key_zone_trigger_type_cfg",
+        "newKeyZoneTriggerTypeCfg",
+        NewKeyZoneTriggerTypeCFG,
+        tolerant=True,
+    ),
+    Field("zone_status_cfg", "zoneStatusCfg", ZoneStatusCFG, tolerant=True),
+    Field("double_knock_enabled", "doubleKnockEnabled", BOOL),
+    Field("double_knock_time", "doubleKnockTime", INT),
+    Field("zone_type", "zoneType", ZoneType, tolerant=True),
+    Field("chime_warning_type", "chimeWarningType", ChimeWarningType),
+    Field("relate_detector", "relateDetector", BOOL),
+    Field("sub_system_no", "subSystemNo", INT),
+    Field("linkage_sub_system", "linkageSubSystem", INT, many=True),
+    Field(
+        "support_linkage_sub_system_list", "supportLinkageSubSystemList", INT, many=True
+    ),
+    Field("enter_delay", "enterDelay", INT),
+    Field("exit_delay", "exitDelay", INT),
+    Field("stay_arm_delay_time", "stayArmDelayTime", INT),
+    Field("siren_delay_time", "sirenDelayTime", INT),
+    Field("detector_seq", "detectorSeq", STR),
+    Field("cross_zone_cfg", "CrossZoneCfg", CrossZoneCFG, tolerant=True),
+    Field("arm_no_bypass_enabled", "armNoBypassEnabled", BOOL),
+    Field("related_pircam", "RelatedPIRCAM", RelatedPIRCAM, tolerant=True),
+    Field("arm_mode", "armMode", ArmModeConf),
+    Field("zone_attrib", "zoneAttrib", ZoneAttrib),
+    Field("final_door_exit_enabled", "finalDoorExitEnabled", BOOL),
+    Field("time_restart_enabled", "timeRestartEnabled", BOOL),
+    Field("swinger_limit_activation", "swingerLimitActivation", INT),
+    Field(
+        "detector_wiring_mode", "detectorWiringMode", DetectorWiringMode, tolerant=True
+    ),
+    Field(
+        "detector_access_mode", "detectorAccessMode", DetectorAccessMode, tolerant=True
+    ),
+    Field("anti_masking_enabled", "antiMaskingEnabled", BOOL),
+    Field("am_mode", "AMMode", AMMode, tolerant=True),
+    Field("am_delay_time", "AMDelayTime", INT),
+    Field("pulse_sensitivity", "pulseSensitivity", INT),
+    Field("alarm_resistence", "alarmResistence", FLOAT),
+    Field("tamper_resistence", "tamperResistence", FLOAT),
+    Field("module_channel", "moduleChannel", INT),
+    Field("double_zone_cfg_enable", "doubleZoneCfgEnable", BOOL),
+    Field("access_module_type", "accessModuleType", AccessModuleType, tolerant=True),
+    Field("delay_time", "delayTime", INT),
+    Field("timeout_limit", "timeoutLimit", BOOL),
+    Field("check_time", "checkTime", INT),
+    Field("fault_resistence", "faultResistence", FLOAT),
+    Field("device_no", "deviceNo", INT),
+    Field("model", "model", STR),
+    Field("report_send_delay_time_enabled", "reportSendDelayTimeEnabled", BOOL),
+    Field("report_send_delay_time", "reportSendDelayTime", INT),
+    Field(
+        "alarm_sound_interlink",
+        "AlarmSoundInterlink",
+        AlarmSoundInterlink,
+        tolerant=True,
+    ),
+    Field("address", "address", INT),
+    Field("module_type", "moduleType", STR),
+    Field("support_linkage_keypad_list", "supportLinkageKeypadList", ANY, many=True),
+    Field(
+        "related_keypad_no", "relatedKeypadNo", INT, many=True, convert=int_or_int_list
+    ),
+)
+@dataclass(frozen=True, slots=True)
 class ZoneConfig:
     id: int
     zone_name: str
@@ -823,194 +1298,6 @@ class ZoneConfig:
     # Panels may send a single keypad id (int) or a list of ids
     related_keypad_no: Optional[Union[int, List[int]]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ZoneConfig':
-        assert isinstance(obj, dict)
-        id = from_int(obj.get("id"))
-        zone_name = from_str(obj.get("zoneName"))
-        try:
-            detector_type = DetectorType(obj.get("detectorType"))
-        except:
-            _LOGGER.warning("Invalid detectorType %s", obj.get("detectorType"))
-            _LOGGER.warning("Detector info: %s", obj)
-            detector_type = DetectorType.OTHER
-        try:
-            zone_type = from_union([ZoneType, from_none], obj.get("zoneType"))
-        except:
-            _LOGGER.warning("Invalid zone type %s", obj.get("zoneType"))
-            _LOGGER.warning("Detector info: %s", obj)
-            zone_type = None
-        stay_away_enabled = from_union([from_bool, from_none], obj.get("stayAwayEnabled"))
-        chime_enabled = from_union([from_bool, from_none], obj.get("chimeEnabled"))
-        silent_enabled = from_union([from_bool, from_none], obj.get("silentEnabled"))
-        chime_warning_type = from_union([ChimeWarningType, from_none], obj.get("chimeWarningType"))
-
-        try:
-            timeout_type = from_union([TimeoutType, from_none],
-                                                       obj.get("timeoutType"))
-        except:
-            _LOGGER.warning("Invalid timeout_type %s", obj.get("timeoutType"))
-            _LOGGER.warning("Detector info: %s", obj)
-            timeout_type = None
-
-        timeout = from_union([from_int, from_none], obj.get("timeout"))
-        relate_detector = from_union([from_bool, from_none], obj.get("relateDetector"))
-        related_chan_list = from_union([lambda x: from_list(RelatedChanList.from_dict, x), from_none], obj.get("RelatedChanList"))
-        double_knock_enabled = from_union([from_bool, from_none], obj.get("doubleKnockEnabled"))
-        double_knock_time = from_union([from_int, from_none], obj.get("doubleKnockTime"))
-
-        try:
-            new_key_zone_trigger_type_cfg = from_union([NewKeyZoneTriggerTypeCFG, from_none], obj.get("newKeyZoneTriggerTypeCfg"))
-        except:
-            _LOGGER.warning("Invalid new_key_zone_trigger_type_cfg %s", obj.get("newKeyZoneTriggerTypeCfg"))
-            _LOGGER.warning("Detector info: %s", obj)
-            new_key_zone_trigger_type_cfg = None
-
-        try:
-            zone_status_cfg = from_union([ZoneStatusCFG, from_none], obj.get("zoneStatusCfg"))
-        except:
-            _LOGGER.warning("Invalid zone_status_cfg %s", obj.get("zoneStatusCfg"))
-            _LOGGER.warning("Detector info: %s", obj)
-            zone_status_cfg = None
-
-        sub_system_no = from_union([from_int, from_none], obj.get("subSystemNo"))
-        linkage_sub_system = from_union([lambda x: from_list(from_int, x), from_none], obj.get("linkageSubSystem"))
-        support_linkage_sub_system_list = from_union([lambda x: from_list(from_int, x), from_none],
-                                                     obj.get("supportLinkageSubSystemList"))
-        enter_delay = from_union([from_int, from_none], obj.get("enterDelay"))
-        exit_delay = from_union([from_int, from_none], obj.get("exitDelay"))
-        stay_arm_delay_time = from_union([from_int, from_none], obj.get("stayArmDelayTime"))
-        siren_delay_time = from_union([from_int, from_none], obj.get("sirenDelayTime"))
-        detector_seq = from_union([from_str, from_none], obj.get("detectorSeq"))
-        try:
-            cross_zone_cfg = from_union([CrossZoneCFG.from_dict, from_none], obj.get("CrossZoneCfg"))
-        except:
-            _LOGGER.warning("Invalid CrossZoneCfg %s", obj.get("CrossZoneCfg"))
-            _LOGGER.warning("Detector info: %s", obj)
-            cross_zone_cfg = None
-        arm_no_bypass_enabled = from_union([from_bool, from_none], obj.get("armNoBypassEnabled"))
-        try:
-            related_pircam = from_union([RelatedPIRCAM.from_dict, from_none], obj.get("RelatedPIRCAM"))
-        except:
-            _LOGGER.warning("Invalid relatedPIRCAM %s", obj.get("CrossZoneCfg"))
-            _LOGGER.warning("Detector info: %s", obj)
-            related_pircam = None
-        arm_mode = from_union([ArmModeConf, from_none], obj.get("armMode"))
-        zone_attrib = from_union([ZoneAttrib, from_none], obj.get("zoneAttrib"))
-        final_door_exit_enabled = from_union([from_bool, from_none], obj.get("finalDoorExitEnabled"))
-        time_restart_enabled = from_union([from_bool, from_none], obj.get("timeRestartEnabled"))
-        swinger_limit_activation = from_union([from_int, from_none], obj.get("swingerLimitActivation"))
-        try:
-            detector_wiring_mode = from_union([DetectorWiringMode, from_none], obj.get("detectorWiringMode"))
-        except:
-            _LOGGER.warning("Invalid detector_wiring_mode %s", obj.get("detectorWiringMode"))
-            _LOGGER.warning("Detector info: %s", obj)
-            detector_wiring_mode = None
-        try:
-            detector_access_mode = from_union([DetectorAccessMode, from_none], obj.get("detectorAccessMode"))
-        except:
-            _LOGGER.warning("Invalid detector_access_mode %s", obj.get("detectorAccessMode"))
-            _LOGGER.warning("Detector info: %s", obj)
-            detector_access_mode = None
-        anti_masking_enabled = from_union([from_bool, from_none], obj.get("antiMaskingEnabled"))
-        try:
-            am_mode = from_union([AMMode, from_none], obj.get("AMMode"))
-        except:
-            _LOGGER.warning("Invalid AMMode %s", obj.get("AMMode"))
-            _LOGGER.warning("Detector info: %s", obj)
-            am_mode = None
-        am_delay_time = from_union([from_int, from_none], obj.get("AMDelayTime"))
-        pulse_sensitivity = from_union([from_int, from_none], obj.get("pulseSensitivity"))
-        alarm_resistence = from_union([from_float, from_none], obj.get("alarmResistence"))
-        tamper_resistence = from_union([from_float, from_none], obj.get("tamperResistence"))
-        module_channel = from_union([from_int, from_none], obj.get("moduleChannel"))
-        double_zone_cfg_enable = from_union([from_bool, from_none], obj.get("doubleZoneCfgEnable"))
-        try:
-            access_module_type = from_union([AccessModuleType, from_none], obj.get("accessModuleType"))
-        except:
-            _LOGGER.warning("Invalid accessModuleType %s", obj.get("accessModuleType"))
-            _LOGGER.warning("Zone config: %s", obj)
-            access_module_type = None
-        delay_time = from_union([from_int, from_none], obj.get("delayTime"))
-        timeout_limit = from_union([from_bool, from_none], obj.get("timeoutLimit"))
-        check_time = from_union([from_int, from_none], obj.get("checkTime"))
-        fault_resistence = from_union([from_float, from_none], obj.get("faultResistence"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        report_send_delay_time_enabled = from_union([from_bool, from_none], obj.get("reportSendDelayTimeEnabled"))
-        report_send_delay_time = from_union([from_int, from_none], obj.get("reportSendDelayTime"))
-        try:
-            alarm_sound_interlink = from_union([AlarmSoundInterlink.from_dict, from_none], obj.get("AlarmSoundInterlink"))
-        except:
-            _LOGGER.warning("Invalid AlarmSoundInterlink %s", obj.get("AlarmSoundInterlink"))
-            _LOGGER.warning("Detector info: %s", obj)
-            alarm_sound_interlink = None
-        address = from_union([from_int, from_none], obj.get("address"))
-        module_type = from_union([from_str, from_none], obj.get("moduleType"))
-        support_linkage_keypad_list = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("supportLinkageKeypadList"))
-        related_keypad_no = from_union(
-            [from_int, lambda x: from_list(from_int, x), from_none],
-            obj.get("relatedKeypadNo"),
-        )
-        return ZoneConfig(
-            id,
-            zone_name,
-            detector_type,
-            stay_away_enabled,
-            chime_enabled,
-            silent_enabled,
-            timeout,
-            timeout_type,
-            related_chan_list,
-            new_key_zone_trigger_type_cfg,
-            zone_status_cfg,
-            double_knock_enabled,
-            double_knock_time,
-            zone_type,
-            chime_warning_type,
-            relate_detector,
-            sub_system_no,
-            linkage_sub_system,
-            support_linkage_sub_system_list,
-            enter_delay,
-            exit_delay,
-            stay_arm_delay_time,
-            siren_delay_time,
-            detector_seq,
-            cross_zone_cfg,
-            arm_no_bypass_enabled,
-            related_pircam,
-            arm_mode,
-            zone_attrib,
-            final_door_exit_enabled,
-            time_restart_enabled,
-            swinger_limit_activation,
-            detector_wiring_mode,
-            detector_access_mode,
-            anti_masking_enabled,
-            am_mode,
-            am_delay_time,
-            pulse_sensitivity,
-            alarm_resistence,
-            tamper_resistence,
-            module_channel,
-            double_zone_cfg_enable,
-            access_module_type,
-            delay_time,
-            timeout_limit,
-            check_time,
-            fault_resistence,
-            device_no,
-            model,
-            report_send_delay_time_enabled,
-            report_send_delay_time,
-            alarm_sound_interlink,
-            address,
-            module_type,
-            support_linkage_keypad_list,
-            related_keypad_no,
-        )
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["id"] = from_int(self.id)
@@ -1128,39 +1415,47 @@ class ZoneConfig:
         return result
 
 
-@dataclass
+@schema(
+    Field("zone", "Zone", ZoneConfig, required=True),
+)
+@dataclass(frozen=True, slots=True)
 class ZoneConfListWrap:
     zone: ZoneConfig
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ZoneConfListWrap':
-        assert isinstance(obj, dict)
-        zone = ZoneConfig.from_dict(obj.get("Zone"))
-        return ZoneConfListWrap(zone)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["Zone"] = to_class(ZoneConfig, self.zone)
         return result
 
 
-@dataclass
+@schema(
+    Field("list", "List", ZoneConfListWrap, required=True, many=True),
+)
+@dataclass(frozen=True, slots=True)
 class ZonesConf:
     list: List[ZoneConfListWrap]
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ZonesConf':
-        assert isinstance(obj, dict)
-        list = from_list(ZoneConfListWrap.from_dict, obj.get("List"))
-        return ZonesConf(list)
-
     def to_dict(self) -> dict:
         result: dict = {}
         result["List"] = from_list(lambda x: to_class(ZoneConfListWrap, x), self.list)
         return result
 
 
-@dataclass
+@schema(
+    Field("alarm_type", "alarmType", ANY, many=True),
+    Field("support_associated_zone", "supportAssociatedZone", INT, many=True),
+    Field("associate_zone_cfg", "associateZoneCfg", ANY, many=True),
+    Field("support_disarm_linkage_zone", "supportDisarmLinkageZone", ANY, many=True),
+    Field("disarm_linkage_zone", "disarmLinkageZone", ANY, many=True),
+    Field("support_linkage_channel_id", "supportLinkageChannelID", ANY, many=True),
+    Field("linkage_channel_id", "linkageChannelID", ANY, many=True),
+    Field("alarm_logic", "alarmLogic", STR),
+    Field("relay_mode", "relayMode", STR),
+    Field("pulse_duration", "pulseDuration", INT),
+    Field("contact_status", "contactStatus", STR),
+    Field("zone_temperature", "zoneTemperature", ANY, many=True),
+)
+@dataclass(frozen=True, slots=True)
 class AlarmCFG:
     alarm_type: Optional[List[Any]] = None
     support_associated_zone: Optional[List[int]] = None
@@ -1175,23 +1470,6 @@ class AlarmCFG:
     contact_status: Optional[str] = None
     zone_temperature: Optional[List[Any]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'AlarmCFG':
-        assert isinstance(obj, dict)
-        alarm_type = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("alarmType"))
-        support_associated_zone = from_union([lambda x: from_list(from_int, x), from_none], obj.get("supportAssociatedZone"))
-        associate_zone_cfg = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("associateZoneCfg"))
-        support_disarm_linkage_zone = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("supportDisarmLinkageZone"))
-        disarm_linkage_zone = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("disarmLinkageZone"))
-        support_linkage_channel_id = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("supportLinkageChannelID"))
-        linkage_channel_id = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("linkageChannelID"))
-        alarm_logic = from_union([from_str, from_none], obj.get("alarmLogic"))
-        relay_mode = from_union([from_str, from_none], obj.get("relayMode"))
-        pulse_duration = from_union([from_int, from_none], obj.get("pulseDuration"))
-        contact_status = from_union([from_str, from_none], obj.get("contactStatus"))
-        zone_temperature = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("zoneTemperature"))
-        return AlarmCFG(alarm_type, support_associated_zone, associate_zone_cfg, support_disarm_linkage_zone, disarm_linkage_zone, support_linkage_channel_id, linkage_channel_id, alarm_logic, relay_mode, pulse_duration, contact_status, zone_temperature)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.alarm_type is not None:
@@ -1221,7 +1499,14 @@ class AlarmCFG:
         return result
 
 
-@dataclass
+@schema(
+    Field("arm_type", "armType", ANY, many=True),
+    Field("relay_mode", "relayMode", STR),
+    Field("pulse_duration", "pulseDuration", INT),
+    Field("contact_status", "contactStatus", STR),
+    Field("fault_type", "faultType", ANY, many=True),
+)
+@dataclass(frozen=True, slots=True)
 class CFG:
     arm_type: Optional[List[Any]] = None
     relay_mode: Optional[str] = None
@@ -1229,16 +1514,6 @@ class CFG:
     contact_status: Optional[str] = None
     fault_type: Optional[List[Any]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'CFG':
-        assert isinstance(obj, dict)
-        arm_type = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("armType"))
-        relay_mode = from_union([from_str, from_none], obj.get("relayMode"))
-        pulse_duration = from_union([from_int, from_none], obj.get("pulseDuration"))
-        contact_status = from_union([from_str, from_none], obj.get("contactStatus"))
-        fault_type = from_union([lambda x: from_list(lambda x: x, x), from_none], obj.get("faultType"))
-        return CFG(arm_type, relay_mode, pulse_duration, contact_status, fault_type)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.arm_type is not None:
@@ -1254,18 +1529,15 @@ class CFG:
         return result
 
 
-@dataclass
+@schema(
+    Field("relay_mode", "relayMode", STR),
+    Field("pulse_duration", "pulseDuration", INT),
+)
+@dataclass(frozen=True, slots=True)
 class ManualCFG:
     relay_mode: Optional[str] = None
     pulse_duration: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ManualCFG':
-        assert isinstance(obj, dict)
-        relay_mode = from_union([from_str, from_none], obj.get("relayMode"))
-        pulse_duration = from_union([from_int, from_none], obj.get("pulseDuration"))
-        return ManualCFG(relay_mode, pulse_duration)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.relay_mode is not None:
@@ -1275,7 +1547,14 @@ class ManualCFG:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("enabled", "enabled", BOOL),
+    Field("contact_status", "contactStatus", STR),
+    Field("begin_time", "beginTime", STR),
+    Field("end_time", "endTime", STR),
+)
+@dataclass(frozen=True, slots=True)
 class TimeSegment:
     id: Optional[int] = None
     enabled: Optional[bool] = None
@@ -1283,16 +1562,6 @@ class TimeSegment:
     begin_time: Optional[str] = None
     end_time: Optional[str] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'TimeSegment':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        enabled = from_union([from_bool, from_none], obj.get("enabled"))
-        contact_status = from_union([from_str, from_none], obj.get("contactStatus"))
-        begin_time = from_union([from_str, from_none], obj.get("beginTime"))
-        end_time = from_union([from_str, from_none], obj.get("endTime"))
-        return TimeSegment(id, enabled, contact_status, begin_time, end_time)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.id is not None:
@@ -1308,16 +1577,13 @@ class TimeSegment:
         return result
 
 
-@dataclass
+@schema(
+    Field("time_segment", "timeSegment", TimeSegment),
+)
+@dataclass(frozen=True, slots=True)
 class ScheduleCFG:
     time_segment: Optional[TimeSegment] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ScheduleCFG':
-        assert isinstance(obj, dict)
-        time_segment = from_union([TimeSegment.from_dict, from_none], obj.get("timeSegment"))
-        return ScheduleCFG(time_segment)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.time_segment is not None:
@@ -1325,7 +1591,33 @@ class ScheduleCFG:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("name", "name", STR),
+    Field("related", "related", BOOL),
+    Field("access_module_type", "accessModuleType", STR),
+    Field("module_channel", "moduleChannel", INT),
+    Field("sub_system", "subSystem", INT, many=True),
+    Field("scenario_type", "scenarioType", STR, many=True),
+    Field("alarm_cfg", "alarmCfg", AlarmCFG, tolerant=True, warn=False),
+    Field(
+        "schedule_cfg", "scheduleCfg", ScheduleCFG, many=True, tolerant=True, warn=False
+    ),
+    Field("arm_cfg", "armCfg", CFG, tolerant=True, warn=False),
+    Field("disarm_cfg", "disarmCfg", CFG, tolerant=True, warn=False),
+    Field("clear_alarm_cfg", "clearAlarmCfg", CFG, tolerant=True, warn=False),
+    Field("fault_cfg", "faultCfg", CFG, tolerant=True, warn=False),
+    Field("manual_cfg", "manualCfg", ManualCFG, tolerant=True, warn=False),
+    Field("original_status", "OriginalStatus", STR),
+    Field(
+        "support_linkage_sub_system_list", "supportLinkageSubSystemList", INT, many=True
+    ),
+    Field("relay_attrib", "relayAttrib", STR),
+    Field("output_module_no", "outputModuleNo", INT),
+    Field("channel_no", "channelNo", INT),
+    Field("device_no", "deviceNo", INT),
+)
+@dataclass(frozen=True, slots=True)
 class RelaySwitchConf:
     id: Optional[int] = None
     name: Optional[str] = None
@@ -1348,52 +1640,6 @@ class RelaySwitchConf:
     channel_no: Optional[int] = None
     device_no: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelaySwitchConf':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        related = from_union([from_bool, from_none], obj.get("related"))
-        access_module_type = from_union([from_str, from_none], obj.get("accessModuleType"))
-        module_channel = from_union([from_int, from_none], obj.get("moduleChannel"))
-        sub_system = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystem"))
-        scenario_type = from_union([lambda x: from_list(from_str, x), from_none], obj.get("scenarioType"))
-        try:
-            alarm_cfg = from_union([AlarmCFG.from_dict, from_none], obj.get("alarmCfg"))
-        except:
-            alarm_cfg = None
-        try:
-            schedule_cfg = from_union([lambda x: from_list(ScheduleCFG.from_dict, x), from_none], obj.get("scheduleCfg"))
-        except:
-            schedule_cfg = None
-        try:
-            arm_cfg = from_union([CFG.from_dict, from_none], obj.get("armCfg"))
-        except:
-            arm_cfg = None
-        try:
-            disarm_cfg = from_union([CFG.from_dict, from_none], obj.get("disarmCfg"))
-        except:
-            disarm_cfg = None
-        try:
-            clear_alarm_cfg = from_union([CFG.from_dict, from_none], obj.get("clearAlarmCfg"))
-        except:
-            clear_alarm_cfg = None
-        try:
-            fault_cfg = from_union([CFG.from_dict, from_none], obj.get("faultCfg"))
-        except:
-            fault_cfg = None
-        try:
-            manual_cfg = from_union([ManualCFG.from_dict, from_none], obj.get("manualCfg"))
-        except:
-            manual_cfg = None
-        original_status = from_union([from_str, from_none], obj.get("OriginalStatus"))
-        support_linkage_sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("supportLinkageSubSystemList"))
-        relay_attrib = from_union([from_str, from_none], obj.get("relayAttrib"))
-        output_module_no = from_union([from_int, from_none], obj.get("outputModuleNo"))
-        channel_no = from_union([from_int, from_none], obj.get("channelNo"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        return RelaySwitchConf(id, name, related, access_module_type, module_channel, sub_system, scenario_type, alarm_cfg, schedule_cfg, arm_cfg, disarm_cfg, clear_alarm_cfg, fault_cfg, manual_cfg, original_status, support_linkage_sub_system_list, relay_attrib, output_module_no, channel_no, device_no)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.id is not None:
@@ -1439,16 +1685,13 @@ class RelaySwitchConf:
         return result
 
 
-@dataclass
+@schema(
+    Field("output", "Output", RelaySwitchConf),
+)
+@dataclass(frozen=True, slots=True)
 class OutputConfListWrap:
     output: Optional[RelaySwitchConf] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'OutputConfListWrap':
-        assert isinstance(obj, dict)
-        output = from_union([RelaySwitchConf.from_dict, from_none], obj.get("Output"))
-        return OutputConfListWrap(output)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.output is not None:
@@ -1456,16 +1699,13 @@ class OutputConfListWrap:
         return result
 
 
-@dataclass
+@schema(
+    Field("list", "List", OutputConfListWrap, many=True),
+)
+@dataclass(frozen=True, slots=True)
 class OutputConfList:
     list: Optional[List[OutputConfListWrap]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'OutputConfList':
-        assert isinstance(obj, dict)
-        list = from_union([lambda x: from_list(OutputConfListWrap.from_dict, x), from_none], obj.get("List"))
-        return OutputConfList(list)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.list is not None:
@@ -1473,7 +1713,6 @@ class OutputConfList:
         return result
 
 
-
 class RelayAttrib(Enum):
     WIRED = "wired"
     WIRELESS = "wireless"
@@ -1500,7 +1739,18 @@ def relay_status_is_on(status: Optional[object]) -> bool:
     return False
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("name", "name", STR),
+    Field("status", "status", RelayStatusEnum, tolerant=True, warn=False),
+    Field("access_module_type", "accessModuleType", STR),
+    Field("module_channel", "moduleChannel", INT),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("scenario_type", "scenarioType", STR, many=True),
+    Field("relay_attrib", "relayAttrib", RelayAttrib, tolerant=True, warn=False),
+    Field("device_no", "deviceNo", INT),
+)
+@dataclass(slots=True)
 class RelayStatus:
     id: Optional[int] = None
     name: Optional[str] = None
@@ -1512,26 +1762,6 @@ class RelayStatus:
     relay_attrib: Optional[RelayAttrib] = None
     device_no: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelayStatus':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        try:
-            status = from_union([RelayStatusEnum, from_none], obj.get("status"))
-        except:
-            status = None
-        access_module_type = from_union([from_str, from_none], obj.get("accessModuleType"))
-        module_channel = from_union([from_int, from_none], obj.get("moduleChannel"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        scenario_type = from_union([lambda x: from_list(from_str, x), from_none], obj.get("scenarioType"))
-        try:
-            relay_attrib = from_union([RelayAttrib, from_none], obj.get("relayAttrib"))
-        except:
-            relay_attrib = None
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        return RelayStatus(id, name, status, access_module_type, module_channel, sub_system_list, scenario_type, relay_attrib, device_no)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.id is not None:
@@ -1555,16 +1785,13 @@ class RelayStatus:
         return result
 
 
-@dataclass
+@schema(
+    Field("output", "Output", RelayStatus),
+)
+@dataclass(slots=True)
 class RelayStatusList:
     output: Optional[RelayStatus] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelayStatusList':
-        assert isinstance(obj, dict)
-        output = from_union([RelayStatus.from_dict, from_none], obj.get("Output"))
-        return RelayStatusList(output)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.output is not None:
@@ -1572,7 +1799,14 @@ class RelayStatusList:
         return result
 
 
-@dataclass
+@schema(
+    Field("search_id", "searchID", STR),
+    Field("response_status_strg", "responseStatusStrg", STR),
+    Field("num_of_matches", "numOfMatches", INT),
+    Field("total_matches", "totalMatches", INT),
+    Field("output_list", "OutputList", RelayStatusList, many=True),
+)
+@dataclass(slots=True)
 class RelayStatusSearch:
     search_id: Optional[str] = None
     response_status_strg: Optional[str] = None
@@ -1580,16 +1814,6 @@ class RelayStatusSearch:
     total_matches: Optional[int] = None
     output_list: Optional[List[RelayStatusList]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelayStatusSearch':
-        assert isinstance(obj, dict)
-        search_id = from_union([from_str, from_none], obj.get("searchID"))
-        response_status_strg = from_union([from_str, from_none], obj.get("responseStatusStrg"))
-        num_of_matches = from_union([from_int, from_none], obj.get("numOfMatches"))
-        total_matches = from_union([from_int, from_none], obj.get("totalMatches"))
-        output_list = from_union([lambda x: from_list(RelayStatusList.from_dict, x), from_none], obj.get("OutputList"))
-        return RelayStatusSearch(search_id, response_status_strg, num_of_matches, total_matches, output_list)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.search_id is not None:
@@ -1605,16 +1829,13 @@ class RelayStatusSearch:
         return result
 
 
-@dataclass
+@schema(
+    Field("output_search", "OutputSearch", RelayStatusSearch),
+)
+@dataclass(slots=True)
 class RelayStatusSearchResponse:
     output_search: Optional[RelayStatusSearch] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelayStatusSearchResponse':
-        assert isinstance(obj, dict)
-        output_search = from_union([RelayStatusSearch.from_dict, from_none], obj.get("OutputSearch"))
-        return RelayStatusSearchResponse(output_search)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.output_search is not None:
@@ -1622,7 +1843,17 @@ class RelayStatusSearchResponse:
         return result
 
 
-@dataclass
+@schema(
+    Field("request_url", "requestURL", STR),
+    Field("status_code", "statusCode", INT),
+    Field("status_string", "statusString", STR),
+    Field("sub_status_code", "subStatusCode", STR),
+    Field("error_code", "errorCode", INT),
+    Field("error_msg", "errorMsg", STR),
+    Field("m_err_code", "MErrCode", STR),
+    Field("m_err_dev_self_ex", "MErrDevSelfEx", STR),
+)
+@dataclass(frozen=True, slots=True)
 class JSONResponseStatus:
     request_url: Optional[str] = None
     status_code: Optional[int] = None
@@ -1633,19 +1864,6 @@ class JSONResponseStatus:
     m_err_code: Optional[str] = None
     m_err_dev_self_ex: Optional[str] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'JSONResponseStatus':
-        assert isinstance(obj, dict)
-        request_url = from_union([from_str, from_none], obj.get("requestURL"))
-        status_code = from_union([from_int, from_none], obj.get("statusCode"))
-        status_string = from_union([from_str, from_none], obj.get("statusString"))
-        sub_status_code = from_union([from_str, from_none], obj.get("subStatusCode"))
-        error_code = from_union([from_int, from_none], obj.get("errorCode"))
-        error_msg = from_union([from_str, from_none], obj.get("errorMsg"))
-        m_err_code = from_union([from_str, from_none], obj.get("MErrCode"))
-        m_err_dev_self_ex = from_union([from_str, from_none], obj.get("MErrDevSelfEx"))
-        return JSONResponseStatus(request_url, status_code, status_string, sub_status_code, error_code, error_msg, m_err_code, m_err_dev_self_ex)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.request_url is not None:
@@ -1667,10 +1885,23 @@ class JSONResponseStatus:
         return result
 
 
-
-
-
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("seq", "seq", STR),
+    Field("name", "name", STR),
+    Field("status", "status", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("charge", "charge", STR),
+    Field("signal", "signal", INT),
+    Field("model", "model", STR),
+    Field("temperature", "temperature", INT),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("is_via_repeater", "isViaRepeater", BOOL),
+    Field("repeater_name", "repeaterName", STR),
+    Field("version", "version", STR),
+    Field("device_no", "deviceNo", INT),
+)
+@dataclass(slots=True)
 class CardReader:
     id: Optional[int] = None
     seq: Optional[str] = None
@@ -1687,25 +1918,6 @@ class CardReader:
     version: Optional[str] = None
     device_no: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'CardReader':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        seq = from_union([from_str, from_none], obj.get("seq"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        signal = from_union([from_int, from_none], obj.get("signal"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        temperature = from_union([from_int, from_none], obj.get("temperature"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        is_via_repeater = from_union([from_bool, from_none], obj.get("isViaRepeater"))
-        repeater_name = from_union([from_str, from_none], obj.get("repeaterName"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        return CardReader(id, seq, name, status, tamper_evident, charge, signal, model, temperature, sub_system_list, is_via_repeater, repeater_name, version, device_no)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.id is not None:
@@ -1739,16 +1951,13 @@ class CardReader:
         return result
 
 
-@dataclass
+@schema(
+    Field("card_reader", "CardReader", CardReader),
+)
+@dataclass(slots=True)
 class CardReaderList:
     card_reader: Optional[CardReader] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'CardReaderList':
-        assert isinstance(obj, dict)
-        card_reader = from_union([CardReader.from_dict, from_none], obj.get("CardReader"))
-        return CardReaderList(card_reader)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.card_reader is not None:
@@ -1756,20 +1965,17 @@ class CardReaderList:
         return result
 
 
-@dataclass
+@schema(
+    Field("output_id", "outputID", INT),
+    Field("status", "status", STR),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+)
+@dataclass(slots=True)
 class ExtensionModuleOutputList:
     output_id: Optional[int] = None
     status: Optional[str] = None
     sub_system_list: Optional[List[int]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ExtensionModuleOutputList':
-        assert isinstance(obj, dict)
-        output_id = from_union([from_int, from_none], obj.get("outputID"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        return ExtensionModuleOutputList(output_id, status, sub_system_list)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.output_id is not None:
@@ -1781,7 +1987,24 @@ class ExtensionModuleOutputList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("name", "name", STR),
+    Field("address", "address", INT),
+    Field("linkage_address", "linkageAddress", INT),
+    Field("type", "type", STR),
+    Field("status", "status", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("module_attrib", "moduleAttrib", STR),
+    Field("charge", "charge", STR),
+    Field("model", "model", STR),
+    Field("detail_type", "detailType", STR),
+    Field("device_no", "deviceNo", INT),
+    Field("version", "version", STR),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("output_list", "OutputList", ExtensionModuleOutputList, many=True),
+)
+@dataclass(slots=True)
 class ExtensionModule:
     id: Optional[int] = None
     name: Optional[str] = None
@@ -1799,25 +2022,10 @@ class ExtensionModule:
     sub_system_list: Optional[List[int]] = None
     output_list: Optional[List[ExtensionModuleOutputList]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ExtensionModule':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        address = from_union([from_int, from_none], obj.get("address"))
-        linkage_address = from_union([from_int, from_none], obj.get("linkageAddress"))
-        type = from_union([from_str, from_none], obj.get("type"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        module_attrib = from_union([from_str, from_none], obj.get("moduleAttrib"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        detail_type = from_union([from_str, from_none], obj.get("detailType"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        output_list = from_union([lambda x: from_list(ExtensionModuleOutputList.from_dict, x), from_none], obj.get("OutputList"))
-        return ExtensionModule(id, name, address, linkage_address, type, status, tamper_evident, module_attrib, charge, model, detail_type, device_no, version, sub_system_list, output_list)
+    _changed: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """ Fields changed since the previous poll; set by ``InstanceCache`` """
 
     def to_dict(self) -> dict:
         result: dict = {}
@@ -1854,16 +2062,13 @@ class ExtensionModule:
         return result
 
 
-@dataclass
+@schema(
+    Field("extension_module", "ExtensionModule", ExtensionModule),
+)
+@dataclass(slots=True)
 class ExtensionList:
     extension_module: Optional[ExtensionModule] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ExtensionList':
-        assert isinstance(obj, dict)
-        extension_module = from_union([ExtensionModule.from_dict, from_none], obj.get("ExtensionModule"))
-        return ExtensionList(extension_module)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.extension_module is not None:
@@ -1871,7 +2076,34 @@ class ExtensionList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("seq", "seq", STR),
+    Field("name", "name", STR),
+    Field("status", "status", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("keypad_attrib", "keypadAttrib", STR),
+    Field("charge", "charge", STR),
+    Field("signal", "signal", INT),
+    Field("address", "address", INT),
+    Field("model", "model", STR),
+    Field("temperature", "temperature", INT),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("is_via_repeater", "isViaRepeater", BOOL),
+    Field("repeater_name", "repeaterName", STR),
+    Field("version", "version", STR),
+    Field("smoke_detector_alarm", "smokeDetectorAlarm", STR),
+    Field("smoke_detector_power_supply", "smokeDetectorPowerSupply", STR),
+    Field("power_supply", "powerSupply", STR),
+    Field("main_power_supply", "mainPowerSupply", BOOL),
+    Field("type", "type", STR),
+    Field("device_no", "deviceNo", INT),
+    Field("charge_value", "chargeValue", INT),
+    Field("real_signal", "realSignal", INT),
+    Field("signal_type", "signalType", STR),
+    Field("abnormal_or_not", "abnormalOrNot", BOOL),
+)
+@dataclass(slots=True)
 class Keypad:
     id: Optional[int] = None
     seq: Optional[str] = None
@@ -1899,35 +2131,10 @@ class Keypad:
     signal_type: Optional[str] = None
     abnormal_or_not: Optional[bool] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'Keypad':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        seq = from_union([from_str, from_none], obj.get("seq"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        keypad_attrib = from_union([from_str, from_none], obj.get("keypadAttrib"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        signal = from_union([from_int, from_none], obj.get("signal"))
-        address = from_union([from_int, from_none], obj.get("address"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        temperature = from_union([from_int, from_none], obj.get("temperature"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        is_via_repeater = from_union([from_bool, from_none], obj.get("isViaRepeater"))
-        repeater_name = from_union([from_str, from_none], obj.get("repeaterName"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        smoke_detector_alarm = from_union([from_str, from_none], obj.get("smokeDetectorAlarm"))
-        smoke_detector_power_supply = from_union([from_str, from_none], obj.get("smokeDetectorPowerSupply"))
-        power_supply = from_union([from_str, from_none], obj.get("powerSupply"))
-        main_power_supply = from_union([from_bool, from_none], obj.get("mainPowerSupply"))
-        type = from_union([from_str, from_none], obj.get("type"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        charge_value = from_union([from_int, from_none], obj.get("chargeValue"))
-        real_signal = from_union([from_int, from_none], obj.get("realSignal"))
-        signal_type = from_union([from_str, from_none], obj.get("signalType"))
-        abnormal_or_not = from_union([from_bool, from_none], obj.get("abnormalOrNot"))
-        return Keypad(id, seq, name, status, tamper_evident, keypad_attrib, charge, signal, address, model, temperature, sub_system_list, is_via_repeater, repeater_name, version, smoke_detector_alarm, smoke_detector_power_supply, power_supply, main_power_supply, type, device_no, charge_value, real_signal, signal_type, abnormal_or_not)
+    _changed: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """ Fields changed since the previous poll; set by ``InstanceCache`` """
 
     def to_dict(self) -> dict:
         result: dict = {}
@@ -1984,16 +2191,13 @@ class Keypad:
         return result
 
 
-@dataclass
+@schema(
+    Field("keypad", "Keypad", Keypad),
+)
+@dataclass(slots=True)
 class KeypadList:
     keypad: Optional[Keypad] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'KeypadList':
-        assert isinstance(obj, dict)
-        keypad = from_union([Keypad.from_dict, from_none], obj.get("Keypad"))
-        return KeypadList(keypad)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.keypad is not None:
@@ -2001,7 +2205,26 @@ class KeypadList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("name", "name", STR),
+    Field("status", "status", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("charge", "charge", STR),
+    Field("linkage", "linkage", STR),
+    Field("signal", "signal", INT),
+    Field("temperature", "temperature", INT),
+    Field("version", "version", STR),
+    Field("access_module_type", "accessModuleType", STR),
+    Field("related_access_module_id", "relatedAccessModuleID", INT),
+    Field("address", "address", INT),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("scenario_type", "scenarioType", STR, many=True),
+    Field("relay_attrib", "relayAttrib", STR),
+    Field("device_no", "deviceNo", INT),
+    Field("charge_value", "chargeValue", INT),
+)
+@dataclass(slots=True)
 class OutputStatusFull:
     id: Optional[int] = None
     name: Optional[str] = None
@@ -2021,27 +2244,10 @@ class OutputStatusFull:
     device_no: Optional[int] = None
     charge_value: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'OutputStatusFull':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        linkage = from_union([from_str, from_none], obj.get("linkage"))
-        signal = from_union([from_int, from_none], obj.get("signal"))
-        temperature = from_union([from_int, from_none], obj.get("temperature"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        access_module_type = from_union([from_str, from_none], obj.get("accessModuleType"))
-        related_access_module_id = from_union([from_int, from_none], obj.get("relatedAccessModuleID"))
-        address = from_union([from_int, from_none], obj.get("address"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        scenario_type = from_union([lambda x: from_list(from_str, x), from_none], obj.get("scenarioType"))
-        relay_attrib = from_union([from_str, from_none], obj.get("relayAttrib"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        charge_value = from_union([from_int, from_none], obj.get("chargeValue"))
-        return OutputStatusFull(id, name, status, tamper_evident, charge, linkage, signal, temperature, version, access_module_type, related_access_module_id, address, sub_system_list, scenario_type, relay_attrib, device_no, charge_value)
+    _changed: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """ Fields changed since the previous poll; set by ``InstanceCache`` """
 
     def to_dict(self) -> dict:
         result: dict = {}
@@ -2082,16 +2288,13 @@ class OutputStatusFull:
         return result
 
 
-@dataclass
+@schema(
+    Field("output", "Output", OutputStatusFull),
+)
+@dataclass(slots=True)
 class ExDevStatusOutputList:
     output: Optional[OutputStatusFull] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ExDevStatusOutputList':
-        assert isinstance(obj, dict)
-        output = from_union([OutputStatusFull.from_dict, from_none], obj.get("Output"))
-        return ExDevStatusOutputList(output)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.output is not None:
@@ -2099,7 +2302,14 @@ class ExDevStatusOutputList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("status", "status", STR),
+    Field("name", "name", STR),
+    Field("sub_system", "subSystem", INT, many=True),
+    Field("scenario_type", "scenarioType", STR, many=True),
+)
+@dataclass(slots=True)
 class RelayList:
     id: Optional[int] = None
     status: Optional[str] = None
@@ -2107,16 +2317,6 @@ class RelayList:
     sub_system: Optional[List[int]] = None
     scenario_type: Optional[List[str]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RelayList':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        sub_system = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystem"))
-        scenario_type = from_union([lambda x: from_list(from_str, x), from_none], obj.get("scenarioType"))
-        return RelayList(id, status, name, sub_system, scenario_type)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.id is not None:
@@ -2132,7 +2332,30 @@ class RelayList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("seq", "seq", STR),
+    Field("status", "status", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("charge", "charge", STR),
+    Field("signal", "signal", INT),
+    Field("model", "model", STR),
+    Field("temperature", "temperature", INT),
+    Field("is_via_repeater", "isViaRepeater", BOOL),
+    Field("repeater_name", "repeaterName", STR),
+    Field("volt_value", "voltValue", INT),
+    Field("current_value", "currentValue", INT),
+    Field("power_load", "powerLoad", INT),
+    Field("energy_sum_vaule", "energySumVaule", INT),
+    Field("relay_list", "relayList", RelayList, many=True),
+    Field("volt_value_v20", "voltValueV20", FLOAT),
+    Field("device_no", "deviceNo", INT),
+    Field("version", "version", STR),
+    Field("real_signal", "realSignal", INT),
+    Field("signal_type", "signalType", STR),
+    Field("abnormal_or_not", "abnormalOrNot", BOOL),
+)
+@dataclass(slots=True)
 class OutputMod:
     id: Optional[int] = None
     seq: Optional[str] = None
@@ -2156,32 +2379,6 @@ class OutputMod:
     signal_type: Optional[str] = None
     abnormal_or_not: Optional[bool] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'OutputMod':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        seq = from_union([from_str, from_none], obj.get("seq"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        signal = from_union([from_int, from_none], obj.get("signal"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        temperature = from_union([from_int, from_none], obj.get("temperature"))
-        is_via_repeater = from_union([from_bool, from_none], obj.get("isViaRepeater"))
-        repeater_name = from_union([from_str, from_none], obj.get("repeaterName"))
-        volt_value = from_union([from_int, from_none], obj.get("voltValue"))
-        current_value = from_union([from_int, from_none], obj.get("currentValue"))
-        power_load = from_union([from_int, from_none], obj.get("powerLoad"))
-        energy_sum_vaule = from_union([from_int, from_none], obj.get("energySumVaule"))
-        relay_list = from_union([lambda x: from_list(RelayList.from_dict, x), from_none], obj.get("relayList"))
-        volt_value_v20 = from_union([from_float, from_none], obj.get("voltValueV20"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        real_signal = from_union([from_int, from_none], obj.get("realSignal"))
-        signal_type = from_union([from_str, from_none], obj.get("signalType"))
-        abnormal_or_not = from_union([from_bool, from_none], obj.get("abnormalOrNot"))
-        return OutputMod(id, seq, status, tamper_evident, charge, signal, model, temperature, is_via_repeater, repeater_name, volt_value, current_value, power_load, energy_sum_vaule, relay_list, volt_value_v20, device_no, version, real_signal, signal_type, abnormal_or_not)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.id is not None:
@@ -2229,16 +2426,13 @@ class OutputMod:
         return result
 
 
-@dataclass
+@schema(
+    Field("output_mod", "OutputMod", OutputMod),
+)
+@dataclass(slots=True)
 class OutputModList:
     output_mod: Optional[OutputMod] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'OutputModList':
-        assert isinstance(obj, dict)
-        output_mod = from_union([OutputMod.from_dict, from_none], obj.get("OutputMod"))
-        return OutputModList(output_mod)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.output_mod is not None:
@@ -2246,20 +2440,17 @@ class OutputModList:
         return result
 
 
-@dataclass
+@schema(
+    Field("keys", "keys", STR),
+    Field("func", "func", STR),
+    Field("output_no", "outputNo", INT),
+)
+@dataclass(slots=True)
 class CombKey:
     keys: Optional[str] = None
     func: Optional[str] = None
     output_no: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'CombKey':
-        assert isinstance(obj, dict)
-        keys = from_union([from_str, from_none], obj.get("keys"))
-        func = from_union([from_str, from_none], obj.get("func"))
-        output_no = from_union([from_int, from_none], obj.get("outputNo"))
-        return CombKey(keys, func, output_no)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.keys is not None:
@@ -2271,16 +2462,13 @@ class CombKey:
         return result
 
 
-@dataclass
+@schema(
+    Field("comb_key", "CombKey", CombKey),
+)
+@dataclass(slots=True)
 class CombKeyList:
     comb_key: Optional[CombKey] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'CombKeyList':
-        assert isinstance(obj, dict)
-        comb_key = from_union([CombKey.from_dict, from_none], obj.get("CombKey"))
-        return CombKeyList(comb_key)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.comb_key is not None:
@@ -2288,20 +2476,17 @@ class CombKeyList:
         return result
 
 
-@dataclass
+@schema(
+    Field("key", "key", INT),
+    Field("func", "func", STR),
+    Field("output_no", "outputNo", INT),
+)
+@dataclass(slots=True)
 class SelKey:
     key: Optional[int] = None
     func: Optional[str] = None
     output_no: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'SelKey':
-        assert isinstance(obj, dict)
-        key = from_union([from_int, from_none], obj.get("key"))
-        func = from_union([from_str, from_none], obj.get("func"))
-        output_no = from_union([from_int, from_none], obj.get("outputNo"))
-        return SelKey(key, func, output_no)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.key is not None:
@@ -2313,16 +2498,13 @@ class SelKey:
         return result
 
 
-@dataclass
+@schema(
+    Field("sel_key", "SelKey", SelKey),
+)
+@dataclass(slots=True)
 class SelKeyList:
     sel_key: Optional[SelKey] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'SelKeyList':
-        assert isinstance(obj, dict)
-        sel_key = from_union([SelKey.from_dict, from_none], obj.get("SelKey"))
-        return SelKeyList(sel_key)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.sel_key is not None:
@@ -2330,7 +2512,26 @@ class SelKeyList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("seq", "seq", STR),
+    Field("name", "name", STR),
+    Field("status", "status", STR),
+    Field("charge", "charge", STR),
+    Field("charge_value", "chargeValue", INT),
+    Field("model", "model", STR),
+    Field("is_via_repeater", "isViaRepeater", BOOL),
+    Field("repeater_name", "repeaterName", STR),
+    Field("sel_key_list", "SelKeyList", SelKeyList, many=True),
+    Field("comb_key_list", "CombKeyList", CombKeyList, many=True),
+    Field("related_net_user_name", "relatedNetUserName", STR),
+    Field("user_nick_name", "userNickName", STR),
+    Field("version", "version", STR),
+    Field("device_no", "deviceNo", INT),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("abnormal_or_not", "abnormalOrNot", BOOL),
+)
+@dataclass(slots=True)
 class Remote:
     id: Optional[int] = None
     seq: Optional[str] = None
@@ -2350,28 +2551,6 @@ class Remote:
     sub_system_list: Optional[List[int]] = None
     abnormal_or_not: Optional[bool] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'Remote':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        seq = from_union([from_str, from_none], obj.get("seq"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        charge_value = from_union([from_int, from_none], obj.get("chargeValue"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        is_via_repeater = from_union([from_bool, from_none], obj.get("isViaRepeater"))
-        repeater_name = from_union([from_str, from_none], obj.get("repeaterName"))
-        sel_key_list = from_union([lambda x: from_list(SelKeyList.from_dict, x), from_none], obj.get("SelKeyList"))
-        comb_key_list = from_union([lambda x: from_list(CombKeyList.from_dict, x), from_none], obj.get("CombKeyList"))
-        related_net_user_name = from_union([from_str, from_none], obj.get("relatedNetUserName"))
-        user_nick_name = from_union([from_str, from_none], obj.get("userNickName"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        abnormal_or_not = from_union([from_bool, from_none], obj.get("abnormalOrNot"))
-        return Remote(id, seq, name, status, charge, charge_value, model, is_via_repeater, repeater_name, sel_key_list, comb_key_list, related_net_user_name, user_nick_name, version, device_no, sub_system_list, abnormal_or_not)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.id is not None:
@@ -2411,16 +2590,13 @@ class Remote:
         return result
 
 
-@dataclass
+@schema(
+    Field("remote", "Remote", Remote),
+)
+@dataclass(slots=True)
 class RemoteList:
     remote: Optional[Remote] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RemoteList':
-        assert isinstance(obj, dict)
-        remote = from_union([Remote.from_dict, from_none], obj.get("Remote"))
-        return RemoteList(remote)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.remote is not None:
@@ -2428,7 +2604,24 @@ class RemoteList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("seq", "seq", STR),
+    Field("name", "name", STR),
+    Field("status", "status", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("charge", "charge", STR),
+    Field("signal", "signal", INT),
+    Field("charge_value", "chargeValue", INT),
+    Field("model", "model", STR),
+    Field("temperature", "temperature", INT),
+    Field("conn_dev_num", "connDevNum", INT),
+    Field("main_power_supply", "mainPowerSupply", BOOL),
+    Field("battery_status", "batteryStatus", STR),
+    Field("version", "version", STR),
+    Field("device_no", "deviceNo", INT),
+)
+@dataclass(slots=True)
 class Repeater:
     id: Optional[int] = None
     seq: Optional[str] = None
@@ -2446,25 +2639,10 @@ class Repeater:
     version: Optional[str] = None
     device_no: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'Repeater':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        seq = from_union([from_str, from_none], obj.get("seq"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        signal = from_union([from_int, from_none], obj.get("signal"))
-        charge_value = from_union([from_int, from_none], obj.get("chargeValue"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        temperature = from_union([from_int, from_none], obj.get("temperature"))
-        conn_dev_num = from_union([from_int, from_none], obj.get("connDevNum"))
-        main_power_supply = from_union([from_bool, from_none], obj.get("mainPowerSupply"))
-        battery_status = from_union([from_str, from_none], obj.get("batteryStatus"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        return Repeater(id, seq, name, status, tamper_evident, charge, signal, charge_value, model, temperature, conn_dev_num, main_power_supply, battery_status, version, device_no)
+    _changed: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """ Fields changed since the previous poll; set by ``InstanceCache`` """
 
     def to_dict(self) -> dict:
         result: dict = {}
@@ -2501,16 +2679,13 @@ class Repeater:
         return result
 
 
-@dataclass
+@schema(
+    Field("repeater", "Repeater", Repeater),
+)
+@dataclass(slots=True)
 class RepeaterList:
     repeater: Optional[Repeater] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'RepeaterList':
-        assert isinstance(obj, dict)
-        repeater = from_union([Repeater.from_dict, from_none], obj.get("Repeater"))
-        return RepeaterList(repeater)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.repeater is not None:
@@ -2518,7 +2693,31 @@ class RepeaterList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("seq", "seq", STR),
+    Field("name", "name", STR),
+    Field("status", "status", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("siren_attrib", "sirenAttrib", STR),
+    Field("charge", "charge", STR),
+    Field("signal", "signal", INT),
+    Field("device_no", "deviceNo", INT),
+    Field("main_power_supply", "mainPowerSupply", BOOL),
+    Field("charge_value", "chargeValue", INT),
+    Field("real_signal", "realSignal", INT),
+    Field("signal_type", "signalType", STR),
+    Field("model", "model", STR),
+    Field("temperature", "temperature", INT),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("siren_color", "sirenColor", STR),
+    Field("is_via_repeater", "isViaRepeater", BOOL),
+    Field("version", "version", STR),
+    Field("abnormal_or_not", "abnormalOrNot", BOOL),
+    Field("access_module_type", "accessModuleType", STR),
+    Field("intercom_service_enabled", "intercomServiceEnabled", BOOL),
+)
+@dataclass(slots=True)
 class Siren:
     id: Optional[int] = None
     seq: Optional[str] = None
@@ -2543,32 +2742,10 @@ class Siren:
     access_module_type: Optional[str] = None
     intercom_service_enabled: Optional[bool] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'Siren':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        seq = from_union([from_str, from_none], obj.get("seq"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        siren_attrib = from_union([from_str, from_none], obj.get("sirenAttrib"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        signal = from_union([from_int, from_none], obj.get("signal"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        main_power_supply = from_union([from_bool, from_none], obj.get("mainPowerSupply"))
-        charge_value = from_union([from_int, from_none], obj.get("chargeValue"))
-        real_signal = from_union([from_int, from_none], obj.get("realSignal"))
-        signal_type = from_union([from_str, from_none], obj.get("signalType"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        temperature = from_union([from_int, from_none], obj.get("temperature"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        siren_color = from_union([from_str, from_none], obj.get("sirenColor"))
-        is_via_repeater = from_union([from_bool, from_none], obj.get("isViaRepeater"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        abnormal_or_not = from_union([from_bool, from_none], obj.get("abnormalOrNot"))
-        access_module_type = from_union([from_str, from_none], obj.get("accessModuleType"))
-        intercom_service_enabled = from_union([from_bool, from_none], obj.get("intercomServiceEnabled"))
-        return Siren(id, seq, name, status, tamper_evident, siren_attrib, charge, signal, device_no, main_power_supply, charge_value, real_signal, signal_type, model, temperature, sub_system_list, siren_color, is_via_repeater, version, abnormal_or_not, access_module_type, intercom_service_enabled)
+    _changed: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """ Fields changed since the previous poll; set by ``InstanceCache`` """
 
     def to_dict(self) -> dict:
         result: dict = {}
@@ -2619,16 +2796,13 @@ class Siren:
         return result
 
 
-@dataclass
+@schema(
+    Field("siren", "Siren", Siren),
+)
+@dataclass(slots=True)
 class SirenList:
     siren: Optional[Siren] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'SirenList':
-        assert isinstance(obj, dict)
-        siren = from_union([Siren.from_dict, from_none], obj.get("Siren"))
-        return SirenList(siren)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.siren is not None:
@@ -2636,20 +2810,17 @@ class SirenList:
         return result
 
 
-@dataclass
+@schema(
+    Field("output_id", "outputID", INT),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("status", "status", STR),
+)
+@dataclass(slots=True)
 class TransmitterOutputList:
     output_id: Optional[int] = None
     sub_system_list: Optional[List[int]] = None
     status: Optional[str] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'TransmitterOutputList':
-        assert isinstance(obj, dict)
-        output_id = from_union([from_int, from_none], obj.get("outputID"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        return TransmitterOutputList(output_id, sub_system_list, status)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.output_id is not None:
@@ -2661,7 +2832,19 @@ class TransmitterOutputList:
         return result
 
 
-@dataclass
+@schema(
+    Field("zone_id", "zoneID", INT),
+    Field("detector_type", "detectorType", STR),
+    Field("is_bypassed", "isBypassed", BOOL),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("zone_type", "zoneType", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("enter_delay", "enterDelay", INT),
+    Field("exit_delay", "exitDelay", INT),
+    Field("alarm", "alarm", BOOL),
+    Field("magnet_open_status", "magnetOpenStatus", BOOL),
+)
+@dataclass(slots=True)
 class ZoneList:
     zone_id: Optional[int] = None
     detector_type: Optional[str] = None
@@ -2674,21 +2857,6 @@ class ZoneList:
     alarm: Optional[bool] = None
     magnet_open_status: Optional[bool] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ZoneList':
-        assert isinstance(obj, dict)
-        zone_id = from_union([from_int, from_none], obj.get("zoneID"))
-        detector_type = from_union([from_str, from_none], obj.get("detectorType"))
-        is_bypassed = from_union([from_bool, from_none], obj.get("isBypassed"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        zone_type = from_union([from_str, from_none], obj.get("zoneType"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        enter_delay = from_union([from_int, from_none], obj.get("enterDelay"))
-        exit_delay = from_union([from_int, from_none], obj.get("exitDelay"))
-        alarm = from_union([from_bool, from_none], obj.get("alarm"))
-        magnet_open_status = from_union([from_bool, from_none], obj.get("magnetOpenStatus"))
-        return ZoneList(zone_id, detector_type, is_bypassed, sub_system_list, zone_type, tamper_evident, enter_delay, exit_delay, alarm, magnet_open_status)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.zone_id is not None:
@@ -2714,7 +2882,35 @@ class ZoneList:
         return result
 
 
-@dataclass
+@schema(
+    Field("id", "id", INT),
+    Field("name", "name", STR),
+    Field("sub_system_list", "subSystemList", INT, many=True),
+    Field("zone_list", "ZoneList", ZoneList, many=True),
+    Field("output_list", "OutputList", TransmitterOutputList, many=True),
+    Field("seq", "seq", STR),
+    Field("status", "status", STR),
+    Field("tamper_evident", "tamperEvident", BOOL),
+    Field("charge", "charge", STR),
+    Field("charge_value", "chargeValue", INT),
+    Field("signal", "signal", INT),
+    Field("model", "model", STR),
+    Field("temperature", "temperature", INT),
+    Field("is_via_repeater", "isViaRepeater", BOOL),
+    Field("repeater_name", "repeaterName", STR),
+    Field("moved_alarm_enabled", "movedAlarmEnabled", BOOL),
+    Field("tamper_port_enabled", "tamperPortEnabled", BOOL),
+    Field("voltage_output", "voltageOutput", STR),
+    Field("port_cfg", "portCfg", STR),
+    Field("version", "version", STR),
+    Field("smoke_detector_alarm", "smokeDetectorAlarm", STR),
+    Field("smoke_detector_power_supply", "smokeDetectorPowerSupply", STR),
+    Field("power_supply", "powerSupply", STR),
+    Field("main_power_supply", "mainPowerSupply", BOOL),
+    Field("type", "type", STR),
+    Field("device_no", "deviceNo", INT),
+)
+@dataclass(slots=True)
 class Transmitter:
     id: Optional[int] = None
     name: Optional[str] = None
@@ -2743,37 +2939,6 @@ class Transmitter:
     type: Optional[str] = None
     device_no: Optional[int] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'Transmitter':
-        assert isinstance(obj, dict)
-        id = from_union([from_int, from_none], obj.get("id"))
-        name = from_union([from_str, from_none], obj.get("name"))
-        sub_system_list = from_union([lambda x: from_list(from_int, x), from_none], obj.get("subSystemList"))
-        zone_list = from_union([lambda x: from_list(ZoneList.from_dict, x), from_none], obj.get("ZoneList"))
-        output_list = from_union([lambda x: from_list(TransmitterOutputList.from_dict, x), from_none], obj.get("OutputList"))
-        seq = from_union([from_str, from_none], obj.get("seq"))
-        status = from_union([from_str, from_none], obj.get("status"))
-        tamper_evident = from_union([from_bool, from_none], obj.get("tamperEvident"))
-        charge = from_union([from_str, from_none], obj.get("charge"))
-        charge_value = from_union([from_int, from_none], obj.get("chargeValue"))
-        signal = from_union([from_int, from_none], obj.get("signal"))
-        model = from_union([from_str, from_none], obj.get("model"))
-        temperature = from_union([from_int, from_none], obj.get("temperature"))
-        is_via_repeater = from_union([from_bool, from_none], obj.get("isViaRepeater"))
-        repeater_name = from_union([from_str, from_none], obj.get("repeaterName"))
-        moved_alarm_enabled = from_union([from_bool, from_none], obj.get("movedAlarmEnabled"))
-        tamper_port_enabled = from_union([from_bool, from_none], obj.get("tamperPortEnabled"))
-        voltage_output = from_union([from_str, from_none], obj.get("voltageOutput"))
-        port_cfg = from_union([from_str, from_none], obj.get("portCfg"))
-        version = from_union([from_str, from_none], obj.get("version"))
-        smoke_detector_alarm = from_union([from_str, from_none], obj.get("smokeDetectorAlarm"))
-        smoke_detector_power_supply = from_union([from_str, from_none], obj.get("smokeDetectorPowerSupply"))
-        power_supply = from_union([from_str, from_none], obj.get("powerSupply"))
-        main_power_supply = from_union([from_bool, from_none], obj.get("mainPowerSupply"))
-        type = from_union([from_str, from_none], obj.get("type"))
-        device_no = from_union([from_int, from_none], obj.get("deviceNo"))
-        return Transmitter(id, name, sub_system_list, zone_list, output_list, seq, status, tamper_evident, charge, charge_value, signal, model, temperature, is_via_repeater, repeater_name, moved_alarm_enabled, tamper_port_enabled, voltage_output, port_cfg, version, smoke_detector_alarm, smoke_detector_power_supply, power_supply, main_power_supply, type, device_no)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.id is not None:
@@ -2831,16 +2996,13 @@ class Transmitter:
         return result
 
 
-@dataclass
+@schema(
+    Field("transmitter", "Transmitter", Transmitter),
+)
+@dataclass(slots=True)
 class TransmitterList:
     transmitter: Optional[Transmitter] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'TransmitterList':
-        assert isinstance(obj, dict)
-        transmitter = from_union([Transmitter.from_dict, from_none], obj.get("Transmitter"))
-        return TransmitterList(transmitter)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.transmitter is not None:
@@ -2848,7 +3010,18 @@ class TransmitterList:
         return result
 
 
-@dataclass
+@schema(
+    Field("output_mod_list", "OutputModList", OutputModList, many=True, lazy=True),
+    Field("output_list", "OutputList", ExDevStatusOutputList, many=True),
+    Field("siren_list", "SirenList", SirenList, many=True),
+    Field("repeater_list", "RepeaterList", RepeaterList, many=True),
+    Field("card_reader_list", "CardReaderList", CardReaderList, many=True, lazy=True),
+    Field("extension_list", "ExtensionList", ExtensionList, many=True),
+    Field("keypad_list", "KeypadList", KeypadList, many=True),
+    Field("remote_list", "RemoteList", RemoteList, many=True, lazy=True),
+    Field("transmitter_list", "TransmitterList", TransmitterList, many=True, lazy=True),
+)
+@dataclass(slots=True)
 class ExDevStatus:
     output_mod_list: Optional[List[OutputModList]] = None
     output_list: Optional[List[ExDevStatusOutputList]] = None
@@ -2860,19 +3033,8 @@ class ExDevStatus:
     remote_list: Optional[List[RemoteList]] = None
     transmitter_list: Optional[List[TransmitterList]] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ExDevStatus':
-        assert isinstance(obj, dict)
-        output_mod_list = from_union([lambda x: from_list(OutputModList.from_dict, x), from_none], obj.get("OutputModList"))
-        output_list = from_union([lambda x: from_list(ExDevStatusOutputList.from_dict, x), from_none], obj.get("OutputList"))
-        siren_list = from_union([lambda x: from_list(SirenList.from_dict, x), from_none], obj.get("SirenList"))
-        repeater_list = from_union([lambda x: from_list(RepeaterList.from_dict, x), from_none], obj.get("RepeaterList"))
-        card_reader_list = from_union([lambda x: from_list(CardReaderList.from_dict, x), from_none], obj.get("CardReaderList"))
-        extension_list = from_union([lambda x: from_list(ExtensionList.from_dict, x), from_none], obj.get("ExtensionList"))
-        keypad_list = from_union([lambda x: from_list(KeypadList.from_dict, x), from_none], obj.get("KeypadList"))
-        remote_list = from_union([lambda x: from_list(RemoteList.from_dict, x), from_none], obj.get("RemoteList"))
-        transmitter_list = from_union([lambda x: from_list(TransmitterList.from_dict, x), from_none], obj.get("TransmitterList"))
-        return ExDevStatus(output_mod_list, output_list, siren_list, repeater_list, card_reader_list, extension_list, keypad_list, remote_list, transmitter_list)
+    _undecoded: int = field(default=0, init=False, repr=False, compare=False)
+    """ Bits of the lazy fields whose slot still holds raw JSON """
 
     def to_dict(self) -> dict:
         result: dict = {}
@@ -2897,25 +3059,59 @@ class ExDevStatus:
         return result
 
 
-@dataclass
+@schema(
+    Field("ex_dev_status", "ExDevStatus", ExDevStatus, tolerant=True),
+)
+@dataclass(slots=True)
 class ExDevStatusResponse:
     ex_dev_status: Optional[ExDevStatus] = None
 
-    @staticmethod
-    def from_dict(obj: Any) -> 'ExDevStatusResponse':
-        assert isinstance(obj, dict)
-        try:
-            ex_dev_status = from_union([ExDevStatus.from_dict, from_none], obj.get("ExDevStatus"))
-        except:
-            _LOGGER.warning("Invalid external device status %s", obj.get("ExDevStatus"))
-            _LOGGER.warning("ExDevStatusResponse info: %s", obj)
-            ex_dev_status = None
-
-        return ExDevStatusResponse(ex_dev_status)
-
     def to_dict(self) -> dict:
         result: dict = {}
         if self.ex_dev_status is not None:
             result["ExDevStatus"] = from_union([lambda x: to_class(ExDevStatus, x), from_none], self.ex_dev_status)
         return result
 
+
+
+@schema(
+    Field("device_name", "deviceName", STR, required=True),
+    Field("model", "model", STR, required=True),
+    Field("device_id", "deviceID", STR),
+    Field("serial_number", "serialNumber", STR),
+    Field("mac_address", "macAddress", STR),
+    Field("firmware_version", "firmwareVersion", STR),
+    Field("firmware_released_date", "firmwareReleasedDate", STR),
+    Field("hardware_version", "hardwareVersion", STR),
+    Field("device_type", "deviceType", STR),
+)
+@dataclass(frozen=True, slots=True)
+class DeviceInfo:
+    """``/ISAPI/System/deviceInfo`` (XML; element texts are strings)."""
+
+    device_name: str
+    model: str
+    device_id: Optional[str] = None
+    serial_number: Optional[str] = None
+    mac_address: Optional[str] = None
+    firmware_version: Optional[str] = None
+    firmware_released_date: Optional[str] = None
+    hardware_version: Optional[str] = None
+    device_type: Optional[str] = None
+
+    def to_dict(self) -> dict:
+        result: dict = {}
+        result["deviceName"] = from_str(self.device_name)
+        result["model"] = from_str(self.model)
+        for key, value in (
+            ("deviceID", self.device_id),
+            ("serialNumber", self.serial_number),
+            ("macAddress", self.mac_address),
+            ("firmwareVersion", self.firmware_version),
+            ("firmwareReleasedDate", self.firmware_released_date),
+            ("hardwareVersion", self.hardware_version),
+            ("deviceType", self.device_type),
+        ):
+            if value is not None:
+                result[key] = from_str(value)
+        return result
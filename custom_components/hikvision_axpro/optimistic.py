@@ -0,0 +1,128 @@
+"""Optimistic command results held until the panel confirms them.
+
+After the panel accepts a command the coordinator writes the expected field
+values into its cached devices at once. Every fetch of the affected endpoint
+then either confirms an expectation (the panel reports the same value), keeps
+it on top of the fresh data while the panel catches up, or - once the hold
+time has passed - drops it so the panel's own value stays (rollback).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .delta import ChangeSet
+
+CONFIRM_HOLD = 15.0
+""" Seconds an unconfirmed value is shown before the panel's value wins """
+CONFIRM_DELAY = 0.5
+""" Seconds before the first confirmation fetch; doubles on each retry """
+
+
+@dataclass(frozen=True)
+class Expectation:
+    """A field value a command is expected to produce on one device."""
+
+    kind: str
+    device_id: int
+    field: str
+    value: Any
+    poll_key: str
+    """ Poll request whose body reports the field """
+
+
+DeviceLookup = Callable[[str], Mapping[int, Any] | None]
+""" Returns the cached ``id -> model`` mapping of a device kind """
+
+
+class OptimisticLedger:
+    """Pending expectations with their hold deadline."""
+
+    def __init__(
+        self, hold: float = CONFIRM_HOLD, clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        self.hold = hold
+        self._clock = clock
+        self._pending: dict[tuple[str, int, str], tuple[Expectation, float]] = {}
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._pending)
+
+    def poll_keys(self) -> frozenset[str]:
+        """Poll requests needed to confirm the pending expectations."""
+        return frozenset(exp.poll_key for exp, _ in self._pending.values())
+
+    def waiting_on(self, poll_key: str) -> list[Expectation]:
+        """Pending expectations confirmed by the ``poll_key`` request."""
+        return [exp for exp, _ in self._pending.values() if exp.poll_key == poll_key]
+
+    def expect(self, expectation: Expectation) -> None:
+        """Hold ``expectation``, replacing an older one for the same field."""
+        key = (expectation.kind, expectation.device_id, expectation.field)
+        self._pending[key] = (expectation, self._clock() + self.hold)
+
+    def overlay(self, devices: DeviceLookup) -> ChangeSet:
+        """Write every pending value into the cached devices.
+
+        Returns the fields that actually changed, for targeted notification.
+        """
+        changes: ChangeSet = {}
+        for expectation, _ in self._pending.values():
+            device = (devices(expectation.kind) or {}).get(expectation.device_id)
+            if device is None:
+                continue
+            if getattr(device, expectation.field) != expectation.value:
+                setattr(device, expectation.field, expectation.value)
+                fields = changes.setdefault(expectation.kind, {})
+                fields[expectation.device_id] = fields.get(
+                    expectation.device_id, frozenset()
+                ) | {expectation.field}
+        return changes
+
+    def reconcile(
+        self,
+        devices: DeviceLookup,
+        fetched: Iterable[str],
+        scope: Iterable[tuple[str, int]] | None = None,
+    ) -> tuple[list[Expectation], list[Expectation]]:
+        """Compare freshly applied devices with the expectations.
+
+        Only expectations whose poll request is in ``fetched`` are judged, and
+        with ``scope`` only those of the given ``(kind, device id)`` pairs.
+        Returns ``(confirmed, rolled_back)``; both are no longer pending.
+        Expectations of devices that disappeared count as rolled back.
+        """
+        fetched = frozenset(fetched)
+        scope = None if scope is None else frozenset(scope)
+        now = self._clock()
+        confirmed: list[Expectation] = []
+        rolled_back: list[Expectation] = []
+        for key, (expectation, expires) in list(self._pending.items()):
+            if expectation.poll_key not in fetched or (
+                scope is not None and key[:2] not in scope
+            ):
+                continue
+            device = (devices(expectation.kind) or {}).get(expectation.device_id)
+            if device is not None and (
+                getattr(device, expectation.field) == expectation.value
+            ):
+                confirmed.append(expectation)
+            elif device is None or now >= expires:
+                rolled_back.append(expectation)
+            else:
+                continue
+            del self._pending[key]
+        return confirmed, rolled_back
+
+    def drop_expired(self) -> list[Expectation]:
+        """Forget expectations past their hold without judging them."""
+        now = self._clock()
+        expired = [
+            key for key, (_, expires) in self._pending.items() if now >= expires
+        ]
+        return [self._pending.pop(key)[0] for key in expired]
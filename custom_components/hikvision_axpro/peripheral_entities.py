@@ -23,10 +23,11 @@ from homeassistant.const import (
 from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import HikAxProDataUpdateCoordinator
 from .const import DOMAIN
+from .delta import DeviceContext
+from .entity import HikCoordinatorEntity
 from .entity_id import build_entity_id
 from .model import ExtensionModule, Keypad, Repeater, detector_model_to_name
 
@@ -338,7 +339,7 @@ def _value_entities(coordinator, entry_id, *, kind, device_id, get, specs):
     return entities
 
 
-class HikPeripheralBinary(CoordinatorEntity, BinarySensorEntity):
+class HikPeripheralBinary(HikCoordinatorEntity, BinarySensorEntity):
     """Binary attribute for a keypad/repeater/extension."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -356,7 +357,7 @@ class HikPeripheralBinary(CoordinatorEntity, BinarySensorEntity):
         get: Callable,
         value_fn: Callable,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, DeviceContext(kind, device_id))
         self._ref_id = entry_id
         self._kind = kind
         self._device_id = device_id
@@ -400,7 +401,7 @@ class HikPeripheralBinary(CoordinatorEntity, BinarySensorEntity):
         self.async_write_ha_state()
 
 
-class HikPeripheralSensor(CoordinatorEntity, SensorEntity):
+class HikPeripheralSensor(HikCoordinatorEntity, SensorEntity):
     """Sensor attribute for a keypad/repeater/extension."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -420,7 +421,7 @@ class HikPeripheralSensor(CoordinatorEntity, SensorEntity):
         get: Callable,
         value_fn: Callable,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, DeviceContext(kind, device_id))
         self._ref_id = entry_id
         self._kind = kind
         self._device_id = device_id
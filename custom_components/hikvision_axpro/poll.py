@@ -0,0 +1,340 @@
+"""Concurrent fan-out of the ISAPI requests that make up one poll cycle.
+
+The request cap lives on the ``IsapiClient`` so the fan-out here can start every
+request at once and the transport decides how many actually hit the panel, and
+in which order (by tier, behind commands).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+import hashlib
+import logging
+import time
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+import hikaxpro
+
+if TYPE_CHECKING:
+    from .capabilities import CapabilityRegistry
+    from .isapi import IsapiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+REFRESH_COALESCE_WINDOW = 2.0
+""" Seconds a finished poll is reused by back-to-back refresh requests """
+
+TIER_FAST = "fast"
+""" Alarm state: subsystems and zones, polled on every coordinator update """
+TIER_MEDIUM = "medium"
+""" Peripherals from exDevStatus """
+TIER_SLOW = "slow"
+""" Hub diagnostics: host, AC power and batteries """
+POLL_TIERS: tuple[str, ...] = (TIER_FAST, TIER_MEDIUM, TIER_SLOW)
+
+DEFAULT_DEADLINE = 5.0
+""" Seconds; enough for the small alarm state and diagnostics bodies """
+
+TIER_PRIORITIES: dict[str, int] = {TIER_FAST: 1, TIER_MEDIUM: 2, TIER_SLOW: 3}
+""" Request priority per tier; commands use 0 (``isapi.PRIORITY_COMMAND``) """
+
+
+@dataclass(frozen=True)
+class PollRequest:
+    """One JSON ISAPI request of a poll cycle."""
+
+    key: str
+    path: str
+    tier: str = TIER_FAST
+    optional: bool = False
+    """ Optional requests yield ``None`` on failure instead of failing the poll """
+    deadline: float = DEFAULT_DEADLINE
+    """ Seconds the request may take, waiting for a request slot included """
+
+    @property
+    def priority(self) -> int:
+        """Scheduling priority of the request at the ISAPI client."""
+        return TIER_PRIORITIES[self.tier]
+
+
+_ENDPOINTS = hikaxpro.consts.Endpoints
+
+POLL_SUBSYSTEMS = PollRequest("subsystems", _ENDPOINTS.SubSystemStatus)
+POLL_ZONES = PollRequest("zones", _ENDPOINTS.ZoneStatus)
+POLL_EX_DEV_STATUS = PollRequest(
+    "ex_dev_status", _ENDPOINTS.PeripheralsStatus, TIER_MEDIUM, deadline=10.0
+)
+POLL_HOST_STATUS = PollRequest(
+    "host_status", _ENDPOINTS.HostStatus, TIER_SLOW, optional=True
+)
+POLL_AC_POWER = PollRequest(
+    "ac_power_status",
+    "/ISAPI/SecurityCP/status/acPowerStatus",
+    TIER_SLOW,
+    optional=True,
+)
+POLL_BATTERIES = PollRequest(
+    "batteries", _ENDPOINTS.BatteriesStatus, TIER_SLOW, optional=True
+)
+
+POLL_REQUESTS: tuple[PollRequest, ...] = (
+    POLL_SUBSYSTEMS,
+    POLL_ZONES,
+    POLL_EX_DEV_STATUS,
+    POLL_HOST_STATUS,
+    POLL_AC_POWER,
+    POLL_BATTERIES,
+)
+
+
+def requests_for_tiers(
+    tiers: Iterable[str], requests: Iterable[PollRequest] = POLL_REQUESTS
+) -> tuple[PollRequest, ...]:
+    """Return the requests belonging to ``tiers``, in poll order."""
+    tiers = frozenset(tiers)
+    return tuple(request for request in requests if request.tier in tiers)
+
+
+def fingerprint(content: bytes | None) -> bytes | None:
+    """Short digest of a raw response body; ``None`` for a missing body."""
+    if content is None:
+        return None
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+class ResponseCache:
+    """Fingerprints of the last applied body per poll key.
+
+    ``changed`` is side-effect free so a body is only recorded with
+    ``commit`` once it was decoded and applied successfully.
+    """
+
+    def __init__(self) -> None:
+        self._fingerprints: dict[str, bytes | None] = {}
+
+    def changed(self, payloads: Mapping[str, bytes | None]) -> dict[str, bytes | None]:
+        """Return the fingerprints of bodies that differ from the last commit."""
+        result: dict[str, bytes | None] = {}
+        for key, content in payloads.items():
+            digest = fingerprint(content)
+            if key not in self._fingerprints or self._fingerprints[key] != digest:
+                result[key] = digest
+        return result
+
+    def commit(self, fingerprints: Mapping[str, bytes | None]) -> None:
+        self._fingerprints.update(fingerprints)
+
+    def invalidate(self, *keys: str) -> None:
+        """Forget ``keys`` (all when empty) so their next body is applied."""
+        if not keys:
+            self._fingerprints.clear()
+        for key in keys:
+            self._fingerprints.pop(key, None)
+
+    def snapshot(self) -> tuple[tuple[str, bytes | None], ...]:
+        """Comparable summary of everything applied so far."""
+        return tuple(sorted(self._fingerprints.items()))
+
+
+class PollScheduler:
+    """Track per-tier cadence and decide which tiers a poll should fetch.
+
+    The coordinator ticks at the fast interval, so the fast tier is due on
+    every poll, including refreshes requested after a command. Slower tiers
+    are due once their own interval has elapsed since they last succeeded.
+    """
+
+    TOLERANCE = 1.0
+    """ Seconds of scheduling jitter absorbed so tiers do not slip a tick """
+
+    def __init__(
+        self,
+        intervals: Mapping[str, float],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.intervals = dict(intervals)
+        self._clock = clock
+        self._last_polled: dict[str, float] = {}
+
+    def due_tiers(self) -> frozenset[str]:
+        now = self._clock()
+        due = {TIER_FAST}
+        for tier, interval in self.intervals.items():
+            last = self._last_polled.get(tier)
+            if last is None or now - last + self.TOLERANCE >= interval:
+                due.add(tier)
+        return frozenset(due)
+
+    def mark_polled(self, tiers: Iterable[str]) -> None:
+        now = self._clock()
+        for tier in tiers:
+            self._last_polled[tier] = now
+
+
+async def async_fetch_partial(
+    client: IsapiClient,
+    requests: Iterable[PollRequest] = POLL_REQUESTS,
+    capabilities: CapabilityRegistry | None = None,
+) -> tuple[dict[str, bytes | None], dict[str, Exception]]:
+    """Issue ``requests`` concurrently, each within its own deadline.
+
+    Every request runs to completion (or its deadline) before anything is
+    returned. Returns the bodies of the requests that completed and the error
+    of each one that did not, so callers can apply whatever arrived.
+
+    With ``capabilities``, optional requests whose circuit is open are not
+    sent at all (``None`` body), and the outcome of the others is recorded;
+    optional requests the panel rejects also map to a ``None`` body.
+    """
+    requests = tuple(requests)
+    payloads: dict[str, bytes | None] = {}
+    if capabilities is not None:
+        skipped = [
+            request
+            for request in requests
+            if request.optional and not capabilities.allowed(request.key)
+        ]
+        for request in skipped:
+            payloads[request.key] = None
+        requests = tuple(request for request in requests if request not in skipped)
+    results = await asyncio.gather(
+        *(_async_fetch(client, request) for request in requests),
+        return_exceptions=True,
+    )
+    failures: dict[str, Exception] = {}
+    cancelled: BaseException | None = None
+    for request, result in zip(requests, results):
+        rejected = False
+        if capabilities is not None and request.optional:
+            rejected = capabilities.record(request.key, result)
+        if not isinstance(result, BaseException):
+            payloads[request.key] = result
+        elif not isinstance(result, Exception):
+            cancelled = cancelled or result
+        elif rejected:
+            payloads[request.key] = None
+        else:
+            failures[request.key] = result
+    if cancelled is not None:
+        raise cancelled
+    return payloads, failures
+
+
+async def _async_fetch(client: IsapiClient, request: PollRequest) -> bytes:
+    try:
+        async with asyncio.timeout(request.deadline):
+            return await client.async_request_raw(
+                request.path, priority=request.priority
+            )
+    except TimeoutError as err:
+        raise TimeoutError(
+            f"{request.key} exceeded its {request.deadline:g}s deadline"
+        ) from err
+
+
+async def async_fetch_all(
+    client: IsapiClient,
+    requests: Iterable[PollRequest] = POLL_REQUESTS,
+    capabilities: CapabilityRegistry | None = None,
+) -> dict[str, bytes | None]:
+    """Issue ``requests`` concurrently and return their raw bodies by key.
+
+    Like ``async_fetch_partial``, but all or nothing: the first failure of a
+    required request is re-raised; failed optional requests map to ``None``.
+    """
+    requests = tuple(requests)
+    payloads, failures = await async_fetch_partial(client, requests, capabilities)
+    for request in requests:
+        if (error := failures.get(request.key)) is None:
+            continue
+        if not request.optional:
+            raise error
+        _LOGGER.debug("%s unavailable: %s", request.key, error)
+        payloads[request.key] = None
+    return payloads
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+class SingleFlight(Generic[_T]):
+    """Coalesce concurrent and back-to-back calls of one async fetch.
+
+    Callers arriving while a fetch is in flight await that fetch. Callers
+    arriving within ``window`` seconds after a successful fetch get its
+    result. ``invalidate`` forces the next call to fetch, e.g. after a
+    command changed panel state.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[_T]],
+        window: float = REFRESH_COALESCE_WINDOW,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fetch = fetch
+        self.window = window
+        self._clock = clock
+        self._task: asyncio.Task[_T] | None = None
+        self._waiters: dict[asyncio.Task[_T], int] = {}
+        self._finished_at: float | None = None
+        self._result: _T | None = None
+        self.fetches = 0
+        self.coalesced = 0
+
+    def invalidate(self) -> None:
+        """Drop the reusable result and detach any in-flight fetch.
+
+        A detached fetch still finishes for the callers awaiting it; one that
+        nobody awaits any more is cancelled.
+        """
+        task = self._task
+        self._task = None
+        self._finished_at = None
+        self._result = None
+        if task is not None and task not in self._waiters:
+            task.cancel()
+
+    def cancel(self) -> None:
+        """Invalidate and cancel every fetch still running, e.g. on unload."""
+        tasks = [*self._waiters]
+        self.invalidate()
+        for task in tasks:
+            task.cancel()
+
+    async def __call__(self) -> _T:
+        task = self._task
+        if task is None or task.done():
+            if (
+                self._finished_at is not None
+                and self._clock() - self._finished_at < self.window
+            ):
+                self.coalesced += 1
+                return self._result  # type: ignore[return-value]
+            task = self._task = asyncio.ensure_future(self._run())
+            # Callers may all be cancelled before the fetch fails.
+            task.add_done_callback(_retrieve_exception)
+            self.fetches += 1
+        else:
+            self.coalesced += 1
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if waiting := self._waiters.pop(task) - 1:
+                self._waiters[task] = waiting
+            elif task is not self._task:
+                task.cancel()
+
+    async def _run(self) -> _T:
+        result = await self._fetch()
+        if self._task is asyncio.current_task():
+            self._finished_at = self._clock()
+            self._result = result
+        return result
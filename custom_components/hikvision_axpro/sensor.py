@@ -24,13 +24,21 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import HikAxProDataUpdateCoordinator
 from .const import DATA_COORDINATOR, DOMAIN
+from .delta import zone_context
+from .entity import HikCoordinatorEntity
 from .hik_device import HikDevice
 from .entity_id import build_entity_id
-from .model import DetectorType, Status, Zone, zone_device_model
+from .model import (
+    CAP_HUMIDITY,
+    DetectorType,
+    Status,
+    Zone,
+    device_capabilities,
+    zone_device_model,
+)
 from .host_entities import build_host_sensors
 from .peripheral_entities import (
     build_peripheral_sensors,
@@ -49,7 +57,6 @@ async def async_setup_entry(
         DATA_COORDINATOR
     ]
     devices = []
-    await coordinator.async_request_refresh()
     device_registry = dr.async_get(hass)
     register_siren_devices(device_registry, coordinator, entry.entry_id)
     register_peripheral_devices(device_registry, coordinator, entry.entry_id)
@@ -99,13 +106,8 @@ async def async_setup_entry(
                     sw_version=zone.zone.version,
                 )
 
-            _LOGGER.debug(
-                "Compare %s is %s == %s",
-                detector_type,
-                detector_type is DetectorType.MAGNET_SHOCK_DETECTOR,
-                detector_type == DetectorType.MAGNET_SHOCK_DETECTOR,
-            )
-            if detector_type == DetectorType.WIRELESS_TEMPERATURE_HUMIDITY_DETECTOR:
+            capabilities = device_capabilities(zone.zone.model, detector_type)
+            if CAP_HUMIDITY in capabilities:
                 devices.append(HikHumidity(coordinator, zone.zone, entry.entry_id))
             # Generic Attrs
             if zone.zone.temperature is not None:
@@ -125,7 +127,7 @@ async def async_setup_entry(
     async_add_entities(devices, False)
 
 
-class HikTemperature(CoordinatorEntity, HikDevice, SensorEntity):
+class HikTemperature(HikCoordinatorEntity, HikDevice, SensorEntity):
     """Representation of Hikvision external magnet detector."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -134,7 +136,7 @@ class HikTemperature(CoordinatorEntity, HikDevice, SensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "temperature"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-temp-{zone.id}"
@@ -166,7 +168,7 @@ class HikTemperature(CoordinatorEntity, HikDevice, SensorEntity):
         self.async_write_ha_state()
 
 
-class HikHumidity(CoordinatorEntity, HikDevice, SensorEntity):
+class HikHumidity(HikCoordinatorEntity, HikDevice, SensorEntity):
     """Representation of Hikvision external magnet detector."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -175,7 +177,7 @@ class HikHumidity(CoordinatorEntity, HikDevice, SensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "humidity"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-humid-{zone.id}"
@@ -207,7 +209,7 @@ class HikHumidity(CoordinatorEntity, HikDevice, SensorEntity):
         self.async_write_ha_state()
 
 
-class HikBatteryInfo(CoordinatorEntity, HikDevice, SensorEntity):
+class HikBatteryInfo(HikCoordinatorEntity, HikDevice, SensorEntity):
     """Representation of Hikvision battery status."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -216,7 +218,7 @@ class HikBatteryInfo(CoordinatorEntity, HikDevice, SensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "charge_value"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-battery-{zone.id}"
@@ -252,7 +254,7 @@ class HikBatteryInfo(CoordinatorEntity, HikDevice, SensorEntity):
         self.async_write_ha_state()
 
 
-class HikChargeStatus(CoordinatorEntity, HikDevice, SensorEntity):
+class HikChargeStatus(HikCoordinatorEntity, HikDevice, SensorEntity):
     """Categorical battery charge status (normal / lowPower / …)."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -261,7 +263,7 @@ class HikChargeStatus(CoordinatorEntity, HikDevice, SensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "charge"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-charge-{zone.id}"
@@ -292,7 +294,7 @@ class HikChargeStatus(CoordinatorEntity, HikDevice, SensorEntity):
         self.async_write_ha_state()
 
 
-class HikSignalInfo(CoordinatorEntity, HikDevice, SensorEntity):
+class HikSignalInfo(HikCoordinatorEntity, HikDevice, SensorEntity):
     """Representation of Hikvision signal status."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -301,7 +303,7 @@ class HikSignalInfo(CoordinatorEntity, HikDevice, SensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "signal"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-signal-{zone.id}"
@@ -333,7 +335,7 @@ class HikSignalInfo(CoordinatorEntity, HikDevice, SensorEntity):
         self.async_write_ha_state()
 
 
-class HikStatusInfo(CoordinatorEntity, HikDevice, SensorEntity):
+class HikStatusInfo(HikCoordinatorEntity, HikDevice, SensorEntity):
     """Representation of Hikvision signal status."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -342,7 +344,7 @@ class HikStatusInfo(CoordinatorEntity, HikDevice, SensorEntity):
         self, coordinator: HikAxProDataUpdateCoordinator, zone: Zone, entry_id: str
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, zone_context(zone.id, "status"))
         self.zone = zone
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-status-{zone.id}"
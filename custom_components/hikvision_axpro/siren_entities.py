@@ -23,10 +23,11 @@ from homeassistant.const import (
 from homeassistant.core import callback
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import HikAxProDataUpdateCoordinator
 from .const import DOMAIN
+from .delta import KIND_SIREN, DeviceContext
+from .entity import HikCoordinatorEntity
 from .entity_id import build_entity_id
 from .model import Siren, detector_model_to_name
 
@@ -212,7 +213,7 @@ def build_siren_sensors(
     return entities
 
 
-class HikSirenEntity(CoordinatorEntity):
+class HikSirenEntity(HikCoordinatorEntity):
     """Shared siren device wiring."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -225,8 +226,8 @@ class HikSirenEntity(CoordinatorEntity):
         siren: Siren,
         entry_id: str,
     ) -> None:
-        super().__init__(coordinator)
         assert siren.id is not None
+        super().__init__(coordinator, DeviceContext(KIND_SIREN, siren.id))
         self.siren_id = siren.id
         self._ref_id = entry_id
 
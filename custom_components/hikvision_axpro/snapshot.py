@@ -0,0 +1,80 @@
+"""Warm-start snapshot of everything entity setup needs from the panel.
+
+The coordinator keeps the last device info, zone and relay configuration and
+raw poll bodies (which include the peripheral inventory) and persists them in
+Home Assistant storage. On the next start the snapshot is applied instead of
+querying the panel, so entities are created immediately while the live fetch
+revalidates in the background.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass
+class WarmSnapshot:
+    """Panel inventory and last known state, as stored between restarts."""
+
+    mac: str
+    device_info: dict
+    """ Parsed ``/ISAPI/System/deviceInfo`` """
+    zones_conf: Any
+    """ Raw JSON of the zone configuration """
+    relays_conf: Any
+    """ Raw JSON of the output (relay) configuration """
+    payloads: dict[str, bytes | None] = field(default_factory=dict)
+    """ Last applied poll bodies by poll key """
+    saved_at: float = field(default_factory=time.time)
+    host: str | None = None
+    """ Panel host the snapshot was taken from """
+
+    def as_dict(self) -> dict[str, Any]:
+        payloads: dict[str, str | None] = {}
+        for key, content in self.payloads.items():
+            try:
+                payloads[key] = None if content is None else content.decode()
+            except UnicodeDecodeError:
+                continue
+        return {
+            "mac": self.mac,
+            "device_info": self.device_info,
+            "zones_conf": self.zones_conf,
+            "relays_conf": self.relays_conf,
+            "payloads": payloads,
+            "saved_at": self.saved_at,
+            "host": self.host,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any] | None) -> WarmSnapshot | None:
+        """Restore a snapshot saved with ``as_dict``; ``None`` if unusable."""
+        if not isinstance(data, Mapping):
+            return None
+        try:
+            mac = data["mac"]
+            device_info = data["device_info"]
+            payloads = data.get("payloads") or {}
+            if not mac or not isinstance(device_info, dict):
+                return None
+            return cls(
+                mac=mac,
+                device_info=device_info,
+                zones_conf=data["zones_conf"],
+                relays_conf=data["relays_conf"],
+                payloads={
+                    key: None if content is None else content.encode()
+                    for key, content in payloads.items()
+                },
+                saved_at=float(data.get("saved_at") or 0),
+                host=data.get("host"),
+            )
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring unusable warm-start snapshot: %s", err)
+            return None
@@ -6,7 +6,6 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from homeassistant.helpers import device_registry as dr
 from homeassistant.components.switch import (
@@ -17,6 +16,8 @@ from homeassistant.components.switch import (
 
 from . import HikAxProDataUpdateCoordinator
 from .const import DATA_COORDINATOR, DOMAIN
+from .delta import KIND_RELAY, KIND_SIREN, DeviceContext
+from .entity import HikCoordinatorEntity
 from .entity_id import build_entity_id
 from .model import RelaySwitchConf, detector_model_to_name, relay_status_is_on
 
@@ -30,7 +31,6 @@ async def async_setup_entry(
     coordinator: HikAxProDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id][
         DATA_COORDINATOR
     ]
-    await coordinator.async_request_refresh()
     device_registry = dr.async_get(hass)
     devices = []
     if coordinator.relays is not None:
@@ -45,8 +45,8 @@ async def async_setup_entry(
             )
             devices.append(HikRelaySwitch(coordinator, switch, entry.entry_id))
     for siren_id, siren in coordinator.sirens.items():
-        # Skip devices already marked unsupported after a prior control attempt.
-        if coordinator.siren_control_supported.get(siren_id) is False:
+        # Skip sirens whose control the panel rejected (remembered across restarts).
+        if not coordinator.siren_control_available(siren_id):
             continue
         device_registry.async_get_or_create(
             config_entry_id=entry.entry_id,
@@ -62,7 +62,7 @@ async def async_setup_entry(
     async_add_entities(devices, False)
 
 
-class HikRelaySwitch(CoordinatorEntity, SwitchEntity):
+class HikRelaySwitch(HikCoordinatorEntity, SwitchEntity):
     """Representation of Hikvision external magnet detector."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -74,7 +74,7 @@ class HikRelaySwitch(CoordinatorEntity, SwitchEntity):
         entry_id: str,
     ) -> None:
         """Create the entity with a DataUpdateCoordinator."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, DeviceContext(KIND_RELAY, switch.id))
         self.switch = switch
         self._ref_id = entry_id
         self._attr_unique_id = f"{self.coordinator.device_name}-relay-{switch.id}"
@@ -137,7 +137,7 @@ class HikRelaySwitch(CoordinatorEntity, SwitchEntity):
             _LOGGER.exception("Error turn off for switch %s", self.entity_id)
 
 
-class HikSirenSwitch(CoordinatorEntity, SwitchEntity):
+class HikSirenSwitch(HikCoordinatorEntity, SwitchEntity):
     """Control a siren via /ISAPI/SecurityCP/control/siren/<ID> when supported."""
 
     coordinator: HikAxProDataUpdateCoordinator
@@ -148,7 +148,7 @@ class HikSirenSwitch(CoordinatorEntity, SwitchEntity):
         siren_id: int,
         entry_id: str,
     ) -> None:
-        super().__init__(coordinator)
+        super().__init__(coordinator, DeviceContext(KIND_SIREN, siren_id))
         self.siren_id = siren_id
         self._ref_id = entry_id
         siren = coordinator.sirens.get(siren_id)
@@ -172,9 +172,11 @@ class HikSirenSwitch(CoordinatorEntity, SwitchEntity):
 
     @property
     def available(self) -> bool:
-        if self.coordinator.siren_control_supported.get(self.siren_id) is False:
-            return False
-        return self.siren_id in self.coordinator.sirens
+        return (
+            super().available
+            and self.coordinator.siren_control_available(self.siren_id)
+            and self.siren_id in self.coordinator.sirens
+        )
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -187,14 +189,12 @@ class HikSirenSwitch(CoordinatorEntity, SwitchEntity):
 
     async def async_turn_on(self, **kwargs):
         """Sound the siren."""
-        if await self.coordinator.siren_on(self.siren_id):
-            self._attr_is_on = True
+        if not await self.coordinator.siren_on(self.siren_id):
+            # Availability follows siren_control_available, not siren data.
             self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
 
     async def async_turn_off(self, **kwargs):
         """Silence the siren."""
-        if await self.coordinator.siren_off(self.siren_id):
-            self._attr_is_on = False
+        if not await self.coordinator.siren_off(self.siren_id):
+            # Availability follows siren_control_available, not siren data.
             self.async_write_ha_state()
-            await self.coordinator.async_request_refresh()
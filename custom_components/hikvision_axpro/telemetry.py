@@ -0,0 +1,151 @@
+"""Columnar numeric telemetry of zones and peripherals.
+
+Temperature, humidity, signal and battery values of every device are kept in
+one ``array`` per metric, indexed by a dense device index, so fleet-wide
+questions ("weakest signal", "devices with a battery below 20 %") are single
+passes over contiguous floats instead of attribute lookups on every model.
+Missing values are stored as NaN.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import math
+from typing import Any
+
+METRIC_TEMPERATURE = "temperature"
+METRIC_HUMIDITY = "humidity"
+METRIC_SIGNAL = "signal"
+METRIC_REAL_SIGNAL = "real_signal"
+METRIC_CHARGE = "charge_value"
+
+METRICS = (
+    METRIC_TEMPERATURE,
+    METRIC_HUMIDITY,
+    METRIC_SIGNAL,
+    METRIC_REAL_SIGNAL,
+    METRIC_CHARGE,
+)
+""" Model attribute names stored; models without an attribute store NaN """
+
+_NAN = math.nan
+
+DeviceKey = tuple[str, int]
+""" ``(kind, device id)`` """
+
+
+@dataclass(frozen=True, slots=True)
+class MetricStats:
+    """Aggregate of the devices reporting a metric."""
+
+    count: int
+    min: float
+    max: float
+    mean: float
+
+
+class TelemetryStore:
+    """One float column per metric over all devices of the tracked kinds."""
+
+    def __init__(self) -> None:
+        self._sources: dict[str, Mapping[int, Any]] = {}
+        self._rows: dict[str, int] = {}
+        self._keys: list[DeviceKey] = []
+        self._index: dict[DeviceKey, int] = {}
+        self._columns: dict[str, array] = {metric: array("d") for metric in METRICS}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def update(
+        self,
+        kind: str,
+        devices: Mapping[int, Any],
+        changes: Mapping[int, Any] | None = None,
+    ) -> None:
+        """Take the values of ``devices`` of ``kind``.
+
+        Only the devices in ``changes`` are re-read while the devices of the
+        kind stay the same; otherwise the columns are rebuilt.
+        """
+        rows = self._rows.get(kind)
+        self._sources[kind] = devices
+        if (
+            changes is None
+            or rows != len(devices)
+            or any((kind, device_id) not in self._index for device_id in devices)
+        ):
+            self._rebuild()
+            return
+        self.refresh(kind, changes)
+
+    def refresh(self, kind: str, device_ids: Iterable[int]) -> None:
+        """Re-read ``device_ids`` of ``kind`` (e.g. after patching them)."""
+        devices = self._sources.get(kind) or {}
+        for device_id in device_ids:
+            index = self._index.get((kind, device_id))
+            device = devices.get(device_id)
+            if index is not None and device is not None:
+                for metric, column in self._columns.items():
+                    column[index] = _read(device, metric)
+
+    def _rebuild(self) -> None:
+        self._keys = [
+            (kind, device_id)
+            for kind, devices in self._sources.items()
+            for device_id in devices
+        ]
+        self._index = {key: index for index, key in enumerate(self._keys)}
+        self._rows = {kind: len(devices) for kind, devices in self._sources.items()}
+        self._columns = {
+            metric: array(
+                "d",
+                (
+                    _read(self._sources[kind][device_id], metric)
+                    for kind, device_id in self._keys
+                ),
+            )
+            for metric in METRICS
+        }
+
+    def value(self, kind: str, device_id: int, metric: str) -> float | None:
+        index = self._index.get((kind, device_id))
+        if index is None:
+            return None
+        value = self._columns[metric][index]
+        return None if math.isnan(value) else value
+
+    def stats(self, metric: str) -> MetricStats | None:
+        """Min / max / mean of ``metric``; ``None`` when no device reports it."""
+        values = [value for value in self._columns[metric] if value == value]
+        if not values:
+            return None
+        return MetricStats(
+            len(values), min(values), max(values), math.fsum(values) / len(values)
+        )
+
+    def below(self, metric: str, threshold: float) -> list[DeviceKey]:
+        """Devices whose ``metric`` is below ``threshold``."""
+        keys = self._keys
+        # NaN compares false, so devices not reporting the metric never match.
+        return [
+            keys[index]
+            for index, value in enumerate(self._columns[metric])
+            if value < threshold
+        ]
+
+    def above(self, metric: str, threshold: float) -> list[DeviceKey]:
+        """Devices whose ``metric`` is above ``threshold``."""
+        keys = self._keys
+        return [
+            keys[index]
+            for index, value in enumerate(self._columns[metric])
+            if value > threshold
+        ]
+
+
+def _read(device: Any, metric: str) -> float:
+    value = getattr(device, metric, None)
+    return _NAN if value is None else float(value)
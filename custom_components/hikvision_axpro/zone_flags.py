@@ -0,0 +1,147 @@
+"""Packed per-zone boolean state for whole-panel queries.
+
+Each zone gets a dense index (its position in zone id order). Every flag is
+kept as two integers used as bitsets: the zones where it is true and the zones
+that reported it at all. Whole-panel questions ("which zones are open", "what
+changed since the last poll") become bitwise operations and popcounts instead
+of loops over the zone objects.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+FLAG_TAMPER = "tamper_evident"
+FLAG_SHIELDED = "shielded"
+FLAG_BYPASSED = "bypassed"
+FLAG_ARMED = "armed"
+FLAG_IS_ARMING = "is_arming"
+FLAG_ALARM = "alarm"
+FLAG_STAY_AWAY = "stay_away"
+FLAG_OPEN = "magnet_open_status"
+FLAG_VIA_REPEATER = "is_via_repeater"
+FLAG_ABNORMAL = "abnormal_or_not"
+FLAG_MASKING = "is_masking"
+FLAG_TRIGGERED = "triggered"
+""" Derived: zone ``status`` is ``trigger`` """
+
+
+def _triggered(zone: Any) -> bool | None:
+    status = zone.status
+    return None if status is None else status.value == "trigger"
+
+
+FLAGS: dict[str, Callable[[Any], bool | None]] = {
+    name: (lambda zone, name=name: getattr(zone, name))
+    for name in (
+        FLAG_TAMPER,
+        FLAG_SHIELDED,
+        FLAG_BYPASSED,
+        FLAG_ARMED,
+        FLAG_IS_ARMING,
+        FLAG_ALARM,
+        FLAG_STAY_AWAY,
+        FLAG_OPEN,
+        FLAG_VIA_REPEATER,
+        FLAG_ABNORMAL,
+        FLAG_MASKING,
+    )
+}
+FLAGS[FLAG_TRIGGERED] = _triggered
+""" Flag name -> reader returning ``None`` when the zone does not report it """
+
+
+class ZoneFlags:
+    """Bitsets of every flag over the dense zone indexes."""
+
+    def __init__(self) -> None:
+        self._ids: list[int] = []
+        self._index: dict[int, int] = {}
+        self._values: dict[str, int] = dict.fromkeys(FLAGS, 0)
+        self._known: dict[str, int] = dict.fromkeys(FLAGS, 0)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def update(
+        self, zones: Mapping[int, Any], changes: Mapping[int, Any] | None = None
+    ) -> dict[str, int]:
+        """Take the state of ``zones``; returns the flipped bits per flag.
+
+        Only the zones in ``changes`` are re-read while the set of zone ids is
+        unchanged; otherwise every zone is re-indexed and read.
+        """
+        if changes is None or len(zones) != len(self._ids) or any(
+            zone_id not in self._index for zone_id in zones
+        ):
+            return self._rebuild(zones)
+        return self.refresh(zones, changes)
+
+    def refresh(
+        self, zones: Mapping[int, Any], zone_ids: Iterable[int]
+    ) -> dict[str, int]:
+        """Re-read ``zone_ids`` (e.g. after patching them in place)."""
+        old = dict(self._values)
+        values, known = self._values, self._known
+        for zone_id in zone_ids:
+            index = self._index.get(zone_id)
+            zone = zones.get(zone_id)
+            if index is None or zone is None:
+                continue
+            bit = 1 << index
+            for name, read in FLAGS.items():
+                value = read(zone)
+                if value is None:
+                    known[name] &= ~bit
+                else:
+                    known[name] |= bit
+                if value:
+                    values[name] |= bit
+                else:
+                    values[name] &= ~bit
+        return _flipped(old, values)
+
+    def _rebuild(self, zones: Mapping[int, Any]) -> dict[str, int]:
+        old_ids, old_values = self._ids, self._values
+        self._ids = sorted(zones)
+        self._index = {zone_id: index for index, zone_id in enumerate(self._ids)}
+        self._values = dict.fromkeys(FLAGS, 0)
+        self._known = dict.fromkeys(FLAGS, 0)
+        self.refresh(zones, self._ids)
+        # Move the previous bits to the new indexes; bits of removed zones are
+        # dropped, added zones flip where their flags are set.
+        old = dict.fromkeys(FLAGS, 0)
+        for name, bits in old_values.items():
+            while bits:
+                low = bits & -bits
+                index = self._index.get(old_ids[low.bit_length() - 1])
+                if index is not None:
+                    old[name] |= 1 << index
+                bits ^= low
+        return _flipped(old, self._values)
+
+    def mask(self, flag: str) -> int:
+        """Zones where ``flag`` is true."""
+        return self._values[flag]
+
+    def unknown(self, flag: str) -> int:
+        """Zones that do not report ``flag``."""
+        return ((1 << len(self._ids)) - 1) & ~self._known[flag]
+
+    def count(self, flag: str) -> int:
+        """Number of zones where ``flag`` is true."""
+        return self._values[flag].bit_count()
+
+    def zone_ids(self, mask: int) -> list[int]:
+        """Zone ids of the set bits of ``mask``, in id order."""
+        ids = []
+        while mask:
+            low = mask & -mask
+            ids.append(self._ids[low.bit_length() - 1])
+            mask ^= low
+        return ids
+
+
+def _flipped(old: Mapping[str, int], new: Mapping[str, int]) -> dict[str, int]:
+    return {name: bits ^ old[name] for name, bits in new.items() if bits != old[name]}
@@ -0,0 +1,110 @@
+"""Local fake AX Pro panel serving ISAPI over aiohttp for tests and benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import json
+from typing import Any
+
+from aiohttp import web
+
+XML_SCHEMA = "http://www.hikvision.com/ver20/XMLSchema"
+
+SESSION_CAPABILITIES = f"""<?xml version="1.0" encoding="UTF-8"?>
+<SessionLoginCap version="2.0" xmlns="{XML_SCHEMA}">
+<sessionID>fake-session</sessionID>
+<challenge>0123456789abcdef</challenge>
+<iterations>100</iterations>
+<isIrreversible>true</isIrreversible>
+<salt>salt</salt>
+<salt2>salt2</salt2>
+<sessionIDVersion>2</sessionIDVersion>
+</SessionLoginCap>"""
+
+INTERFACES = f"""<?xml version="1.0" encoding="UTF-8"?>
+<NetworkInterfaceList version="2.0" xmlns="{XML_SCHEMA}">
+<NetworkInterface><id>1</id><Link><MACAddress>aa:bb:cc:dd:ee:ff</MACAddress></Link></NetworkInterface>
+</NetworkInterfaceList>"""
+
+
+class FakePanel:
+    """Minimal ISAPI server with session login and per-path latency.
+
+    Route values may be a payload, a ``str`` (served as XML), a callable taking
+    the decoded JSON body, or a coroutine function taking the raw request.
+    """
+
+    def __init__(
+        self,
+        routes: dict[tuple[str, str], Any] | None = None,
+        latency: dict[str, float] | None = None,
+    ) -> None:
+        self.routes: dict[tuple[str, str], Any] = {
+            ("GET", "/ISAPI/System/Network/interfaces"): INTERFACES,
+        }
+        self.routes.update(routes or {})
+        self.latency = latency or {}
+        self.requests: Counter[str] = Counter()
+        self.logins = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.session = "WebSession=cookie-1"
+        self._runner: web.AppRunner | None = None
+        self.port: int | None = None
+
+    @property
+    def host(self) -> str:
+        return f"127.0.0.1:{self.port}"
+
+    def expire_session(self) -> None:
+        self.session = f"WebSession=cookie-{self.logins + 1}"
+
+    async def _handle(self, request: web.Request) -> web.StreamResponse:
+        path = request.path
+        self.requests[path] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if delay := self.latency.get(path):
+                await asyncio.sleep(delay)
+            if path == "/ISAPI/Security/sessionLogin/capabilities":
+                return web.Response(text=SESSION_CAPABILITIES, content_type="text/xml")
+            if path == "/ISAPI/Security/sessionLogin":
+                self.logins += 1
+                self.session = f"WebSession=cookie-{self.logins}"
+                return web.Response(
+                    text="<ResponseStatus/>",
+                    headers={"Set-Cookie": f"{self.session}; path=/"},
+                )
+            if request.headers.get("Cookie") != self.session:
+                return web.Response(status=401)
+            handler = self.routes.get((request.method, path))
+            if handler is None:
+                return web.Response(status=404, text="notSupport")
+            if asyncio.iscoroutinefunction(handler):
+                return await handler(request)
+            if callable(handler):
+                body = await request.read()
+                handler = handler(json.loads(body) if body else None)
+            if isinstance(handler, web.StreamResponse):
+                return handler
+            if isinstance(handler, str):
+                return web.Response(text=handler, content_type="text/xml")
+            return web.json_response(handler)
+        finally:
+            self.in_flight -= 1
+
+    async def start(self) -> FakePanel:
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]  # noqa: SLF001
+        return self
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
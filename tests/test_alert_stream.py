@@ -0,0 +1,215 @@
+"""Tests for the alertStream parser and listener."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+hikaxpro = pytest.importorskip("hikaxpro")
+
+from aiohttp import web  # noqa: E402
+
+from .fake_panel import FakePanel  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load(name: str):
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+isapi = _load("isapi")
+alert_stream = _load("alert_stream")
+
+
+def _cid(code: int, zone: int | None = None, sub: int = 1) -> dict:
+    event = {"code": code, "subSystemNo": sub}
+    if zone is not None:
+        event["zone"] = zone
+    return {"eventType": "cidEvent", "eventState": "active", "CIDEvent": event}
+
+
+HEARTBEAT = {"eventType": "videoloss", "eventState": "inactive"}
+
+
+def _part(payload: dict, with_length: bool = True) -> bytes:
+    body = json.dumps(payload).encode()
+    headers = b"--boundary\r\nContent-Type: application/json; charset=\"UTF-8\"\r\n"
+    if with_length:
+        headers += b"Content-Length: %d\r\n" % len(body)
+    return headers + b"\r\n" + body + b"\r\n"
+
+
+@pytest.mark.parametrize("with_length", [True, False])
+def test_parser_handles_arbitrary_chunking(with_length):
+    stream = b"".join(
+        _part(p, with_length) for p in (_cid(3401), HEARTBEAT, _cid(1130, zone=3))
+    )
+    # The last part has no successor delimiter when framed by boundaries.
+    stream += b"--boundary\r\n"
+    for size in (1, 7, len(stream)):
+        parser = alert_stream.MultipartParser(b"boundary")
+        parts = []
+        for i in range(0, len(stream), size):
+            parts.extend(parser.feed(stream[i : i + size]))
+        events = [alert_stream.parse_event(h, b) for h, b in parts]
+        assert [e.cid_code for e in events] == [3401, None, 1130]
+        assert events[1].is_heartbeat
+        assert events[2].zone == 2
+
+
+def test_parse_xml_event():
+    body = (
+        b'<EventNotificationAlert xmlns="http://www.hikvision.com/ver20/XMLSchema">'
+        b"<eventType>cidEvent</eventType><eventState>active</eventState>"
+        b"<CIDEvent><code>1401</code><subSystemNo>2</subSystemNo></CIDEvent>"
+        b"</EventNotificationAlert>"
+    )
+    event = alert_stream.parse_event({"content-type": "application/xml"}, body)
+    assert event.action == alert_stream.ACTION_DISARM
+    assert event.sub_system == 2
+
+
+@pytest.mark.parametrize(
+    ("code", "action"),
+    [
+        (3401, "arm_away"),
+        (3441, "arm_home"),
+        (1401, "disarm"),
+        (1130, "alarm"),
+        (3130, "alarm_restore"),
+        (1570, "bypass"),
+        (3570, "bypass_restore"),
+        (1301, None),
+        (None, None),
+    ],
+)
+def test_classify_cid(code, action):
+    assert alert_stream.classify_cid(code) == action
+
+
+def test_boundary_from_content_type():
+    parse = alert_stream.boundary_from_content_type
+    assert parse('multipart/mixed; boundary="MIME_boundary"') == b"MIME_boundary"
+    assert parse("multipart/mixed; boundary=abc") == b"abc"
+    assert parse(None) == b"boundary"
+
+
+async def _stream_handler(request: web.Request) -> web.StreamResponse:
+    response = web.StreamResponse(
+        headers={"Content-Type": "multipart/mixed; boundary=boundary"}
+    )
+    await response.prepare(request)
+    for payload in (_cid(3441), HEARTBEAT, _cid(1130, zone=1)):
+        await response.write(_part(payload))
+    await response.write_eof()
+    return response
+
+
+def _run_listener(panel: FakePanel, attempts: int):
+    events, connections, delays = [], [], []
+
+    async def run():
+        await panel.start()
+        axpro = hikaxpro.HikAxPro(panel.host, "admin", "secret")
+        client = isapi.IsapiClient(
+            aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar()), axpro
+        )
+
+        async def sleep(delay):
+            delays.append(delay)
+            if len(delays) >= attempts:
+                listener.stop()
+
+        listener = alert_stream.AlertStreamListener(
+            client, events.append, connections.append, max_backoff=4, sleep=sleep
+        )
+        try:
+            await asyncio.wait_for(listener.async_run(), 5)
+        finally:
+            await client.async_close()
+            await panel.stop()
+
+    asyncio.run(run())
+    return events, connections, delays
+
+
+def test_listener_dispatches_events_and_reconnects():
+    panel = FakePanel({("GET", alert_stream.ALERT_STREAM_PATH): _stream_handler})
+
+    events, connections, delays = _run_listener(panel, attempts=2)
+
+    assert [e.action for e in events] == ["arm_home", "alarm"] * 2
+    assert events[1].zone == 0
+    assert connections == [True, False, True, False]
+    assert delays == [1.0, 1.0]
+    assert panel.logins == 1
+
+
+def test_listener_backs_off_exponentially():
+    panel = FakePanel()
+
+    events, connections, delays = _run_listener(panel, attempts=5)
+
+    assert events == [] and connections == []
+    assert delays == [1.0, 2.0, 4.0, 4.0, 4.0]
+
+
+def test_cancelled_listener_does_not_report_the_disconnect():
+    connected = asyncio.Event()
+
+    async def hanging_handler(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(
+            headers={"Content-Type": "multipart/mixed; boundary=boundary"}
+        )
+        await response.prepare(request)
+        await response.write(_part(HEARTBEAT))
+        await asyncio.sleep(10)
+        return response
+
+    panel = FakePanel({("GET", alert_stream.ALERT_STREAM_PATH): hanging_handler})
+    connections = []
+
+    def on_connection_change(state: bool) -> None:
+        # The coordinator schedules a reconcile refresh from here.
+        connections.append(state)
+        connected.set()
+
+    async def run():
+        await panel.start()
+        axpro = hikaxpro.HikAxPro(panel.host, "admin", "secret")
+        client = isapi.IsapiClient(
+            aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar()), axpro
+        )
+        listener = alert_stream.AlertStreamListener(
+            client, lambda event: None, on_connection_change
+        )
+        task = asyncio.ensure_future(listener.async_run())
+        try:
+            await asyncio.wait_for(connected.wait(), 5)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        finally:
+            await client.async_close()
+            await panel.stop()
+        return listener
+
+    listener = asyncio.run(run())
+    assert connections == [True]
+    assert not listener.connected
@@ -0,0 +1,160 @@
+"""Tests for the endpoint capability registry and its circuit breaker."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+hikaxpro = pytest.importorskip("hikaxpro")
+
+from .fake_panel import FakePanel  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load(name: str):
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+capabilities = _load("capabilities")
+isapi = _load("isapi")
+poll = _load("poll")
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _rejection(code: int = 403):
+    return hikaxpro.errors.UnexpectedResponseCodeError(code, "notSupport")
+
+
+def test_unknown_and_supported_endpoints_are_allowed():
+    registry = capabilities.CapabilityRegistry(clock=_Clock())
+
+    assert registry.supported("batteries") is None
+    assert registry.allowed("batteries")
+    registry.record("batteries", b"{}")
+    assert registry.supported("batteries") is True
+    assert registry.allowed("batteries")
+
+
+def test_rejections_back_off_exponentially_up_to_the_cap():
+    clock = _Clock()
+    registry = capabilities.CapabilityRegistry(100, 350, clock=clock)
+
+    intervals = []
+    for _ in range(4):
+        assert registry.record("host_status", _rejection())
+        opened_at = clock.now
+        assert not registry.allowed("host_status")
+        clock.now += 1
+        while not registry.allowed("host_status"):
+            clock.now += 1
+        intervals.append(clock.now - opened_at)
+
+    assert intervals == [100, 200, 350, 350]
+    assert registry.supported("host_status") is False
+
+
+def test_success_closes_the_circuit():
+    clock = _Clock()
+    registry = capabilities.CapabilityRegistry(100, clock=clock)
+    registry.record_failure("batteries")
+    registry.record_failure("batteries")
+
+    registry.record_success("batteries")
+    registry.record_failure("batteries")
+
+    # The failure count restarted, so the first interval applies again.
+    clock.now += 100
+    assert registry.allowed("batteries")
+
+
+def test_transport_errors_and_expired_sessions_are_not_recorded():
+    registry = capabilities.CapabilityRegistry(clock=_Clock())
+
+    assert not registry.record("batteries", ConnectionError("offline"))
+    assert not registry.record("batteries", TimeoutError())
+    assert not registry.record("batteries", _rejection(401))
+    assert registry.supported("batteries") is None
+
+
+def test_round_trips_through_storage_dict():
+    clock = _Clock()
+    registry = capabilities.CapabilityRegistry(clock=clock)
+    saves = []
+    registry.on_change = lambda: saves.append(registry.as_dict())
+    registry.record_failure("ac_power_status")
+    registry.record_success("zones")
+    registry.record_success("zones")
+
+    restored = capabilities.CapabilityRegistry.from_dict(
+        json.loads(json.dumps(registry.as_dict())), clock=clock
+    )
+
+    assert len(saves) == 2
+    assert restored.as_dict() == registry.as_dict()
+    assert not restored.allowed("ac_power_status")
+    assert capabilities.CapabilityRegistry.from_dict(None).as_dict() == {}
+    assert capabilities.CapabilityRegistry.from_dict({"x": 1}).as_dict() == {}
+
+
+def test_fetch_skips_unsupported_optional_endpoints():
+    clock = _Clock()
+    registry = capabilities.CapabilityRegistry(300, clock=clock)
+    panel = FakePanel(
+        {
+            ("GET", request.path): {"key": request.key}
+            for request in poll.POLL_REQUESTS
+            if request.key != "host_status"
+        }
+    )
+
+    async def run():
+        await panel.start()
+        client = isapi.IsapiClient(
+            aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar()),
+            hikaxpro.HikAxPro(panel.host, "admin", "secret"),
+        )
+        try:
+            await client.async_login()
+            results = []
+            for advance in (0, 10, 300):
+                clock.now += advance
+                results.append(
+                    await poll.async_fetch_all(client, capabilities=registry)
+                )
+            return results
+        finally:
+            await client.async_close()
+            await panel.stop()
+
+    results = asyncio.run(run())
+
+    host_path = poll.POLL_HOST_STATUS.path
+    # Probed, skipped while the circuit is open, re-probed once it is due.
+    assert panel.requests[host_path] == 2
+    assert panel.requests[poll.POLL_BATTERIES.path] == 3
+    assert all(result["host_status"] is None for result in results)
+    assert registry.supported("host_status") is False
+    assert registry.supported("batteries") is True
@@ -0,0 +1,109 @@
+"""Tests for per-device change sets and targeted listener dispatch."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load(name: str):
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+delta = _load("delta")
+model = _load("model")
+
+
+@dataclass
+class Device:
+    id: int
+    alarm: bool = False
+    temperature: int | None = None
+
+
+def test_diff_devices_reports_fields_added_and_removed():
+    old = {0: Device(0), 1: Device(1), 2: Device(2)}
+    new = {0: Device(0), 1: Device(1, alarm=True, temperature=21), 3: Device(3)}
+
+    assert delta.diff_devices(old, new) == {
+        1: frozenset({"alarm", "temperature"}),
+        2: None,
+        3: None,
+    }
+    assert delta.diff_devices(None, {0: Device(0)}) == {0: None}
+    assert delta.diff_devices(new, new) == {}
+
+
+def test_merge_changes_unions_fields():
+    target: delta.ChangeSet = {}
+    delta.merge_changes(target, "zone", {1: frozenset({"alarm"})})
+    delta.merge_changes(target, "zone", {1: frozenset({"bypassed"}), 2: None})
+    delta.merge_changes(target, "zone", {2: frozenset({"alarm"})})
+    delta.merge_changes(target, "siren", {})
+
+    assert target == {"zone": {1: frozenset({"alarm", "bypassed"}), 2: None}}
+
+
+def test_listener_index_targets_changed_fields():
+    index = delta.ListenerIndex()
+    calls: list[str] = []
+    index.add(lambda: calls.append("panel"))
+    index.add(lambda: calls.append("z1-alarm"), delta.zone_context(1, "alarm"))
+    index.add(lambda: calls.append("z1-temp"), delta.zone_context(1, "temperature"))
+    remove = index.add(lambda: calls.append("z2-any"), delta.zone_context(2))
+    index.add(lambda: calls.append("s1"), delta.DeviceContext(delta.KIND_SIREN, 1))
+
+    assert index.notify({"zone": {1: frozenset({"alarm"})}}) == 2
+    assert calls == ["panel", "z1-alarm"]
+
+    calls.clear()
+    index.notify({"zone": {1: None, 2: frozenset({"alarm"})}})
+    assert sorted(calls) == ["panel", "z1-alarm", "z1-temp", "z2-any"]
+
+    calls.clear()
+    remove()
+    assert index.notify(None) == 4
+    assert "z2-any" not in calls
+
+
+def test_lazy_zone_fields_are_diffed_without_decoding():
+    payload = {"id": 1, "status": "online", "armed": False, "associateRelayCfg": [1]}
+    old = model.Zone.from_dict(payload)
+    new = model.Zone.from_dict({**payload, "associateRelayCfg": [2], "signal": 90})
+    lazy = model.Zone.__lazy__["associate_relay_cfg"]
+
+    assert delta.changed_fields(old, new) == {"associate_relay_cfg", "signal"}
+    assert not lazy.decoded(new)
+
+    # Once one side was read, the decoded values are compared.
+    assert new.associate_relay_cfg == [2]
+    assert delta.changed_fields(old, new) == {"associate_relay_cfg", "signal"}
+    assert delta.changed_fields(old, model.Zone.from_dict(payload)) == frozenset()
+
+
+def test_change_mask_of_a_replacing_instance_is_trusted():
+    cache = model.InstanceCache(model.Zone)
+    payload = {"id": 1, "status": "online", "armed": False}
+    (old,) = cache.decode_all([payload])
+    (new,) = cache.decode_all([{**payload, "alarm": True}])
+
+    assert delta.diff_devices({1: old}, {1: new}) == {1: frozenset({"alarm"})}
+    assert (
+        delta.diff_devices(
+            {1: new}, {1: cache.decode_all([{**payload, "alarm": True}])[0]}
+        )
+        == {}
+    )
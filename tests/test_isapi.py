@@ -0,0 +1,354 @@
+"""Tests for the async ISAPI transport against a local fake panel."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+hikaxpro = pytest.importorskip("hikaxpro")
+
+from .fake_panel import FakePanel  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load_isapi():
+    name = "hikvision_axpro.isapi"
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.spec_from_file_location(name, COMPONENT / "isapi.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+isapi = _load_isapi()
+
+ZONES = {"ZoneList": [{"Zone": {"id": 0, "name": "Door", "armed": False}}]}
+
+
+async def _with_client(panel: FakePanel, fn, **kwargs):
+    await panel.start()
+    axpro = hikaxpro.HikAxPro(
+        panel.host, "admin", "secret", user_level=hikaxpro.USER_LEVEL_ADMIN_OPERATOR
+    )
+    client = isapi.IsapiClient(
+        aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar()), axpro, **kwargs
+    )
+    try:
+        return await fn(client)
+    finally:
+        await client.async_close()
+        await panel.stop()
+
+
+def test_build_url_matches_hikaxpro():
+    for endpoint in ("http://h/ISAPI/a", "http://h/ISAPI/a?ways=away"):
+        assert isapi.build_url(endpoint, True) == hikaxpro.HikAxPro.build_url(
+            endpoint, True
+        )
+        assert isapi.build_url(endpoint) == endpoint
+
+
+def test_login_and_json_request_reuse_session():
+    panel = FakePanel({("GET", "/ISAPI/SecurityCP/status/zones"): ZONES})
+
+    async def run(client):
+        first = await client.async_zone_status()
+        second = await client.async_zone_status()
+        return first, second
+
+    first, second = asyncio.run(_with_client(panel, run))
+    assert first == ZONES == second
+    assert panel.logins == 1
+    assert panel.requests["/ISAPI/SecurityCP/status/zones"] == 2
+
+
+def test_relogin_once_on_401():
+    panel = FakePanel({("GET", "/ISAPI/SecurityCP/status/zones"): ZONES})
+
+    async def run(client):
+        await client.async_zone_status()
+        panel.expire_session()
+        return await client.async_zone_status()
+
+    assert asyncio.run(_with_client(panel, run)) == ZONES
+    assert panel.logins == 2
+    assert panel.requests["/ISAPI/SecurityCP/status/zones"] == 3
+
+
+def test_unexpected_status_raises():
+    panel = FakePanel()
+
+    async def run(client):
+        await client.async_host_status()
+
+    with pytest.raises(hikaxpro.errors.UnexpectedResponseCodeError, match="notSupport"):
+        asyncio.run(_with_client(panel, run))
+
+
+def test_interface_mac_address():
+    panel = FakePanel()
+
+    async def run(client):
+        return await client.async_get_interface_mac_address(1)
+
+    assert asyncio.run(_with_client(panel, run)) == "aa:bb:cc:dd:ee:ff"
+
+
+def test_connection_error_is_mapped():
+    axpro = hikaxpro.HikAxPro("127.0.0.1:9", "admin", "secret")
+
+    async def run():
+        client = isapi.IsapiClient(aiohttp.ClientSession(), axpro)
+        try:
+            await client.async_zone_status()
+        finally:
+            await client.async_close()
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(run())
+
+
+def test_json_decoder_is_pluggable():
+    panel = FakePanel({("GET", "/ISAPI/SecurityCP/status/zones"): ZONES})
+    decoded: list[bytes] = []
+
+    def loads(content: bytes):
+        decoded.append(content)
+        return isapi.json_loads(content)
+
+    async def run(client):
+        client.loads = loads
+        return await client.async_zone_status()
+
+    assert asyncio.run(_with_client(panel, run)) == ZONES
+    assert len(decoded) == 1 and isinstance(decoded[0], bytes)
+
+
+def test_response_decodes_bytes_and_formats_lazily():
+    response = isapi.IsapiResponse(200, b'{"a": [1, 2]}')
+
+    assert response.json() == {"a": [1, 2]}
+    assert str(response) == '{"a": [1, 2]}'
+    with pytest.raises(ValueError):
+        isapi.IsapiResponse(200, b"<xml/>").json()
+
+
+DEVICE_INFO = f"""<?xml version="1.0" encoding="UTF-8"?>
+<DeviceInfo version="2.0" xmlns="{isapi.hikaxpro.consts.XML_SCHEMA}">
+<deviceName>Home</deviceName>
+<model>DS-PWA96-M-WE</model>
+<firmwareVersion>V1.2.8</firmwareVersion>
+</DeviceInfo>"""
+
+
+def test_xml_decoder_extracts_path_across_chunks():
+    body = (
+        b'<?xml version="1.0"?><List xmlns="urn:x"><Skip><a>1</a></Skip>'
+        b"<Item><id>1</id><Link><MAC>m1</MAC></Link></Item>"
+        b"<Item><id>2</id><tag>x</tag><tag>y</tag></Item></List>"
+    )
+    decoder = isapi.XmlElementDecoder("List/Item")
+
+    found = []
+    for start in range(0, len(body), 7):
+        found += decoder.feed(body[start : start + 7])
+    found += decoder.close()
+
+    assert found == [
+        {"id": "1", "Link": {"MAC": "m1"}},
+        {"id": "2", "tag": ["x", "y"]},
+    ]
+
+
+def test_device_info_is_streamed():
+    panel = FakePanel({("GET", "/ISAPI/System/deviceInfo"): DEVICE_INFO})
+
+    info = asyncio.run(_with_client(panel, lambda c: c.async_get_device_info()))
+
+    assert info == {
+        "deviceName": "Home",
+        "model": "DS-PWA96-M-WE",
+        "firmwareVersion": "V1.2.8",
+    }
+
+
+def _output_search(total: int, cap: int, with_total: bool = True):
+    def handler(body):
+        cond = body["OutputCond"]
+        start = cond["searchResultPosition"]
+        ids = range(start, min(start + min(cond["maxResults"], cap), total + 1))
+        page = {
+            "searchID": cond["searchID"],
+            "responseStatusStrg": "MORE" if ids.stop <= total else "OK",
+            "numOfMatches": len(ids),
+            "OutputList": [{"Output": {"id": i}} for i in ids],
+        }
+        if with_total:
+            page["totalMatches"] = total
+        return {"OutputSearch": page}
+
+    return handler
+
+
+def _search(client, **kwargs):
+    return client.async_search(
+        "/ISAPI/SecurityCP/status/outputStatus",
+        "OutputCond",
+        "OutputSearch",
+        "OutputList",
+        {"moduleType": "localWired"},
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize("with_total", [True, False])
+def test_search_follows_all_pages(with_total):
+    path = "/ISAPI/SecurityCP/status/outputStatus"
+    panel = FakePanel({("POST", path): _output_search(120, 30, with_total)})
+
+    async def run(client):
+        return [entry["Output"]["id"] async for entry in _search(client)]
+
+    ids = asyncio.run(_with_client(panel, run))
+
+    assert sorted(ids) == list(range(1, 121))
+    assert panel.requests[path] == 4
+
+
+def test_search_stops_when_closed_early():
+    path = "/ISAPI/SecurityCP/status/outputStatus"
+    panel = FakePanel(
+        {("POST", path): _output_search(500, 50)}, latency={path: 0.05}
+    )
+
+    async def run(client):
+        entries = _search(client, max_concurrency=1)
+        async for entry in entries:
+            if entry["Output"]["id"] == 3:
+                break
+        await entries.aclose()
+
+    asyncio.run(_with_client(panel, run))
+
+    assert panel.requests[path] <= 2
+
+
+def test_bypass_zones_reports_each_zone_with_bounded_concurrency():
+    bypass = "/ISAPI/SecurityCP/control/bypass/"
+    routes = {("PUT", f"{bypass}{zone_id}"): {} for zone_id in (1, 2, 4, 5)}
+    panel = FakePanel(
+        routes, latency={f"{bypass}{zone_id}": 0.02 for zone_id in range(6)}
+    )
+
+    async def run(client):
+        return await client.async_bypass_zones([1, 2, 3, 4, 5, 2])
+
+    errors = asyncio.run(_with_client(panel, run))
+
+    assert list(errors) == [1, 2, 3, 4, 5]
+    assert [zone_id for zone_id, error in errors.items() if error] == [3]
+    assert isinstance(errors[3], hikaxpro.errors.UnexpectedResponseCodeError)
+    assert panel.max_in_flight <= isapi.BYPASS_CONCURRENCY
+    assert sum(panel.requests[f"{bypass}{zone_id}"] for zone_id in range(6)) == 5
+
+
+def test_scheduler_starts_commands_first_and_caps_background():
+    scheduler = isapi.RequestScheduler(2)
+    started = []
+
+    async def request(name, priority, hold):
+        async with scheduler.slot(priority):
+            started.append(name)
+            await hold.wait()
+
+    async def run():
+        holds = {}
+
+        def spawn(name, priority):
+            holds[name] = asyncio.Event()
+            return asyncio.create_task(request(name, priority, holds[name]))
+
+        tasks = [spawn("peripherals", 2), spawn("diagnostics", 3)]
+        await asyncio.sleep(0)
+        # One slot stays free of background requests.
+        assert started == ["peripherals"]
+        tasks.append(spawn("subsystems", isapi.PRIORITY_POLL))
+        await asyncio.sleep(0)
+        assert started == ["peripherals", "subsystems"]
+        tasks += [spawn("zones", isapi.PRIORITY_POLL), spawn("disarm", 0)]
+        await asyncio.sleep(0)
+        holds["subsystems"].set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        # The command jumps the polls queued before it.
+        assert started[2:] == ["disarm"]
+        for hold in holds.values():
+            hold.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.in_flight == scheduler.background == 0
+
+    asyncio.run(run())
+    assert started[3:] == ["zones", "diagnostics"]
+
+
+def test_scheduler_cancelled_waiter_frees_its_turn():
+    scheduler = isapi.RequestScheduler(1)
+
+    async def run():
+        hold = asyncio.Event()
+
+        async def request(priority):
+            async with scheduler.slot(priority):
+                await hold.wait()
+
+        first = asyncio.create_task(request(isapi.PRIORITY_POLL))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(request(isapi.PRIORITY_COMMAND))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        hold.set()
+        await first
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        async with scheduler.slot():
+            assert scheduler.in_flight == 1
+        assert scheduler.in_flight == 0
+
+    asyncio.run(run())
+
+
+def test_disarm_does_not_wait_behind_slow_peripheral_polls():
+    slow = {
+        "/ISAPI/SecurityCP/status/exDevStatus": 0.5,
+        "/ISAPI/SecurityCP/status/batteries": 0.5,
+    }
+    routes = {("GET", path): {} for path in slow}
+    routes[("PUT", "/ISAPI/SecurityCP/control/disarm/0xffffffff")] = {}
+    panel = FakePanel(routes, latency=slow)
+
+    async def run(client):
+        await client.async_login()
+        polls = [
+            asyncio.create_task(client.async_request_raw(path, priority=priority))
+            for path, priority in zip(slow, (2, 3))
+        ]
+        await asyncio.sleep(0.05)
+        started = asyncio.get_running_loop().time()
+        await client.async_disarm()
+        elapsed = asyncio.get_running_loop().time() - started
+        await asyncio.gather(*polls)
+        return elapsed
+
+    elapsed = asyncio.run(_with_client(panel, run, max_concurrency=2))
+
+    assert elapsed < 0.3
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import dataclasses
+from dataclasses import dataclass
 import importlib.util
 import sys
 from pathlib import Path
 
+import pytest
+
 ROOT = Path(__file__).resolve().parents[1]
 COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
 
@@ -510,3 +514,186 @@ def test_relay_status_is_on_accepts_string_and_enum():
         {"id": 0, "name": "rele1", "status": "on", "accessModuleType": "fourWiredOutput"}
     )
     assert model.relay_status_is_on(output.status) is True
+
+
+def _zone(**fields):
+    return {"id": 4, "status": "online", "armed": False, **fields}
+
+
+def test_schema_decoder_tolerates_unknown_enum_values(caplog):
+    model.parse_diagnostics.reset()
+    zone = model.Zone.from_dict(
+        _zone(detectorType="futureDetector", zoneType="Instant")
+    )
+
+    assert zone.detector_type is None
+    assert zone.zone_type is model.ZoneType.INSTANT
+    assert zone.name == "Zone ID 4"
+    assert "futureDetector" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        _zone(armed="no"),
+        _zone(bypassed=1),
+        _zone(signal=True),
+        _zone(charge=5),
+        [],
+    ],
+)
+def test_schema_decoder_rejects_invalid_strict_fields(payload):
+    with pytest.raises(model.DecodeError):
+        model.Zone.from_dict(payload)
+
+
+def test_schema_decoder_defaults_and_conversions():
+    subsys = model.SubSys.from_dict({"id": 1, "arming": "disarm", "alarm": False})
+    keypad_list = model.ZoneConfig.from_dict(
+        {"id": 1, "zoneName": "z", "detectorType": "bogus", "relatedKeypadNo": [1, 2]}
+    )
+    keypad_no = model.ZoneConfig.from_dict(
+        {"id": 1, "zoneName": "z", "relatedKeypadNo": 3, "alarmResistence": 2}
+    )
+
+    assert subsys.enabled is True
+    assert keypad_list.detector_type is model.DetectorType.OTHER
+    assert keypad_list.related_keypad_no == [1, 2]
+    assert keypad_no.related_keypad_no == 3
+    assert keypad_no.alarm_resistence == 2.0
+    assert type(keypad_no.alarm_resistence) is float
+
+
+def test_schema_must_list_every_dataclass_field():
+    @dataclass
+    class Pair:
+        first: int
+        second: int
+
+    with pytest.raises(TypeError):
+        model.schema(model.Field("first", "first", model.INT))(Pair)
+
+
+def test_models_are_slotted_and_configuration_is_frozen():
+    zone = model.Zone.from_dict(_zone())
+    config = model.ZoneConfig.from_dict({"id": 1, "zoneName": "z"})
+
+    assert not hasattr(zone, "__dict__")
+    zone.bypassed = True
+    with pytest.raises(AttributeError):
+        zone.unknown = 1
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.zone_name = "other"
+
+
+def test_cold_fields_decode_lazily_from_the_raw_zone(caplog):
+    model.parse_diagnostics.reset()
+    payload = _zone(
+        InputList=[{"id": 1, "enabled": True, "mode": "normalOpen"}],
+        linkageSubSystem="bogus",
+        realSignal=40,
+    )
+    zone = model.Zone.from_dict(payload)
+    lazy = model.Zone.__lazy__["linkage_sub_system"]
+
+    assert set(model.Zone.__lazy__) == {"linkage_sub_system", "associate_relay_cfg"}
+    assert zone.input_list == [model.InputList(1, True, "normalOpen")]
+    assert zone.real_signal == 40
+    assert not lazy.decoded(zone)
+    # Invalid cold values are tolerated when they are finally read.
+    assert "bogus" not in caplog.text
+    assert zone.linkage_sub_system is None
+    assert "bogus" in caplog.text
+    assert lazy.decoded(zone)
+    assert zone._undecoded == 0
+    assert zone == model.Zone.from_dict(payload)
+
+
+def test_zones_without_cold_fields_have_nothing_to_decode():
+    zone = model.Zone.from_dict(_zone())
+
+    assert zone._undecoded == 0
+    assert zone.linkage_sub_system is None
+
+
+def test_instance_cache_reuses_unchanged_devices():
+    cache = model.InstanceCache(model.Zone)
+    first = cache.decode_all([_zone(id=1), _zone(id=2)])
+
+    second = cache.decode_all([_zone(id=1), _zone(id=2, bypassed=True), None])
+
+    assert second[0] is first[0]
+    assert second[0]._changed == frozenset()
+    assert second[1] is not first[1]
+    assert second[1]._changed == {"bypassed"}
+    assert first[1]._changed is None
+
+
+def test_instance_cache_decodes_invalidated_and_returning_devices_again():
+    cache = model.InstanceCache(model.Zone)
+    (zone,) = cache.decode_all([_zone()])
+
+    zone.bypassed = True
+    cache.invalidate(zone.id)
+    (fresh,) = cache.decode_all([_zone()])
+    assert fresh is not zone and fresh.bypassed is None
+    assert fresh._changed is None
+
+    cache.decode_all([])
+    assert cache.decode_all([_zone()])[0] is not fresh
+
+
+def test_instance_cache_is_unchanged_by_a_failed_decode():
+    cache = model.InstanceCache(model.Zone)
+    (zone,) = cache.decode_all([_zone()])
+
+    with pytest.raises(model.DecodeError):
+        cache.decode_all([_zone(signal=1), _zone(id=5, armed=None)])
+
+    assert cache.decode_all([_zone()])[0] is zone
+
+
+def test_device_info_round_trip_ignores_xml_attributes():
+    # Snapshots saved before the XML decoder carry xmltodict attribute keys.
+    info = model.DeviceInfo.from_dict(
+        {"@xmlns": "urn:x", "deviceName": "Home", "model": "DS-PWA96", "deviceID": "1"}
+    )
+
+    assert (info.device_name, info.model, info.device_id) == ("Home", "DS-PWA96", "1")
+    raw = info.to_dict()
+    assert raw == {"deviceName": "Home", "model": "DS-PWA96", "deviceID": "1"}
+    assert model.DeviceInfo.from_dict(raw) == info
+
+
+def test_parse_anomalies_are_logged_once_and_counted(caplog):
+    diagnostics = model.ParseDiagnostics()
+    payload = {"id": 1, "detectorType": "futureDetector"}
+
+    for _ in range(3):
+        diagnostics.record("Zone", "detectorType", "futureDetector", payload)
+    diagnostics.record("Zone", "detectorType", "otherDetector", payload)
+
+    assert len(caplog.records) == 2
+    assert diagnostics.as_list() == [
+        {"model": "Zone", "key": "detectorType", "value": repr(value), "count": count}
+        for value, count in (("futureDetector", 3), ("otherDetector", 1))
+    ]
+    diagnostics.reset()
+    assert diagnostics.as_list() == []
+
+
+def test_device_catalog_names_and_capabilities():
+    assert model.detector_model_to_name("0x00028") == (
+        "Wireless External Magnet Detector"
+    )
+    assert model.detector_model_to_name("0x99999") == "0x99999"
+    assert model.detector_model_to_name(None) == "Unknown"
+
+    # Known model and configured detector type both contribute.
+    assert model.device_capabilities("0x00017", model.DetectorType.OTHER) == {
+        model.CAP_MAGNET_SHOCK
+    }
+    assert model.device_capabilities(
+        None, model.DetectorType.SLIM_MAGNETIC_CONTACT
+    ) == {model.CAP_MAGNET_CONTACT}
+    assert model.device_capabilities("0x00001", None) == frozenset()
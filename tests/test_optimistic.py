@@ -0,0 +1,134 @@
+"""Tests for optimistic command results and their reconciliation."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load(name: str):
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+optimistic = _load("optimistic")
+
+
+@dataclass
+class _Zone:
+    id: int
+    bypassed: bool = False
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _bypass(zone_id: int, value: bool = True):
+    return optimistic.Expectation("zone", zone_id, "bypassed", value, "zones")
+
+
+def _setup():
+    clock = _Clock()
+    ledger = optimistic.OptimisticLedger(hold=10, clock=clock)
+    zones = {1: _Zone(1), 2: _Zone(2)}
+    state = {"zone": zones}
+    return clock, ledger, state
+
+
+def test_overlay_writes_expected_values_and_reports_changes():
+    _, ledger, state = _setup()
+    ledger.expect(_bypass(1))
+    ledger.expect(_bypass(2, False))
+
+    changes = ledger.overlay(state.get)
+
+    assert state["zone"][1].bypassed is True
+    assert changes == {"zone": {1: frozenset({"bypassed"})}}
+    assert ledger.poll_keys() == frozenset({"zones"})
+
+
+def test_matching_fetch_confirms():
+    _, ledger, state = _setup()
+    ledger.expect(_bypass(1))
+    state["zone"] = {1: _Zone(1, bypassed=True)}
+
+    confirmed, rolled_back = ledger.reconcile(state.get, {"zones"})
+
+    assert [e.device_id for e in confirmed] == [1]
+    assert rolled_back == []
+    assert not ledger.pending
+
+
+def test_disagreement_is_held_then_rolled_back():
+    clock, ledger, state = _setup()
+    ledger.expect(_bypass(1))
+    ledger.overlay(state.get)
+
+    # Panel still reports the old value: keep showing the expected one.
+    state["zone"] = {1: _Zone(1)}
+    assert ledger.reconcile(state.get, {"zones"}) == ([], [])
+    ledger.overlay(state.get)
+    assert state["zone"][1].bypassed is True
+
+    clock.now += 10
+    state["zone"] = {1: _Zone(1)}
+    confirmed, rolled_back = ledger.reconcile(state.get, {"zones"})
+
+    assert confirmed == []
+    assert [e.device_id for e in rolled_back] == [1]
+    assert ledger.overlay(state.get) == {}
+    assert state["zone"][1].bypassed is False
+
+
+def test_only_fetched_endpoints_are_judged():
+    clock, ledger, state = _setup()
+    ledger.expect(_bypass(1))
+    clock.now += 60
+
+    assert ledger.reconcile(state.get, {"subsystems"}) == ([], [])
+    assert ledger.pending
+
+
+def test_vanished_device_rolls_back_and_expired_can_be_dropped():
+    clock, ledger, state = _setup()
+    ledger.expect(_bypass(1))
+    ledger.expect(_bypass(2))
+
+    state["zone"] = {2: _Zone(2)}
+    _, rolled_back = ledger.reconcile(state.get, {"zones"})
+    assert [e.device_id for e in rolled_back] == [1]
+
+    assert ledger.drop_expired() == []
+    clock.now += 10
+    assert [e.device_id for e in ledger.drop_expired()] == [2]
+    assert not ledger.pending
+
+
+def test_scope_limits_judged_devices():
+    _, ledger, state = _setup()
+    ledger.expect(_bypass(1))
+    ledger.expect(_bypass(2))
+    # Both carry the overlaid value; only zone 1 was actually re-read.
+    ledger.overlay(state.get)
+
+    confirmed, _ = ledger.reconcile(state.get, {"zones"}, scope=[("zone", 1)])
+
+    assert [e.device_id for e in confirmed] == [1]
+    assert [e.device_id for e in ledger.waiting_on("zones")] == [2]
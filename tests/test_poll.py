@@ -0,0 +1,324 @@
+"""Tests for the concurrent poll fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+hikaxpro = pytest.importorskip("hikaxpro")
+
+from .fake_panel import FakePanel  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load(name: str):
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+isapi = _load("isapi")
+poll = _load("poll")
+
+
+def _routes(skip=()):
+    return {
+        ("GET", request.path): {"key": request.key}
+        for request in poll.POLL_REQUESTS
+        if request.key not in skip
+    }
+
+
+async def _fetch(panel: FakePanel, max_concurrency: int):
+    await panel.start()
+    axpro = hikaxpro.HikAxPro(panel.host, "admin", "secret")
+    client = isapi.IsapiClient(
+        aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar()),
+        axpro,
+        max_concurrency,
+    )
+    try:
+        await client.async_login()
+        return await poll.async_fetch_all(client)
+    finally:
+        await client.async_close()
+        await panel.stop()
+
+
+def test_fetch_all_runs_concurrently_within_cap():
+    latency = {request.path: 0.05 for request in poll.POLL_REQUESTS}
+    panel = FakePanel(_routes(), latency)
+
+    payloads = asyncio.run(_fetch(panel, 3))
+
+    assert {k: json.loads(v) for k, v in payloads.items()} == {
+        r.key: {"key": r.key} for r in poll.POLL_REQUESTS
+    }
+    assert panel.max_in_flight == 3
+
+
+def test_cap_of_one_is_sequential():
+    latency = {request.path: 0.01 for request in poll.POLL_REQUESTS}
+    panel = FakePanel(_routes(), latency)
+
+    asyncio.run(_fetch(panel, 1))
+
+    assert panel.max_in_flight == 1
+
+
+def test_optional_failure_yields_none():
+    panel = FakePanel(_routes(skip={"ac_power_status", "batteries"}))
+
+    payloads = asyncio.run(_fetch(panel, 6))
+
+    assert payloads["ac_power_status"] is None
+    assert payloads["batteries"] is None
+    assert json.loads(payloads["zones"]) == {"key": "zones"}
+
+
+def test_required_failure_raises_after_all_complete():
+    panel = FakePanel(_routes(skip={"zones"}))
+
+    with pytest.raises(hikaxpro.errors.UnexpectedResponseCodeError):
+        asyncio.run(_fetch(panel, 6))
+    assert all(panel.requests[r.path] == 1 for r in poll.POLL_REQUESTS)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_requests_for_tiers():
+    keys = [r.key for r in poll.requests_for_tiers({poll.TIER_FAST})]
+    assert keys == ["subsystems", "zones"]
+    keys = [r.key for r in poll.requests_for_tiers({poll.TIER_SLOW})]
+    assert keys == ["host_status", "ac_power_status", "batteries"]
+
+
+def test_scheduler_tiers_follow_their_intervals():
+    clock = _Clock()
+    scheduler = poll.PollScheduler(
+        {poll.TIER_MEDIUM: 60, poll.TIER_SLOW: 300}, clock=clock
+    )
+    assert scheduler.due_tiers() == set(poll.POLL_TIERS)
+    scheduler.mark_polled(poll.POLL_TIERS)
+
+    clock.now += 10
+    assert scheduler.due_tiers() == {poll.TIER_FAST}
+    clock.now += 49.5
+    assert scheduler.due_tiers() == {poll.TIER_FAST, poll.TIER_MEDIUM}
+    scheduler.mark_polled({poll.TIER_FAST, poll.TIER_MEDIUM})
+
+    clock.now += 200
+    assert scheduler.due_tiers() == {poll.TIER_FAST, poll.TIER_MEDIUM}
+    scheduler.mark_polled({poll.TIER_FAST, poll.TIER_MEDIUM})
+    clock.now += 40.5
+    assert scheduler.due_tiers() == {poll.TIER_FAST, poll.TIER_SLOW}
+
+
+def test_scheduler_retries_tier_that_was_not_marked():
+    clock = _Clock()
+    scheduler = poll.PollScheduler({poll.TIER_MEDIUM: 60}, clock=clock)
+    scheduler.mark_polled({poll.TIER_FAST})
+    clock.now += 5
+    assert poll.TIER_MEDIUM in scheduler.due_tiers()
+
+
+def _counting_fetch(delay: float = 0.01):
+    calls = []
+
+    async def fetch():
+        calls.append(None)
+        number = len(calls)
+        await asyncio.sleep(delay)
+        return number
+
+    return fetch, calls
+
+
+def test_single_flight_joins_in_flight_fetch():
+    fetch, calls = _counting_fetch()
+    flight = poll.SingleFlight(fetch)
+
+    async def run():
+        return await asyncio.gather(*(flight() for _ in range(3)))
+
+    assert asyncio.run(run()) == [1, 1, 1]
+    assert len(calls) == 1
+    assert (flight.fetches, flight.coalesced) == (1, 2)
+
+
+def test_single_flight_window_and_invalidate():
+    fetch, calls = _counting_fetch(0)
+    clock = _Clock()
+    flight = poll.SingleFlight(fetch, window=2, clock=clock)
+
+    async def run():
+        results = [await flight(), await flight()]
+        clock.now += 2
+        results.append(await flight())
+        flight.invalidate()
+        results.append(await flight())
+        return results
+
+    assert asyncio.run(run()) == [1, 1, 2, 3]
+    assert (flight.fetches, flight.coalesced) == (3, 1)
+
+
+def test_single_flight_does_not_cache_failures():
+    attempts = []
+
+    async def fetch():
+        attempts.append(None)
+        if len(attempts) == 1:
+            raise ConnectionError("down")
+        return "ok"
+
+    flight = poll.SingleFlight(fetch)
+
+    async def run():
+        with pytest.raises(ConnectionError):
+            await flight()
+        return await flight()
+
+    assert asyncio.run(run()) == "ok"
+    assert len(attempts) == 2
+
+
+def test_single_flight_invalidate_detaches_in_flight_fetch():
+    fetch, calls = _counting_fetch(0.02)
+    flight = poll.SingleFlight(fetch)
+
+    async def run():
+        first = asyncio.ensure_future(flight())
+        await asyncio.sleep(0)
+        flight.invalidate()
+        second = await flight()
+        return await first, second, await flight()
+
+    assert asyncio.run(run()) == (1, 2, 2)
+    assert len(calls) == 2
+
+
+def test_single_flight_cancels_orphaned_fetches():
+    fetch, calls = _counting_fetch(0.05)
+    flight = poll.SingleFlight(fetch)
+
+    async def run():
+        caller = asyncio.ensure_future(flight())
+        await asyncio.sleep(0)
+        (orphan,) = flight._waiters
+        caller.cancel()
+        await asyncio.sleep(0)
+        # The shielded fetch outlives its cancelled caller for later joiners...
+        assert not orphan.done()
+        # ...until it is detached with nobody awaiting it.
+        flight.invalidate()
+        await asyncio.sleep(0)
+        assert orphan.cancelled()
+
+        caller = asyncio.ensure_future(flight())
+        await asyncio.sleep(0.01)
+        flight.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+        assert not flight._waiters
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_single_flight_retrieves_failures_nobody_awaits():
+    async def fetch():
+        await asyncio.sleep(0.01)
+        raise ConnectionError("down")
+
+    flight = poll.SingleFlight(fetch)
+    unhandled = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+        caller = asyncio.ensure_future(flight())
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0.02)
+        flight._task = None
+        gc.collect()
+
+    asyncio.run(run())
+    assert unhandled == []
+
+
+def test_response_cache_reports_only_changed_bodies():
+    cache = poll.ResponseCache()
+    first = {"zones": b'{"a": 1}', "batteries": None}
+
+    changed = cache.changed(first)
+    assert set(changed) == {"zones", "batteries"}
+    # Nothing is remembered until the caller commits the applied bodies.
+    assert cache.changed(first) == changed
+    cache.commit(changed)
+    snapshot = cache.snapshot()
+
+    assert cache.changed(first) == {}
+    assert cache.changed({"zones": b'{"a": 2}', "batteries": None}).keys() == {
+        "zones"
+    }
+    assert cache.snapshot() == snapshot
+
+    cache.invalidate("zones")
+    assert cache.changed(first).keys() == {"zones"}
+
+
+def test_partial_fetch_keeps_completed_requests_past_a_deadline():
+    hanging = poll.POLL_EX_DEV_STATUS
+    requests = [
+        poll.POLL_SUBSYSTEMS,
+        poll.POLL_ZONES,
+        poll.PollRequest(hanging.key, hanging.path, hanging.tier, deadline=0.1),
+    ]
+    panel = FakePanel(_routes(), latency={hanging.path: 1.0})
+
+    async def run():
+        await panel.start()
+        axpro = hikaxpro.HikAxPro(panel.host, "admin", "secret")
+        client = isapi.IsapiClient(
+            aiohttp.ClientSession(cookie_jar=aiohttp.DummyCookieJar()), axpro
+        )
+        try:
+            await client.async_login()
+            started = asyncio.get_running_loop().time()
+            result = await poll.async_fetch_partial(client, requests)
+            return result, asyncio.get_running_loop().time() - started
+        finally:
+            await client.async_close()
+            await panel.stop()
+
+    (payloads, failures), elapsed = asyncio.run(run())
+
+    assert sorted(payloads) == ["subsystems", "zones"]
+    assert list(failures) == ["ex_dev_status"]
+    assert isinstance(failures["ex_dev_status"], TimeoutError)
+    assert "deadline" in str(failures["ex_dev_status"])
+    assert elapsed < 0.5
@@ -0,0 +1,69 @@
+"""Tests for the warm-start snapshot serialization."""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load(name: str):
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+snapshot = _load("snapshot")
+
+
+def _snapshot():
+    return snapshot.WarmSnapshot(
+        mac="aa:bb:cc:dd:ee:ff",
+        device_info={"DeviceInfo": {"deviceName": "Home", "model": "DS-PWA96"}},
+        zones_conf={"List": [{"Zone": {"id": 0, "name": "Door"}}]},
+        relays_conf={"List": []},
+        payloads={"zones": b'{"ZoneList": []}', "batteries": None},
+        saved_at=1234.5,
+        host="192.0.2.10",
+    )
+
+
+def test_round_trips_through_json_storage():
+    original = _snapshot()
+
+    restored = snapshot.WarmSnapshot.from_dict(
+        json.loads(json.dumps(original.as_dict()))
+    )
+
+    assert restored == original
+
+
+def test_undecodable_payloads_are_dropped():
+    original = _snapshot()
+    original.payloads["ex_dev_status"] = b"\xff\xfe"
+
+    data = original.as_dict()
+
+    assert "ex_dev_status" not in data["payloads"]
+    assert data["payloads"]["zones"] == '{"ZoneList": []}'
+
+
+def test_unusable_data_is_ignored():
+    assert snapshot.WarmSnapshot.from_dict(None) is None
+    assert snapshot.WarmSnapshot.from_dict({"mac": "aa"}) is None
+    data = _snapshot().as_dict()
+    data["mac"] = ""
+    assert snapshot.WarmSnapshot.from_dict(data) is None
+    data = _snapshot().as_dict()
+    data["payloads"] = {"zones": 5}
+    assert snapshot.WarmSnapshot.from_dict(data) is None
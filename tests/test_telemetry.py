@@ -0,0 +1,81 @@
+"""Tests for the columnar telemetry store."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load(name: str):
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+telemetry = _load("telemetry")
+
+
+@dataclass
+class _Zone:
+    signal: int | None = None
+    charge_value: int | None = None
+    humidity: int | None = None
+
+
+@dataclass
+class _Siren:
+    signal: int | None = None
+    charge_value: int | None = None
+
+
+def _store():
+    store = telemetry.TelemetryStore()
+    zones = {1: _Zone(signal=120, charge_value=90), 2: _Zone(signal=40)}
+    sirens = {1: _Siren(signal=80, charge_value=15)}
+    store.update("zone", zones)
+    store.update("siren", sirens)
+    return store, zones, sirens
+
+
+def test_stats_skip_devices_without_the_metric():
+    store, _, _ = _store()
+
+    assert len(store) == 3
+    assert store.stats("signal") == telemetry.MetricStats(3, 40.0, 120.0, 80.0)
+    assert store.stats("charge_value").count == 2
+    # Only zones have the attribute, and none reports it.
+    assert store.stats("humidity") is None
+    assert store.value("siren", 1, "charge_value") == 15.0
+    assert store.value("zone", 2, "charge_value") is None
+
+
+def test_threshold_queries():
+    store, _, _ = _store()
+
+    assert store.below("signal", 100) == [("zone", 2), ("siren", 1)]
+    assert store.below("charge_value", 20) == [("siren", 1)]
+    assert store.above("charge_value", 50) == [("zone", 1)]
+
+
+def test_update_rereads_changed_devices_and_rebuilds_on_new_ones():
+    store, zones, _ = _store()
+
+    zones = {1: zones[1], 2: _Zone(signal=10)}
+    store.update("zone", zones, {2: frozenset({"signal"})})
+    assert store.value("zone", 2, "signal") == 10.0
+
+    zones[3] = _Zone(charge_value=5)
+    store.update("zone", zones, {3: None})
+    assert len(store) == 4
+    assert store.below("charge_value", 20) == [("zone", 3), ("siren", 1)]
@@ -0,0 +1,99 @@
+"""Tests for the packed zone flag bitsets."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from enum import Enum
+import importlib.util
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+COMPONENT = ROOT / "custom_components" / "hikvision_axpro"
+
+
+def _load(name: str):
+    qualified = f"hikvision_axpro.{name}"
+    if qualified in sys.modules:
+        return sys.modules[qualified]
+    spec = importlib.util.spec_from_file_location(qualified, COMPONENT / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[qualified] = module
+    assert spec.loader is not None
+    spec.loader.exec_module(module)
+    return module
+
+
+zone_flags = _load("zone_flags")
+
+
+class _Status(Enum):
+    NORMAL = "normal"
+    TRIGGER = "trigger"
+
+
+@dataclass
+class _Zone:
+    id: int
+    status: _Status | None = _Status.NORMAL
+    tamper_evident: bool | None = False
+    shielded: bool | None = False
+    bypassed: bool | None = False
+    armed: bool | None = False
+    is_arming: bool | None = False
+    alarm: bool | None = False
+    stay_away: bool | None = False
+    magnet_open_status: bool | None = None
+    is_via_repeater: bool | None = False
+    abnormal_or_not: bool | None = False
+    is_masking: bool | None = None
+
+
+def _zones(*zones: _Zone) -> dict[int, _Zone]:
+    return {zone.id: zone for zone in zones}
+
+
+def test_masks_counts_and_unknown():
+    flags = zone_flags.ZoneFlags()
+    flags.update(
+        _zones(
+            _Zone(3, magnet_open_status=True),
+            _Zone(1, magnet_open_status=False, bypassed=True),
+            _Zone(7, status=_Status.TRIGGER),
+        )
+    )
+
+    assert len(flags) == 3
+    assert flags.zone_ids(flags.mask(zone_flags.FLAG_OPEN)) == [3]
+    assert flags.zone_ids(flags.mask(zone_flags.FLAG_TRIGGERED)) == [7]
+    assert flags.count(zone_flags.FLAG_BYPASSED) == 1
+    assert flags.zone_ids(flags.unknown(zone_flags.FLAG_OPEN)) == [7]
+
+
+def test_update_reads_only_changed_zones_and_returns_flips():
+    flags = zone_flags.ZoneFlags()
+    zones = _zones(_Zone(1), _Zone(2))
+    flags.update(zones)
+
+    zones[2].alarm = True
+    zones[1].bypassed = True
+    flipped = flags.update(zones, {2: frozenset({"alarm"})})
+
+    assert {name: flags.zone_ids(bits) for name, bits in flipped.items()} == {
+        zone_flags.FLAG_ALARM: [2]
+    }
+    # Zone 1 was not in the change set, so it was not read.
+    assert flags.count(zone_flags.FLAG_BYPASSED) == 0
+    assert flags.refresh(zones, [1]) == {zone_flags.FLAG_BYPASSED: 0b01}
+
+
+def test_added_and_removed_zones_reindex():
+    flags = zone_flags.ZoneFlags()
+    flags.update(_zones(_Zone(1, alarm=True), _Zone(5, alarm=True)))
+
+    flipped = flags.update(
+        _zones(_Zone(2, alarm=True), _Zone(5, alarm=True)), {1: None, 2: None}
+    )
+
+    assert flags.zone_ids(flags.mask(zone_flags.FLAG_ALARM)) == [2, 5]
+    assert flags.zone_ids(flipped[zone_flags.FLAG_ALARM]) == [2]